@@ -20,6 +20,10 @@ Example:
     >>> runner = PyRateRunner()
     >>> runner.execute_file("tests/features/login.feature")
 
+The runners and the evidence generator are imported on first access, so
+``import pyrate`` (and ``pyrate --version``) does not load Playwright,
+requests, pandas or python-docx.
+
 Documentation:
     https://github.com/rockefeller2021/PyRateFrameworkTest
 """
@@ -30,9 +34,9 @@ __license__ = "MIT"
 __title__ = "PyRate Framework"
 __description__ = "Automation testing framework for API and UI inspired by Karate"
 
-from .core import PyRateRunner
+import importlib
+
 from .assertions import Assertions
-from .evidence import EvidenceGenerator
 from .exceptions import (
     PyRateError,
     StepExecutionError,
@@ -44,6 +48,7 @@ from .exceptions import (
 __all__ = [
     # Core components
     "PyRateRunner",
+    "AsyncPyRateRunner",
     "Assertions",
     "EvidenceGenerator",
     
@@ -59,3 +64,23 @@ __all__ = [
     "__author__",
     "__license__",
 ]
+
+# Public names loaded on first access (PEP 562): name -> submodule
+_LAZY_IMPORTS = {
+    "PyRateRunner": ".core",
+    "AsyncPyRateRunner": ".async_runner",
+    "EvidenceGenerator": ".evidence",
+}
+
+
+def __getattr__(name):
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
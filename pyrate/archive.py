@@ -0,0 +1,284 @@
+"""
+Evidence archives for PyRate Framework.
+
+In archive mode (``evidence_archive: true``) the TXT and DOCX evidence of a
+run is written into a single ZIP file instead of one file per scenario and
+iteration. Entries are appended as scenarios finish; when the run ends an
+``index.json`` entry lists every file with its scenario, iteration and
+status. Entry names are made unique, so nothing is overwritten.
+
+A ZIP only becomes readable once its central directory is written at the
+end, so each entry is also recorded in an ``<archive>.index.jsonl`` sidecar
+as soon as it is added. If a run is killed before the archive is closed,
+:func:`read_index` and :func:`extract_evidence` rebuild it from its entries
+and the sidecar (see :func:`repair_archive`).
+
+Parallel runs (``-n``) write one archive per worker, which
+:func:`merge_archives` combines into the run's archive.
+
+Example:
+    >>> archive = EvidenceArchive("evidence/evidence_2026-01-01_10-00-00.zip")
+    >>> archive.add("API_Login_Iter1.txt", b"...", scenario="Login", iteration=1, status="PASS")
+    >>> archive.close()
+    >>> extract_evidence(archive.path, "out", status="FAIL")
+    []
+"""
+
+import json
+import os
+import struct
+import threading
+import zipfile
+import zlib
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+INDEX_NAME = "index.json"
+
+# Sidecar index of an archive that is still being written
+SIDECAR_SUFFIX = ".index.jsonl"
+
+# Already compressed formats are stored as they are
+_STORED_EXTENSIONS = (".docx", ".png", ".jpg", ".jpeg", ".zip")
+
+
+class EvidenceArchive:
+    """
+    Append-only ZIP of evidence files with a JSON index.
+
+    Entries can be added from several threads.
+
+    Attributes:
+        path: Archive file
+    """
+
+    def __init__(self, path: str):
+        """
+        Initialize the archive (the file is created on the first entry).
+
+        Args:
+            path: Archive file path
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._zip: Optional[zipfile.ZipFile] = None
+        self._index: List[Dict[str, Any]] = []
+        self._names = {INDEX_NAME}
+        self._closed = False
+        self._sidecar = None
+
+    @classmethod
+    def for_run(cls, folder: str) -> 'EvidenceArchive':
+        """
+        Archive named after the current time, in a folder.
+
+        Args:
+            folder: Evidence folder
+
+        Returns:
+            EvidenceArchive for ``<folder>/evidence_<timestamp>.zip``
+        """
+        base = os.path.join(folder, f"evidence_{datetime.now().strftime('%Y-%m-%d_%H-%M-%S')}")
+        path = f"{base}.zip"
+        counter = 1
+        while os.path.exists(path):
+            path = f"{base}-{counter}.zip"
+            counter += 1
+        return cls(path)
+
+    def add(self, name: str, data: bytes, **metadata: Any) -> str:
+        """
+        Append a file.
+
+        Args:
+            name: File name; a suffix is added if the name is already used
+            data: File content
+            **metadata: Index fields (scenario, iteration, status...)
+
+        Returns:
+            Name of the entry in the archive
+
+        Raises:
+            ValueError: If the archive was already closed
+        """
+        with self._lock:
+            if self._closed:
+                raise ValueError(f"El archivo de evidencias ya está cerrado: {self.path}")
+            if self._zip is None:
+                os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+                self._zip = zipfile.ZipFile(self.path, "w", zipfile.ZIP_DEFLATED)
+                self._sidecar = open(self.path + SIDECAR_SUFFIX, "w", encoding="utf-8")
+            entry = self._unique_name(name)
+            self._names.add(entry)
+            self._zip.writestr(entry, data, compress_type=_compression(entry))
+            self._zip.fp.flush()
+            item = {"file": entry, **metadata}
+            self._index.append(item)
+            # The entry is on disk before its index line, so a recovered index never lists missing files
+            self._sidecar.write(json.dumps(item, ensure_ascii=False, default=str) + "\n")
+            self._sidecar.flush()
+        return entry
+
+    def close(self) -> None:
+        """Write the index and finish the archive (nothing is written if it is empty)."""
+        with self._lock:
+            self._closed = True
+            if self._zip is None:
+                return
+            index = json.dumps(self._index, ensure_ascii=False, indent=2, default=str)
+            self._zip.writestr(INDEX_NAME, index)
+            self._zip.close()
+            self._zip = None
+            self._sidecar.close()
+            os.remove(self.path + SIDECAR_SUFFIX)
+
+    def _unique_name(self, name: str) -> str:
+        if name not in self._names:
+            return name
+        stem, extension = os.path.splitext(name)
+        counter = 2
+        while f"{stem}-{counter}{extension}" in self._names:
+            counter += 1
+        return f"{stem}-{counter}{extension}"
+
+
+def _compression(name: str) -> int:
+    return zipfile.ZIP_STORED if name.lower().endswith(_STORED_EXTENSIONS) else zipfile.ZIP_DEFLATED
+
+
+def read_index(path: str) -> List[Dict[str, Any]]:
+    """
+    Read the index of an evidence archive, repairing it first if it was not closed.
+
+    Args:
+        path: Archive file
+
+    Returns:
+        One dictionary per file: ``file``, ``scenario``, ``iteration``, ``status``...
+    """
+    if os.path.exists(path + SIDECAR_SUFFIX):
+        return repair_archive(path)
+    with zipfile.ZipFile(path) as archive:
+        return json.loads(archive.read(INDEX_NAME).decode("utf-8"))
+
+
+def repair_archive(path: str) -> List[Dict[str, Any]]:
+    """
+    Rebuild an archive whose run ended before it was closed.
+
+    Complete entries are recovered from the ZIP's local headers and indexed
+    with the lines of the sidecar index; an entry cut off by the interruption
+    is dropped. The archive is rewritten with its ``index.json`` and the
+    sidecar is removed.
+
+    Args:
+        path: Archive file
+
+    Returns:
+        Index of the recovered files
+    """
+    entries = dict(_scan_entries(path)) if os.path.exists(path) else {}
+    index = []
+    sidecar = path + SIDECAR_SUFFIX
+    if os.path.exists(sidecar):
+        with open(sidecar, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    item = json.loads(line)
+                except json.JSONDecodeError:
+                    break  # Last line cut off by the interruption
+                if item.get("file") in entries:
+                    index.append(item)
+
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with zipfile.ZipFile(tmp_path, "w", zipfile.ZIP_DEFLATED) as archive:
+        for item in index:
+            archive.writestr(item["file"], entries[item["file"]], compress_type=_compression(item["file"]))
+        archive.writestr(INDEX_NAME, json.dumps(index, ensure_ascii=False, indent=2, default=str))
+    os.replace(tmp_path, path)
+    if os.path.exists(sidecar):
+        os.remove(sidecar)
+    return index
+
+
+def _scan_entries(path: str) -> List[Tuple[str, bytes]]:
+    """Content of the complete entries of a ZIP, read from local headers (no central directory needed)."""
+    entries = []
+    with open(path, "rb") as f:
+        while True:
+            header = f.read(30)
+            if len(header) < 30 or header[:4] != b"PK\x03\x04":
+                break
+            flags, method, crc, size = struct.unpack("<xxxxxxHHxxxxII", header[:22])
+            name_length, extra_length = struct.unpack("<HH", header[26:30])
+            name = f.read(name_length).decode("utf-8" if flags & 0x800 else "cp437")
+            f.seek(extra_length, os.SEEK_CUR)
+            data = f.read(size)
+            if len(data) < size or method not in (zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED):
+                break
+            try:
+                if method == zipfile.ZIP_DEFLATED:
+                    data = zlib.decompress(data, -15)
+            except zlib.error:
+                break
+            if zlib.crc32(data) != crc:
+                break  # Header not patched yet: the entry was being written
+            entries.append((name, data))
+    return entries
+
+
+def merge_archives(paths: Sequence[str], path: str) -> Optional[str]:
+    """
+    Combine evidence archives (e.g. one per parallel worker) into one.
+
+    Entries keep their index metadata; repeated names get a suffix. The
+    source archives are deleted once merged.
+
+    Args:
+        paths: Archives to merge
+        path: Merged archive file
+
+    Returns:
+        Path of the merged archive, or None if there was nothing to merge
+    """
+    merged = EvidenceArchive(path)
+    for source in paths:
+        index = read_index(source)
+        with zipfile.ZipFile(source) as archive:
+            for item in index:
+                metadata = {k: v for k, v in item.items() if k != "file"}
+                merged.add(item["file"], archive.read(item["file"]), **metadata)
+    merged.close()
+    for source in paths:
+        os.remove(source)
+    return path if os.path.exists(path) else None
+
+
+def extract_evidence(
+    path: str,
+    output_folder: str,
+    scenario: Optional[str] = None,
+    iteration: Optional[int] = None,
+    status: Optional[str] = None
+) -> List[str]:
+    """
+    Extract files of an evidence archive, optionally filtered through its index.
+
+    Args:
+        path: Archive file
+        output_folder: Destination folder
+        scenario: Only files of this scenario
+        iteration: Only files of this data iteration (1-based)
+        status: Only files with this status ("PASS" or "FAIL")
+
+    Returns:
+        Paths of the extracted files
+    """
+    selected = [
+        item["file"] for item in read_index(path)
+        if (scenario is None or item.get("scenario") == scenario)
+        and (iteration is None or item.get("iteration") == iteration)
+        and (status is None or item.get("status") == status.upper())
+    ]
+    with zipfile.ZipFile(path) as archive:
+        return [archive.extract(name, output_folder) for name in selected]
@@ -0,0 +1,146 @@
+"""
+Content-addressed artifact store for PyRate Framework.
+
+In bounded-memory mode (``artifact_store: true``) screenshots and large
+response payloads are written to disk as soon as a step finishes, and the
+step record keeps only the file path. Files are named after the SHA-256 of
+their content, so identical screenshots are stored once and concurrent
+writers (threads or worker processes) never conflict.
+
+Report and evidence generators read step data through :func:`screenshot_bytes`,
+:func:`report_screenshot` and :func:`response_data`, which work for both
+in-memory and spilled records.
+
+Example:
+    >>> store = ArtifactStore("reports/artifacts")
+    >>> ref = store.put(png_bytes, ".png")
+    >>> read_artifact(ref) == png_bytes
+    True
+"""
+
+import base64
+import hashlib
+import os
+import threading
+from typing import Any, Dict, Optional
+
+_EXTENSIONS = {"image/png": ".png", "image/jpeg": ".jpg"}
+
+
+class ArtifactStore:
+    """
+    Write-once files named by content hash.
+
+    Attributes:
+        folder: Root folder; files live in ``<folder>/<2 hex chars>/<sha256><ext>``
+    """
+
+    def __init__(self, folder: str):
+        """
+        Initialize the store.
+
+        Args:
+            folder: Root folder (created on first write)
+        """
+        self.folder = folder
+
+    def put(self, data: bytes, extension: str = "") -> str:
+        """
+        Store bytes, unless identical content is already stored.
+
+        Args:
+            data: Content to store
+            extension: File extension including the dot (e.g. ".png")
+
+        Returns:
+            Path of the stored file, used as the artifact reference
+        """
+        digest = hashlib.sha256(data).hexdigest()
+        path = os.path.join(self.folder, digest[:2], digest + extension)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}-{threading.get_ident()}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        return path
+
+    def put_text(self, text: str, extension: str = ".txt") -> str:
+        """Store text as UTF-8 (see :meth:`put`)."""
+        return self.put(text.encode("utf-8"), extension)
+
+    def spill(self, step_record: Dict[str, Any], inline_limit: int) -> Dict[str, Any]:
+        """
+        Move the binary and large data of a step record into the store.
+
+        The screenshot becomes ``screenshot_ref`` and a ``response_data``
+        longer than ``inline_limit`` characters becomes ``response_ref``,
+        keeping only its first ``inline_limit`` characters inline.
+
+        Args:
+            step_record: Record built by the runner (modified in place)
+            inline_limit: Maximum response characters kept in memory
+
+        Returns:
+            The same record
+        """
+        image = step_record.get('screenshot_bytes')
+        if image:
+            extension = _EXTENSIONS.get(step_record.get('screenshot_type'), ".png")
+            step_record['screenshot_ref'] = self.put(image, extension)
+            step_record['screenshot_bytes'] = None
+            step_record['screenshot'] = None
+
+        data = step_record.get('response_data')
+        if isinstance(data, str) and len(data) > inline_limit:
+            step_record['response_ref'] = self.put_text(data)
+            step_record['response_data'] = data[:inline_limit]
+        return step_record
+
+
+def read_artifact(ref: str) -> bytes:
+    """
+    Read a stored artifact.
+
+    Args:
+        ref: Reference returned by :meth:`ArtifactStore.put`
+
+    Returns:
+        The stored bytes
+    """
+    with open(ref, "rb") as f:
+        return f.read()
+
+
+def screenshot_bytes(step: Dict[str, Any]) -> Optional[bytes]:
+    """Screenshot of a step record, in memory or spilled to the store."""
+    if step.get('screenshot_bytes'):
+        return step['screenshot_bytes']
+    if step.get('screenshot_ref'):
+        return read_artifact(step['screenshot_ref'])
+    return None
+
+
+def report_screenshot(step: Dict[str, Any]) -> Optional[bytes]:
+    """
+    Screenshot shown in the HTML report for a step.
+
+    Only failing steps carry one, as in in-memory mode.
+
+    Returns:
+        Image bytes, or None
+    """
+    if step.get('status') != 'FAIL' and not step.get('screenshot'):
+        return None
+    image = screenshot_bytes(step)
+    if image is None and step.get('screenshot'):
+        # Records read back from a checkpoint only keep the base64 copy
+        image = base64.b64decode(step['screenshot'])
+    return image
+
+
+def response_data(step: Dict[str, Any]) -> Any:
+    """Full response data of a step record, in memory or spilled to the store."""
+    if step.get('response_ref'):
+        return read_artifact(step['response_ref']).decode('utf-8')
+    return step.get('response_data')
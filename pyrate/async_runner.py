@@ -0,0 +1,272 @@
+"""
+Asyncio runner for API features.
+
+``AsyncPyRateRunner`` executes the same Gherkin API steps as
+:class:`~pyrate.core.PyRateRunner` (``url``, ``path``, ``header``,
+``request``, ``method``, ``status``, ``match``, ``def``, ``print``,
+``call read()``) but runs every data iteration as a task on one asyncio
+event loop, sending requests with ``httpx.AsyncClient``. Thousands of
+iterations can be in flight on a single thread; ``concurrency`` bounds how
+many run at once. Reports and evidence are the same as the sync runner's.
+
+UI steps are not supported by this runner.
+
+Requires the optional ``httpx`` dependency::
+
+    pip install pyrate-framework[async]
+
+Example:
+    >>> from pyrate import AsyncPyRateRunner
+    >>> runner = AsyncPyRateRunner(concurrency=500)
+    >>> runner.execute_file("tests/features/contracts.feature")
+"""
+
+import asyncio
+import contextvars
+import json
+import time
+from collections import deque
+from http.cookiejar import DefaultCookiePolicy
+from typing import Any, Dict, List
+
+from .core import PyRateRunner
+from .exceptions import ApiConnectionError, PyRateError, StepExecutionError
+from .logger import log_error, log_info, log_step
+from .plan import StepPlan, compile_steps
+from .template import compile_template
+
+
+def _import_httpx():
+    try:
+        import httpx
+    except ImportError:
+        raise PyRateError(
+            "AsyncPyRateRunner requiere 'httpx'. Instálalo con: pip install pyrate-framework[async]"
+        )
+    return httpx
+
+
+class AsyncPyRateRunner(PyRateRunner):
+    """
+    Runner executing API scenarios concurrently on an asyncio event loop.
+
+    Each data iteration runs as its own task with an isolated context
+    (variables and headers are not shared between iterations). Results are
+    appended to ``execution_log`` in dataset order.
+
+    Attributes:
+        concurrency: Maximum number of iterations running at the same time
+    """
+
+    # Same commands as the sync runner, with I/O-bound steps overridden by coroutines
+    steps = PyRateRunner.steps.copy()
+
+    def __init__(self, tags=None, config=None, concurrency=100):
+        """
+        Initialize the async runner.
+
+        Args:
+            tags: Optional tag filter for scenario execution (e.g., "@smoke")
+            config: Optional PyRateConfig instance. If None, uses defaults.
+            concurrency: Maximum iterations in flight at once
+        """
+        super().__init__(tags=tags, config=config)
+        self.concurrency = max(1, concurrency)
+        self._clients: Dict[bool, Any] = {}
+
+    def execute_file(self, file_path, report=None):
+        """
+        Execute a feature file on a new event loop.
+
+        Args:
+            file_path: Path to the .feature file
+            report: Generate the HTML report afterwards (by default only outside a run)
+        """
+        asyncio.run(self.execute_file_async(file_path, report=report))
+
+    async def execute_file_async(self, file_path, report=None):
+        """
+        Execute every scenario and data iteration of a feature file concurrently.
+
+        Args:
+            file_path: Path to the .feature file
+            report: Generate the HTML report from the accumulated log afterwards
+                (by default only outside a run)
+        """
+        if report is None:
+            report = not self._run_active
+        if report:
+            self._open_results()
+        try:
+            _import_httpx()
+            plan, dataset = self._prepare_feature(file_path)
+            if plan is None: return
+
+            if any(step.verb == 'driver' for sc in plan.scenarios for step in sc.steps):
+                raise StepExecutionError(file_path, "AsyncPyRateRunner solo ejecuta features API")
+
+            semaphore = asyncio.Semaphore(self.concurrency)
+
+            async def run(i, row):
+                async with semaphore:
+                    return await self._run_iteration_async(plan, i, row)
+
+            log_info(f"⚡ Ejecución async: máx. {self.concurrency} iteraciones simultáneas")
+            # Tasks are awaited in dataset order, so the log stays deterministic, and
+            # rows are only read (and tasks created) a window ahead of the oldest one
+            pending = deque()
+            try:
+                for i, row in dataset:
+                    pending.append(asyncio.ensure_future(run(i, row)))
+                    if len(pending) >= self.concurrency * 2:
+                        self.execution_log.extend(await pending.popleft())
+                while pending:
+                    self.execution_log.extend(await pending.popleft())
+            finally:
+                for task in pending:
+                    task.cancel()
+
+        except Exception as e:
+            self.is_success = False
+            log_error("SISTEMA", str(e))
+        finally:
+            await self._close_clients()
+            if report and self.execution_log:
+                self.flush_evidence()
+                self._report()
+            if self._checkpoint is not None:
+                self._checkpoint.append(self.execution_log)
+            if not self._run_active:
+                self._close_evidence()
+
+    async def _run_iteration_async(self, plan, i, row) -> List[Dict[str, Any]]:
+        """Run every scenario of a plan for one data row inside the current task."""
+        log = []
+        for sc in plan.scenarios:
+            if self.tags_filter:
+                if self.tags_filter.replace('@', '').strip() not in sc.tags: continue
+
+            log_info(f"🎬 Ejecutando Escenario: {sc.name}")
+
+            # Each task has its own copy of the ContextVar, so this does not leak
+            self.context = self._new_scenario_context(row, isolated=True, scenario=sc)
+
+            scenario_log = await self._execute_lines_async(sc.steps, iteration_idx=i + 1, stream=True)
+            log.extend(scenario_log)
+            # Queuing evidence waits while the pipeline is full; do it off the event loop.
+            # The copied context keeps this task's scenario context visible to the thread.
+            await asyncio.get_running_loop().run_in_executor(
+                None, contextvars.copy_context().run, self._write_scenario_evidence, sc, scenario_log, i
+            )
+            if self._results is not None:
+                self._results.scenario(scenario_log)
+        return log
+
+    async def _execute_lines_async(self, lines, iteration_idx=1, stream=False):
+        """Async counterpart of ``_execute_lines`` for API steps."""
+        if lines and not isinstance(lines[0], StepPlan):
+            lines = compile_steps(lines)
+
+        scenario_log = []
+        for step in lines:
+            template = step.template or compile_template(step.text)
+            processed_line = template.render(self.context['vars'])
+            log_step(processed_line)
+
+            step_record = self._new_step_record(step, processed_line, iteration_idx)
+            started = time.perf_counter()
+            try:
+                await self._process_step_async(processed_line, step_record, step.verb)
+            except Exception as e:
+                step_record["status"] = "FAIL"
+                step_record["error"] = str(e)
+                self.is_success = False
+                scenario_log.append(self._finish_step(step_record, started, stream))
+                log_error("EJECUCIÓN", f"Paso fallido: {str(e)}")
+                break
+
+            scenario_log.append(self._finish_step(step_record, started, stream))
+        return scenario_log
+
+    async def _process_step_async(self, line, step_record, verb=None):
+        handler, match = self.steps.resolve(line, verb if verb and '#(' not in verb else None)
+        if handler is None:
+            raise StepExecutionError(line, "Comando desconocido")
+        result = handler(self, match, step_record)
+        if asyncio.iscoroutine(result):
+            await result
+
+    async def _client(self, verify):
+        client = self._clients.get(verify)
+        if client is None:
+            httpx = _import_httpx()
+            client = httpx.AsyncClient(
+                verify=verify,
+                timeout=self.config.api_timeout,
+                limits=httpx.Limits(
+                    max_connections=self.concurrency,
+                    max_keepalive_connections=self.config.api_pool_size
+                )
+            )
+            # Stateless like the sync SessionPool: the client is shared by every
+            # iteration, so cookies must never be carried between requests
+            client.cookies.jar.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+            self._clients[verify] = client
+        return client
+
+    async def _close_clients(self):
+        clients = list(self._clients.values())
+        self._clients.clear()
+        for client in clients:
+            await client.aclose()
+
+    # ========================================
+    # ASYNC STEP OVERRIDES
+    # ========================================
+    @steps.step('call', r'\*?\s*call read\((.*)\)', prepend=True)
+    async def _step_call_read_async(self, match, step_record):
+        sub_plan = self._load_called_feature(match)
+
+        log_info("🔄 Llamando sub-feature...")
+        for sub_sc in sub_plan.scenarios:
+            await self._execute_lines_async(sub_sc.steps, iteration_idx=step_record.get('iteration', 1))
+        log_info("🔙 Retorno de llamada.")
+        step_record['response_data'] = "Sub-feature ejecutado correctamente."
+
+    @steps.step('method', r'(?:When|And)\s+method\s+(.*)', prepend=True)
+    async def _step_method_async(self, match, step_record):
+        method = match.group(1).strip().upper()
+        self.context['last_method'] = method
+        auth = self.context['auth']
+        if auth is not None:
+            from requests.auth import HTTPBasicAuth
+            if isinstance(auth, HTTPBasicAuth):
+                auth = (auth.username, auth.password)
+        try:
+            client = await self._client(bool(self.context['verify_ssl']))
+            res = await client.request(
+                method,
+                self.context['base_url'],
+                headers=dict(self.context['headers']),
+                json=self.context.get('request_body'),
+                auth=auth
+            )
+            self.context['request_body'] = None
+            self.context['response'] = res
+            try:
+                j = res.json()
+                self.context['response_json'] = j
+                step_record['response_data'] = json.dumps(j, indent=2, ensure_ascii=False)
+            except ValueError:
+                self.context['response_json'] = {}
+                step_record['response_data'] = res.text[:500]
+        except Exception as e:
+            raise ApiConnectionError(str(e))
+
+    @steps.step('wait', r'(?:Given|And)\s+wait (\d+)', prepend=True)
+    async def _step_wait_async(self, match, step_record):
+        await asyncio.sleep(int(match.group(1)))
+
+    @steps.step('driver', r'Given driver (.*)', prepend=True)
+    def _step_driver_unsupported(self, match, step_record):
+        raise StepExecutionError(match.string, "AsyncPyRateRunner no soporta pasos UI")
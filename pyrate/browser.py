@@ -0,0 +1,129 @@
+"""
+Browser context pooling for PyRate Framework.
+
+Every UI scenario runs in its own Playwright browser context (cookies,
+storage and cache are never shared between scenarios). Creating a context
+and its first page is done ahead of time: the pool keeps a few warm
+contexts ready, hands one out per ``Given driver`` step and, once the
+scenario finishes, closes the used context and tops the warm set up again.
+
+Playwright's sync API is bound to the thread that started it, so warming
+happens on the runner's thread, nothing runs in the background: once when
+the browser is launched and at each release, right after the used context
+is closed, so a context is ready when the next scenario starts.
+
+Example:
+    >>> pool = BrowserContextPool(browser, size=2, max_contexts=8)
+    >>> page = pool.acquire()
+    >>> page.goto("https://example.com")
+    >>> pool.release(page)
+    >>> pool.close()
+"""
+
+from typing import Any, Dict, List, Optional
+
+from .exceptions import PyRateError
+from .logger import log_warning
+
+
+class BrowserContextPool:
+    """
+    Warm browser contexts, one per scenario, disposed after use.
+
+    Attributes:
+        size: Number of idle contexts kept ready (0 disables pre-warming)
+        max_contexts: Maximum live contexts (idle + in use)
+    """
+
+    def __init__(
+        self,
+        browser: Any,
+        size: int = 1,
+        max_contexts: int = 8,
+        context_options: Optional[Dict[str, Any]] = None
+    ):
+        """
+        Initialize the pool.
+
+        Args:
+            browser: Launched Playwright browser
+            size: Number of idle contexts kept ready
+            max_contexts: Maximum live contexts (idle + in use)
+            context_options: Keyword arguments for ``browser.new_context``
+        """
+        self.browser = browser
+        self.size = max(0, size)
+        self.max_contexts = max(1, max_contexts)
+        self.context_options = context_options or {}
+        self._idle: List[Any] = []  # Warm pages whose context was never used
+        self._in_use: Dict[int, Any] = {}  # id(page) -> page
+
+    @property
+    def live(self) -> int:
+        """Number of contexts currently open (idle + in use)."""
+        return len(self._idle) + len(self._in_use)
+
+    def prewarm(self) -> None:
+        """Create idle contexts until ``size`` are ready or the cap is reached."""
+        while len(self._idle) < self.size and self.live < self.max_contexts:
+            self._idle.append(self._new_page())
+
+    def acquire(self) -> Any:
+        """
+        Hand out a page in a fresh context.
+
+        Returns:
+            Playwright page owned by the caller until :meth:`release`
+
+        Raises:
+            PyRateError: If ``max_contexts`` contexts are already in use
+        """
+        if self._idle:
+            page = self._idle.pop(0)
+        elif self.live < self.max_contexts:
+            page = self._new_page()
+        else:
+            raise PyRateError(
+                f"Límite de contextos de navegador alcanzado ({self.max_contexts}): "
+                "libera los escenarios anteriores"
+            )
+        self._in_use[id(page)] = page
+        return page
+
+    def release(self, page: Any) -> None:
+        """
+        Dispose the context of a page handed out by :meth:`acquire`.
+
+        The context is closed (never reused), so the next scenario cannot
+        see its cookies or storage; a new warm context replaces it.
+
+        Args:
+            page: Page returned by :meth:`acquire`
+        """
+        if self._in_use.pop(id(page), None) is None:
+            return
+        self._dispose(page)
+        self.prewarm()
+
+    def close(self) -> None:
+        """Close every idle and in-use context."""
+        pages = self._idle + list(self._in_use.values())
+        self._idle = []
+        self._in_use = {}
+        for page in pages:
+            self._dispose(page)
+
+    def _new_page(self) -> Any:
+        context = self.browser.new_context(**self.context_options)
+        try:
+            return context.new_page()
+        except Exception:
+            context.close()
+            raise
+
+    @staticmethod
+    def _dispose(page: Any) -> None:
+        try:
+            page.context.close()
+        except Exception as e:
+            log_warning(f"No se pudo cerrar el contexto del navegador: {e}")
@@ -1,9 +1,10 @@
 import argparse
+import dataclasses
 import os
 import sys
-from .core import PyRateRunner
-from .logger import log_success, log_info
+from .logger import log_success, log_info, log_error
 from .config_loader import ConfigLoader
+from .archive import extract_evidence
 
 
 def init_project():
@@ -91,6 +92,32 @@ def main():
         help="Archivo de configuración YAML personalizado",
         default=None
     )
+    run_parser.add_argument(
+        "-n", "--workers",
+        help="Procesos en paralelo para ejecutar carpetas (por defecto: 1)",
+        type=int,
+        default=1
+    )
+    run_parser.add_argument(
+        "--iteration-workers",
+        help="Hilos para iteraciones data-driven de features API (por defecto: configuración)",
+        type=int,
+        default=None
+    )
+    run_parser.add_argument("--rows", help="Filas de datos a ejecutar, inicio:fin (desde 1, ej: 1000:2000)", default=None)
+    run_parser.add_argument("--row-filter", help="Expresión Python sobre las columnas (ej: \"pais == 'AR'\")", default=None)
+    run_parser.add_argument("--sample", help="Ejecutar N filas al azar", type=int, default=None)
+    run_parser.add_argument("--seed", help="Semilla de --sample (mismas filas en cada ejecución)", type=int, default=None)
+    run_parser.add_argument("--row-shard", help="Ejecutar la parte k de n de las filas, k/n (ej: 3/8)", default=None)
+
+    evidence_parser = subparsers.add_parser("evidence", help="Gestionar archivos de evidencias")
+    evidence_subparsers = evidence_parser.add_subparsers(dest="evidence_command")
+    extract_parser = evidence_subparsers.add_parser("extract", help="Extraer evidencias de un archivo .zip")
+    extract_parser.add_argument("archive", help="Archivo evidence_<fecha>.zip")
+    extract_parser.add_argument("-o", "--output", help="Carpeta destino (por defecto: actual)", default=".")
+    extract_parser.add_argument("--scenario", help="Solo este escenario", default=None)
+    extract_parser.add_argument("--iteration", help="Solo esta iteración (desde 1)", type=int, default=None)
+    extract_parser.add_argument("--status", help="Solo PASS o FAIL", choices=["PASS", "FAIL", "pass", "fail"], default=None)
 
     args = parser.parse_args()
 
@@ -101,7 +128,24 @@ def main():
 
     if args.command == "init":
         init_project()
+    elif args.command == "evidence":
+        if args.evidence_command != "extract":
+            evidence_parser.print_help()
+            sys.exit(0)
+        try:
+            files = extract_evidence(args.archive, args.output, scenario=args.scenario,
+                                     iteration=args.iteration, status=args.status)
+        except Exception as e:
+            log_error("EVIDENCIA", f"No se pudo leer {args.archive}: {e}")
+            sys.exit(1)
+        for path in files:
+            log_info(f"  ✓ {path}")
+        log_success(f"{len(files)} evidencias extraídas en {args.output}")
     elif args.command == "run":
+        # The runner (and its dependencies) is only imported to run tests
+        from .core import PyRateRunner
+        from .parallel import collect_features, run_parallel
+
         # Load configurations (custom file or defaults)
         try:
             config = ConfigLoader.load(args.config)
@@ -110,18 +154,30 @@ def main():
             log_info(f"⚠️  Usando configuración por defecto: {e}")
             config = ConfigLoader.load()
 
-        # Create runner with configuration
-        runner = PyRateRunner(tags=args.tags, config=config)
-
-        # Si es un archivo, lo corre directo
-        if os.path.isfile(args.file):
-            runner.execute_file(args.file)
-        # Si eas carpeta, busca todos los .feature
-        elif os.path.isdir(args.file):
-            for root, dirs, files in os.walk(args.file):
-                for file in files:
-                    if file.endswith(".feature"):
-                        runner.execute_file(os.path.join(root, file))
+        if args.iteration_workers is not None:
+            config.iteration_workers = max(1, args.iteration_workers)
+
+        # Row selection flags override the data: section of the config
+        overrides = {
+            "data_rows": args.rows, "data_filter": args.row_filter, "data_sample": args.sample,
+            "data_seed": args.seed, "data_shard": args.row_shard
+        }
+        try:
+            config = dataclasses.replace(config, **{k: v for k, v in overrides.items() if v is not None})
+        except ValueError as e:
+            log_error("CONFIG", str(e))
+            sys.exit(2)
+
+        # Si es carpeta con varios procesos, reparte los .feature entre ellos
+        # (cada worker crea su propio runner)
+        if os.path.isdir(args.file) and args.workers > 1:
+            run_parallel(collect_features(args.file), args.workers, tags=args.tags, config=config)
+        # Si es un archivo o una carpeta, un solo runner (y navegador) para todos los .feature
+        elif os.path.isfile(args.file) or os.path.isdir(args.file):
+            features = [args.file] if os.path.isfile(args.file) else collect_features(args.file)
+            with PyRateRunner(tags=args.tags, config=config) as runner:
+                for feature in features:
+                    runner.execute_file(feature)
         else:
             print(f"❌ No encuentro el archivo o carpeta: {args.file}")
 
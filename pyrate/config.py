@@ -9,6 +9,9 @@ from dataclasses import dataclass, field
 from typing import Dict, Optional
 import os
 
+from .screenshots import SCREENSHOT_MODES, SCREENSHOT_FORMATS, SCREENSHOT_CLIPS
+from .selection import compile_row_filter, parse_row_range, parse_shard
+
 
 @dataclass
 class PyRateConfig:
@@ -22,16 +25,70 @@ class PyRateConfig:
         evidence_folder: Directory for test evidence files (default: "evidence")
         screenshot_on_pass: Take screenshots on passing UI steps (default: True)
         screenshot_on_fail: Take screenshots on failing steps (default: True)
+        screenshot_mode: When to capture UI steps: "off", "failures", "all",
+            "every_n", "last_step" or "navigation" (default: None, "all" or
+            "failures" depending on screenshot_on_pass)
+        screenshot_every: Step interval for the "every_n" mode (default: 5)
+        screenshot_format: Image format, "png" or "jpeg" (default: "png")
+        screenshot_quality: JPEG quality from 1 to 100 (default: 80)
+        screenshot_clip: Captured area: "viewport", "full_page" or "element"
+            (the element targeted by the step) (default: "viewport")
+        screenshot_max_dimension: Downscale screenshots so their longest side
+            fits, in pixels; requires Pillow (default: None, original size)
+        evidence_workers: Background threads writing evidence files
+            (default: 2, 0 writes them on the test thread)
+        evidence_queue_size: Evidence files queued before test execution waits
+            for the writers (default: 16)
+        evidence_image_width: Maximum width in pixels of screenshots embedded in
+            DOCX evidence, re-encoded as JPEG; requires Pillow (default: 1000,
+            None embeds the original capture)
+        evidence_image_quality: JPEG quality of DOCX screenshots (default: 75)
+        evidence_archive: Write the evidence of each run into a single
+            "<evidence_folder>/evidence_<timestamp>.zip" with an index.json,
+            instead of one file per scenario and iteration (default: False)
         reports_folder: Directory for HTML reports (default: "reports")
+        report_checkpoint: During multi-file runs, append the records of each
+            finished file to "<reports_folder>/checkpoint.jsonl" (default: False)
+        report_paged_threshold: Step count above which the HTML report uses the
+            paged viewer with a data sidecar (default: 5000, 0 = always)
+        results_jsonl: Stream one JSON line per finished step and scenario to
+            "<reports_folder>/results.jsonl" (default: False)
+        results_junit: Write JUnit XML of the run to "<reports_folder>/junit.xml"
+            (default: False)
         headless: Run browser in headless mode (default: False)
         browser_timeout: Browser operation timeout in milliseconds (default: 30000)
+        browser_context_pool: Browser contexts kept pre-created for upcoming
+            scenarios (default: 1, 0 disables pre-warming)
+        browser_max_contexts: Maximum browser contexts open at once (default: 8)
         api_timeout: API request timeout in seconds (default: 30)
+        api_pool_size: Keep-alive connections pooled per API host (default: 10)
         verify_ssl: Verify SSL certificates for API requests (default: True)
         retry_attempts: Number of retry attempts for failed API requests (default: 1)
         retry_delay: Delay between retries in seconds (default: 1.0)
         default_user_agent: Default User-Agent header for requests
         default_headers: Default HTTP headers for API requests
         max_response_log_size: Maximum size of response data in logs (default: 500)
+        iteration_workers: Threads running data-driven iterations of API features
+            concurrently (default: 1, sequential)
+        artifact_store: Bounded-memory mode: write screenshots and large responses
+            to a content-addressed store on disk as soon as each step ends, keeping
+            only references in the execution log (default: False)
+        artifacts_folder: Directory of the artifact store
+            (default: None, "<reports_folder>/artifacts")
+        artifact_inline_limit: Response characters kept in memory per step when
+            the artifact store is enabled (default: 2048)
+        cache_folder: Directory for on-disk caches: compiled feature plans and
+            parsed CSV/Excel data sources (default: None, in-memory caching only)
+        read_cache_mb: Megabytes of files loaded with read() kept parsed in memory
+            (default: 64, 0 disables the cache)
+        data_rows: Data rows to run, "start:end" (1-based, inclusive; default: None, all)
+        data_filter: Python expression over the columns a data row must satisfy
+            (default: None)
+        data_sample: Run only this many data rows, picked at random (default: None)
+        data_seed: Random seed for data_sample, so every run picks the same rows
+            (default: None)
+        data_shard: Run only the k-th of n shards of the data rows, "k/n", to
+            split a suite across CI nodes (default: None)
     
     Example:
         >>> config = PyRateConfig(headless=True, api_timeout=60)
@@ -43,16 +100,34 @@ class PyRateConfig:
     evidence_folder: str = "evidence"
     screenshot_on_pass: bool = True
     screenshot_on_fail: bool = True
+    screenshot_mode: Optional[str] = None
+    screenshot_every: int = 5
+    screenshot_format: str = "png"
+    screenshot_quality: int = 80
+    screenshot_clip: str = "viewport"
+    screenshot_max_dimension: Optional[int] = None
+    evidence_workers: int = 2
+    evidence_queue_size: int = 16
+    evidence_image_width: Optional[int] = 1000
+    evidence_image_quality: int = 75
+    evidence_archive: bool = False
     
     # Report settings
     reports_folder: str = "reports"
+    report_checkpoint: bool = False
+    report_paged_threshold: int = 5000
+    results_jsonl: bool = False
+    results_junit: bool = False
     
     # Browser settings
     headless: bool = False
     browser_timeout: int = 30000  # milliseconds
+    browser_context_pool: int = 1  # warm contexts
+    browser_max_contexts: int = 8
     
     # API settings
     api_timeout: int = 30  # seconds
+    api_pool_size: int = 10  # connections per host
     verify_ssl: bool = True
     retry_attempts: int = 1
     retry_delay: float = 1.0
@@ -69,6 +144,25 @@ class PyRateConfig:
     max_response_log_size: int = 500
     verbose: bool = False
     
+    # Execution
+    iteration_workers: int = 1
+    
+    # Artifact store
+    artifact_store: bool = False
+    artifacts_folder: Optional[str] = None
+    artifact_inline_limit: int = 2048
+    
+    # Caching
+    cache_folder: Optional[str] = None
+    read_cache_mb: int = 64
+    
+    # Data row selection
+    data_rows: Optional[str] = None
+    data_filter: Optional[str] = None
+    data_sample: Optional[int] = None
+    data_seed: Optional[int] = None
+    data_shard: Optional[str] = None
+    
     @classmethod
     def from_dict(cls, config_dict: Dict) -> 'PyRateConfig':
         """
@@ -100,28 +194,101 @@ class PyRateConfig:
             "evidence_folder": self.evidence_folder,
             "screenshot_on_pass": self.screenshot_on_pass,
             "screenshot_on_fail": self.screenshot_on_fail,
+            "screenshot_mode": self.screenshot_mode,
+            "screenshot_every": self.screenshot_every,
+            "screenshot_format": self.screenshot_format,
+            "screenshot_quality": self.screenshot_quality,
+            "screenshot_clip": self.screenshot_clip,
+            "screenshot_max_dimension": self.screenshot_max_dimension,
+            "evidence_workers": self.evidence_workers,
+            "evidence_queue_size": self.evidence_queue_size,
+            "evidence_image_width": self.evidence_image_width,
+            "evidence_image_quality": self.evidence_image_quality,
+            "evidence_archive": self.evidence_archive,
             "reports_folder": self.reports_folder,
+            "report_checkpoint": self.report_checkpoint,
+            "report_paged_threshold": self.report_paged_threshold,
+            "results_jsonl": self.results_jsonl,
+            "results_junit": self.results_junit,
             "headless": self.headless,
             "browser_timeout": self.browser_timeout,
+            "browser_context_pool": self.browser_context_pool,
+            "browser_max_contexts": self.browser_max_contexts,
             "api_timeout": self.api_timeout,
+            "api_pool_size": self.api_pool_size,
             "verify_ssl": self.verify_ssl,
             "retry_attempts": self.retry_attempts,
             "retry_delay": self.retry_delay,
             "default_user_agent": self.default_user_agent,
             "max_response_log_size": self.max_response_log_size,
             "verbose": self.verbose,
+            "iteration_workers": self.iteration_workers,
+            "artifact_store": self.artifact_store,
+            "artifacts_folder": self.artifacts_folder,
+            "artifact_inline_limit": self.artifact_inline_limit,
+            "cache_folder": self.cache_folder,
+            "read_cache_mb": self.read_cache_mb,
+            "data_rows": self.data_rows,
+            "data_filter": self.data_filter,
+            "data_sample": self.data_sample,
+            "data_seed": self.data_seed,
+            "data_shard": self.data_shard,
         }
     
     def __post_init__(self):
         """Validate configuration after initialization."""
+        if self.screenshot_format == "jpg":
+            self.screenshot_format = "jpeg"
+        if self.screenshot_mode is not None and self.screenshot_mode not in SCREENSHOT_MODES:
+            raise ValueError(f"screenshot_mode must be one of {', '.join(SCREENSHOT_MODES)}")
+        if self.screenshot_format not in SCREENSHOT_FORMATS:
+            raise ValueError(f"screenshot_format must be one of {', '.join(SCREENSHOT_FORMATS)}")
+        if self.screenshot_clip not in SCREENSHOT_CLIPS:
+            raise ValueError(f"screenshot_clip must be one of {', '.join(SCREENSHOT_CLIPS)}")
+        if not 1 <= self.screenshot_quality <= 100:
+            raise ValueError("screenshot_quality must be between 1 and 100")
+        if self.screenshot_every < 1:
+            raise ValueError("screenshot_every must be at least 1")
+        if self.screenshot_max_dimension is not None and self.screenshot_max_dimension < 1:
+            raise ValueError("screenshot_max_dimension must be positive")
+        if self.evidence_workers < 0:
+            raise ValueError("evidence_workers must be non-negative")
+        if self.evidence_queue_size < 1:
+            raise ValueError("evidence_queue_size must be at least 1")
+        if self.evidence_image_width is not None and self.evidence_image_width < 1:
+            raise ValueError("evidence_image_width must be positive")
+        if not 1 <= self.evidence_image_quality <= 100:
+            raise ValueError("evidence_image_quality must be between 1 and 100")
         if self.browser_timeout < 0:
             raise ValueError("browser_timeout must be positive")
+        if self.report_paged_threshold < 0:
+            raise ValueError("report_paged_threshold must be non-negative")
+        if self.browser_context_pool < 0:
+            raise ValueError("browser_context_pool must be non-negative")
+        if self.browser_max_contexts < 1:
+            raise ValueError("browser_max_contexts must be at least 1")
         if self.api_timeout <= 0:
             raise ValueError("api_timeout must be positive")
+        if self.api_pool_size < 1:
+            raise ValueError("api_pool_size must be at least 1")
+        if self.iteration_workers < 1:
+            raise ValueError("iteration_workers must be at least 1")
+        if self.artifact_inline_limit < 0:
+            raise ValueError("artifact_inline_limit must be non-negative")
         if self.retry_attempts < 1:
             raise ValueError("retry_attempts must be at least 1")
         if self.retry_delay < 0:
             raise ValueError("retry_delay must be non-negative")
+        if self.read_cache_mb < 0:
+            raise ValueError("read_cache_mb must be non-negative")
+        if self.data_rows is not None:
+            parse_row_range(self.data_rows)
+        if self.data_filter is not None:
+            compile_row_filter(self.data_filter)
+        if self.data_sample is not None and self.data_sample < 0:
+            raise ValueError("data_sample must be non-negative")
+        if self.data_shard is not None:
+            parse_shard(self.data_shard)
         
         # Create output folders if they don't exist
         os.makedirs(self.evidence_folder, exist_ok=True)
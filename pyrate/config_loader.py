@@ -124,16 +124,45 @@ class ConfigLoader:
             ('evidence', 'folder'): 'evidence_folder',
             ('evidence', 'screenshot_on_pass'): 'screenshot_on_pass',
             ('evidence', 'screenshot_on_fail'): 'screenshot_on_fail',
+            ('evidence', 'screenshot_mode'): 'screenshot_mode',
+            ('evidence', 'screenshot_every'): 'screenshot_every',
+            ('evidence', 'screenshot_format'): 'screenshot_format',
+            ('evidence', 'screenshot_quality'): 'screenshot_quality',
+            ('evidence', 'screenshot_clip'): 'screenshot_clip',
+            ('evidence', 'screenshot_max_dimension'): 'screenshot_max_dimension',
+            ('evidence', 'workers'): 'evidence_workers',
+            ('evidence', 'queue_size'): 'evidence_queue_size',
+            ('evidence', 'image_width'): 'evidence_image_width',
+            ('evidence', 'image_quality'): 'evidence_image_quality',
+            ('evidence', 'archive'): 'evidence_archive',
             ('reports', 'folder'): 'reports_folder',
+            ('reports', 'checkpoint'): 'report_checkpoint',
+            ('reports', 'paged_threshold'): 'report_paged_threshold',
+            ('reports', 'jsonl'): 'results_jsonl',
+            ('reports', 'junit'): 'results_junit',
             ('browser', 'headless'): 'headless',
             ('browser', 'timeout'): 'browser_timeout',
+            ('browser', 'context_pool'): 'browser_context_pool',
+            ('browser', 'max_contexts'): 'browser_max_contexts',
             ('api', 'timeout'): 'api_timeout',
+            ('api', 'pool_size'): 'api_pool_size',
             ('api', 'verify_ssl'): 'verify_ssl',
             ('api', 'retry_attempts'): 'retry_attempts',
             ('api', 'retry_delay'): 'retry_delay',
             ('api', 'user_agent'): 'default_user_agent',
             ('logging', 'verbose'): 'verbose',
             ('logging', 'max_response_size'): 'max_response_log_size',
+            ('execution', 'iteration_workers'): 'iteration_workers',
+            ('artifacts', 'enabled'): 'artifact_store',
+            ('artifacts', 'folder'): 'artifacts_folder',
+            ('artifacts', 'inline_limit'): 'artifact_inline_limit',
+            ('cache', 'folder'): 'cache_folder',
+            ('cache', 'read_mb'): 'read_cache_mb',
+            ('data', 'rows'): 'data_rows',
+            ('data', 'filter'): 'data_filter',
+            ('data', 'sample'): 'data_sample',
+            ('data', 'seed'): 'data_seed',
+            ('data', 'shard'): 'data_shard',
         }
         
         # Process nested structure
@@ -170,19 +199,37 @@ pyrate:
     folder: "evidence"              # Where to store evidence files
     screenshot_on_pass: true        # Capture screenshots on successful UI steps
     screenshot_on_fail: true        # Capture screenshots on failed steps
+    # screenshot_mode: "last_step"  # off | failures | all | every_n | last_step | navigation
+    screenshot_every: 5             # Step interval for the every_n mode
+    screenshot_format: "png"        # png | jpeg
+    screenshot_quality: 80          # JPEG quality (1-100)
+    screenshot_clip: "viewport"     # viewport | full_page | element (the step's target)
+    # screenshot_max_dimension: 1280  # Downscale captures (requires Pillow)
+    workers: 2                      # Background threads writing DOCX/TXT evidence (0 = on the test thread)
+    queue_size: 16                  # Evidence files queued before tests wait for the writers
+    image_width: 1000               # Downscale DOCX screenshots to this width, as JPEG (requires Pillow)
+    image_quality: 75               # JPEG quality of DOCX screenshots (1-100)
+    archive: false                  # One evidence/evidence_<timestamp>.zip per run, with index.json
   
   # Report generation settings
   reports:
     folder: "reports"               # Where to store HTML reports
+    checkpoint: false               # Append each finished file's results to reports/checkpoint.jsonl
+    paged_threshold: 5000           # Above this many steps, use the paged viewer (0 = always)
+    jsonl: false                    # Stream step/scenario results to reports/results.jsonl
+    junit: false                    # Write JUnit XML to reports/junit.xml at the end
   
   # Browser automation settings (Playwright)
   browser:
     headless: false                 # Run browser in headless mode (true for CI)
     timeout: 30000                  # Timeout for browser operations (milliseconds)
+    context_pool: 1                 # Browser contexts pre-created for upcoming scenarios
+    max_contexts: 8                 # Maximum browser contexts open at once
   
   # API testing settings
   api:
     timeout: 30                     # Timeout for HTTP requests (seconds)
+    pool_size: 10                   # Keep-alive connections reused per host
     verify_ssl: true                # Verify SSL certificates
     retry_attempts: 3               # Number of retry attempts for failed requests
     retry_delay: 1.0                # Delay between retries (seconds)
@@ -192,6 +239,29 @@ pyrate:
   logging:
     verbose: false                  # Enable verbose logging
     max_response_size: 500          # Maximum response data to log (characters)
+  
+  # Execution settings
+  execution:
+    iteration_workers: 1            # Threads for data-driven API iterations (or tag a feature @parallel)
+  
+  # Artifact store (bounded memory for long runs)
+  artifacts:
+    enabled: false                  # Write screenshots/large responses to disk as each step ends
+    folder: "reports/artifacts"     # Content-addressed store (default: <reports folder>/artifacts)
+    inline_limit: 2048              # Response characters kept in memory per step
+  
+  # Cache settings
+  cache:
+    folder: ".pyrate_cache"         # On-disk cache for compiled features and CSV/Excel data (omit for memory only)
+    read_mb: 64                     # Memory for files loaded with read(), parsed once per run (0 = off)
+  
+  # Data row selection for data-driven features (all rows if omitted)
+  data:
+    # rows: "1000:2000"             # Row numbers to run (1-based, inclusive; "500:" or ":100" also work)
+    # filter: "country == 'AR'"     # Python expression over the columns of each row
+    # sample: 50                    # Run N rows picked at random
+    # seed: 42                      # Same sample on every run
+    # shard: "1/4"                  # Run the k-th of n shards (one per CI node)
 """
         
         with open(output_path, 'w', encoding='utf-8') as f:
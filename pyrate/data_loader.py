@@ -4,60 +4,484 @@ Data loading utilities for PyRate Framework.
 Supports loading test data from various formats:
 - CSV files
 - Excel files (.xlsx, .xls)
-- JSON files
+- JSON files (an array of objects or a single object)
+- JSON Lines files (.jsonl, .ndjson)
+
+Rows are streamed with :func:`iter_dataset`, so data-driven runs start with
+the first row and only keep a window of rows in memory: CSV is read in
+chunks, JSON Lines line by line, JSON arrays element by element and .xlsx
+workbooks in openpyxl's read-only mode.
+
+With a ``cache_folder``, parsed CSV and Excel files are kept on disk by
+:class:`DatasetCache` and later runs read the cached rows instead of parsing
+the source again.
 """
 
-import pandas as pd
+import glob
+import hashlib
 import json
+import math
 import os
-from typing import List, Dict, Any
+import pickle
+import threading
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
 from .exceptions import DataFileError
+from .logger import log_warning
+
+# Rows parsed at a time from CSV and Excel files
+DEFAULT_CHUNK_SIZE = 10000
+
+SUPPORTED_EXTENSIONS = ('csv', 'xlsx', 'xls', 'json', 'jsonl', 'ndjson')
+
+# Formats worth caching: JSON is already as fast to parse as a cache entry
+CACHEABLE_EXTENSIONS = ('csv', 'xlsx', 'xls')
+
+# Bump when the layout or content of cache entries changes
+DATASET_CACHE_VERSION = 2
+
+# Text pandas reads as booleans
+_CSV_BOOLEANS = {'True': True, 'TRUE': True, 'true': True, 'False': False, 'FALSE': False, 'false': False}
 
 
-def load_dataset(file_path: str) -> List[Dict[str, Any]]:
+def load_dataset(file_path: str, cache_folder: Optional[str] = None) -> List[Dict[str, Any]]:
     """
-    Load test data from CSV, Excel, or JSON file.
-    
+    Load test data from CSV, Excel, JSON or JSON Lines file.
+
     Args:
         file_path: Path to the data file
-        
+        cache_folder: Directory of the dataset cache (disabled if None)
+
     Returns:
         List of dictionaries, where each dictionary represents a row/record
-        
+
     Raises:
         DataFileError: If file doesn't exist, format is unsupported, or parsing fails
-        
+
     Examples:
         >>> # Load CSV
         >>> data = load_dataset("tests/data/users.csv")
         >>> # Returns: [{'username': 'user1', 'password': 'pass1'}, ...]
-        
+
         >>> # Load Excel
         >>> data = load_dataset("tests/data/testdata.xlsx")
-        
+
         >>> # Load JSON
         >>> data = load_dataset("tests/data/config.json")
+
+        >>> # Parse the workbook once, then read it from the cache
+        >>> data = load_dataset("tests/data/testdata.xlsx", cache_folder=".pyrate_cache/datasets")
+    """
+    return list(iter_dataset(file_path, cache_folder=cache_folder))
+
+
+def iter_dataset(
+    file_path: str,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    cache_folder: Optional[str] = None
+) -> Iterator[Dict[str, Any]]:
+    """
+    Stream the rows of a data file.
+
+    The path and format are checked right away; parsing happens while the
+    rows are consumed.
+
+    Args:
+        file_path: Path to the data file
+        chunk_size: Rows parsed at a time from CSV and Excel files
+        cache_folder: Directory of the dataset cache for CSV and Excel files
+            (disabled if None)
+
+    Returns:
+        Iterator of dictionaries, one per row/record
+
+    Raises:
+        DataFileError: If the file doesn't exist or its format is unsupported
+            (when called), or if parsing fails (while iterating)
+
+    Example:
+        >>> for row in iter_dataset("tests/data/2M_users.csv"):
+        ...     print(row["username"])
     """
     if not os.path.exists(file_path):
         raise DataFileError(f"Archivo no encontrado: {file_path}")
 
     ext = file_path.split('.')[-1].lower()
+    if ext not in SUPPORTED_EXTENSIONS:
+        raise DataFileError(
+            f"Formato '{ext}' no soportado. Usa .csv, .xlsx, .xls, .json o .jsonl"
+        )
+    cache = DatasetCache(cache_folder) if cache_folder and ext in CACHEABLE_EXTENSIONS else None
+    return _iter_rows(file_path, ext, chunk_size, cache)
+
+
+def _iter_rows(file_path: str, ext: str, chunk_size: int, cache: Optional['DatasetCache']) -> Iterator[Dict[str, Any]]:
     try:
-        if ext == 'csv':
-            return pd.read_csv(file_path).to_dict(orient='records')
-        elif ext in ['xlsx', 'xls']:
-            return pd.read_excel(file_path).to_dict(orient='records')
-        elif ext == 'json':
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            # Ensure we always return a list
-            return data if isinstance(data, list) else [data]
+        if ext in CACHEABLE_EXTENSIONS:
+            chunks = _iter_chunks(file_path, ext, chunk_size)
+            if cache is not None:
+                yield from cache.rows(file_path, chunks)
+            else:
+                for chunk in chunks:
+                    yield from chunk
+        elif ext in ('jsonl', 'ndjson'):
+            yield from _iter_json_lines(file_path)
         else:
-            raise DataFileError(
-                f"Formato '{ext}' no soportado. Usa .csv, .xlsx, .xls o .json"
-            )
+            yield from _iter_json(file_path)
     except DataFileError:
         raise  # Re-raise our own exceptions
     except Exception as e:
         raise DataFileError(f"Error leyendo datos desde {file_path}: {str(e)}")
 
+
+def _iter_chunks(file_path: str, ext: str, chunk_size: int) -> Iterator[List[Dict[str, Any]]]:
+    """Yield the rows of a CSV or Excel file in lists of up to chunk_size rows."""
+    if ext == 'csv':
+        yield from _iter_csv(file_path, chunk_size)
+    elif ext == 'xlsx':
+        yield from _iter_xlsx(file_path, chunk_size)
+    else:
+        import pandas as pd  # Legacy workbooks need pandas (xlrd)
+        yield pd.read_excel(file_path).to_dict(orient='records')
+
+
+def _iter_csv(file_path: str, chunk_size: int) -> Iterator[List[Dict[str, Any]]]:
+    """
+    Yield CSV rows in chunks, with the column types of the first chunk for the whole file.
+
+    Otherwise a value could change type (``1`` vs ``1.0``) depending on its chunk.
+    Chunks are read as text and converted to those types; a later value that does
+    not fit its column (``1.5`` or ``A1B`` in an integer column) is kept as a
+    float or as text, as pandas would read it, and blanks are NaN.
+    """
+    import pandas as pd  # Only CSV/Excel data sources pay for pandas
+    first = pd.read_csv(file_path, nrows=chunk_size)
+    # A column still blank after the first chunk has no type yet: it stays text
+    typed = first.loc[:, first.notna().any()]
+    converters = [(column, _csv_converter(dtype)) for column, dtype in typed.dtypes.items()]
+    converters = [(column, converter) for column, converter in converters if converter is not None]
+    with pd.read_csv(file_path, chunksize=chunk_size, dtype=str) as reader:
+        for chunk in reader:
+            # Converted per value: pandas would infer a column type per chunk again
+            rows = chunk.to_dict(orient='records')
+            for row in rows:
+                for column, converter in converters:
+                    row[column] = converter(row[column])
+            yield rows
+
+
+def _csv_converter(dtype: Any) -> Optional[Callable[[Any], Any]]:
+    """Converter from text to a column type inferred by pandas (None keeps the text)."""
+    if dtype.kind in 'iu':
+        return _csv_int
+    if dtype.kind == 'f':
+        return _csv_float
+    if dtype.kind == 'b':
+        return _csv_bool
+    return None
+
+
+def _csv_int(value: Any) -> Any:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return _csv_float(value)
+
+
+def _csv_float(value: Any) -> Any:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return value
+
+
+def _csv_bool(value: Any) -> Any:
+    return _CSV_BOOLEANS.get(value, value) if isinstance(value, str) else value
+
+
+def _iter_xlsx(file_path: str, chunk_size: int) -> Iterator[List[Dict[str, Any]]]:
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(file_path, read_only=True, data_only=True)
+    try:
+        rows = workbook.active.iter_rows(values_only=True)
+        header = next(rows, None)
+        if header is None:
+            return
+        columns = [str(name) if name is not None else f"Unnamed: {i}" for i, name in enumerate(header)]
+        chunk = []
+        for values in rows:
+            if values is None or all(value is None for value in values):
+                continue  # Blank rows are skipped, as pandas does
+            # Empty cells are NaN, as with pandas and CSV files
+            chunk.append({column: math.nan if value is None else value for column, value in zip(columns, values)})
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+    finally:
+        workbook.close()
+
+
+def _iter_json_lines(file_path: str) -> Iterator[Dict[str, Any]]:
+    with open(file_path, 'r', encoding='utf-8') as f:
+        for number, line in enumerate(f, 1):
+            if line.strip():
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError as e:
+                    raise DataFileError(f"Error leyendo datos desde {file_path}, línea {number}: {e}")
+
+
+def _iter_json(file_path: str, block_size: int = 1 << 16) -> Iterator[Dict[str, Any]]:
+    """Yield the elements of a top-level JSON array without loading the whole file."""
+    decoder = json.JSONDecoder()
+    with open(file_path, 'r', encoding='utf-8') as f:
+        buffer = f.read(block_size).lstrip()
+        if not buffer.startswith('['):
+            # A single object: there is nothing to stream
+            data = json.loads(buffer + f.read())
+            # Ensure we always return a list
+            yield from (data if isinstance(data, list) else [data])
+            return
+
+        pos = 1
+        eof = False
+
+        def read_more():
+            nonlocal buffer, pos, eof
+            more = f.read(block_size)
+            eof = not more
+            buffer = buffer[pos:] + more
+            pos = 0
+
+        while True:
+            while pos < len(buffer) and buffer[pos] in ' \t\r\n,':
+                pos += 1
+            if pos == len(buffer):
+                if eof:
+                    raise DataFileError(f"JSON incompleto en {file_path}: falta ']'")
+                read_more()
+                continue
+            if buffer[pos] == ']':
+                return
+            try:
+                item, end = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                read_more()  # The element continues in the next block
+                continue
+            if not isinstance(item, (dict, list, str)) and not eof and \
+                    (end == len(buffer) or buffer[end] not in ' \t\r\n,]'):
+                read_more()  # A number or literal may continue in the next block
+                continue
+            yield item
+            pos = end
+
+
+class DatasetCache:
+    """
+    On-disk cache of parsed CSV and Excel data sources.
+
+    Entries are keyed by absolute path, size and modification time, so an
+    edited file is parsed again. Rows are stored in chunks (Parquet row
+    groups when pyarrow is installed, pickled lists otherwise) and read back
+    as a stream, like the source files. An entry is written while the source
+    is parsed and only renamed into place once every row was read, so readers
+    never see a partial entry.
+
+    The cache is shared across runs: there is no lock around the conversion,
+    so parallel workers that miss the cache at the same time each parse the
+    source and the last complete entry wins.
+
+    Attributes:
+        cache_folder: Directory of the cache entries
+        format: "parquet" or "pickle"
+
+    Example:
+        >>> # First run parses the workbook, later runs read the cache entry
+        >>> rows = list(iter_dataset("data/users.xlsx", cache_folder=".pyrate_cache/datasets"))
+    """
+
+    def __init__(self, cache_folder: str):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_folder: Directory of the cache entries (created if missing)
+        """
+        import importlib.util
+
+        self.cache_folder = cache_folder
+        self.format = 'parquet' if importlib.util.find_spec('pyarrow') else 'pickle'
+        os.makedirs(cache_folder, exist_ok=True)
+
+    def entry_path(self, file_path: str) -> str:
+        """
+        Cache entry for the current version of a file.
+
+        Args:
+            file_path: Path to the data file
+
+        Returns:
+            Path of the entry (it may not exist yet)
+        """
+        path = os.path.abspath(file_path)
+        stat = os.stat(path)
+        return os.path.join(
+            self.cache_folder,
+            f"{_path_digest(path)}-{stat.st_size}-{stat.st_mtime_ns}.v{DATASET_CACHE_VERSION}.{self.format}"
+        )
+
+    def rows(self, file_path: str, chunks: Iterable[List[Dict[str, Any]]]) -> Iterator[Dict[str, Any]]:
+        """
+        Stream the rows of a file from its cache entry, or from the parser while caching them.
+
+        Args:
+            file_path: Path to the data file
+            chunks: Parsed rows of the file in lists (only consumed on a cache miss)
+
+        Returns:
+            Iterator of dictionaries, one per row/record
+        """
+        path = self.entry_path(file_path)
+        cached = self._open(path)
+        if cached is not None:
+            for chunk in cached:
+                yield from chunk
+            return
+        yield from self._write_through(file_path, path, chunks)
+
+    def _open(self, path: str) -> Optional[Iterator[List[Dict[str, Any]]]]:
+        if self.format == 'parquet':
+            import pyarrow.parquet as pq
+            try:
+                return _read_parquet(pq.ParquetFile(path))
+            except Exception:
+                return None  # Missing or unreadable entry: parse the source
+        try:
+            f = open(path, 'rb')
+        except OSError:
+            return None
+        try:
+            header = pickle.load(f)
+        except Exception:
+            header = None
+        if header != _PICKLE_HEADER:
+            f.close()
+            return None
+        return _read_pickle(f)
+
+    def _write_through(self, file_path: str, path: str, chunks: Iterable[List[Dict[str, Any]]]) -> Iterator[Dict[str, Any]]:
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            writer = _ParquetWriter(tmp_path) if self.format == 'parquet' else _PickleWriter(tmp_path)
+        except OSError as e:
+            log_warning(f"No se pudo crear la caché de {file_path}: {e}")
+            writer = None
+        complete = False
+        try:
+            for chunk in chunks:
+                if writer is not None:
+                    try:
+                        writer.write(chunk)
+                    except Exception as e:
+                        # The cache is an optimization; keep streaming rows without it
+                        log_warning(f"No se pudo cachear {file_path}: {e}")
+                        self._finish(writer, tmp_path, None)
+                        writer = None
+                yield from chunk
+            complete = True
+        finally:
+            if writer is not None:
+                self._finish(writer, tmp_path, path if complete else None)
+
+    def _finish(self, writer: Any, tmp_path: str, path: Optional[str]) -> None:
+        """Close a writer and move its entry into place, or discard it if path is None."""
+        try:
+            writer.close()
+            if path is not None:
+                os.replace(tmp_path, path)
+                self._remove_stale(path)
+                return
+        except Exception:
+            pass
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+    def _remove_stale(self, path: str) -> None:
+        """Delete entries of older versions of the same file."""
+        prefix = os.path.basename(path).split('-', 1)[0]
+        for stale in glob.glob(os.path.join(self.cache_folder, f"{prefix}-*")):
+            if stale != path and not stale.endswith('.tmp'):
+                try:
+                    os.remove(stale)
+                except OSError:
+                    pass
+
+
+_PICKLE_HEADER = ('pyrate-dataset', DATASET_CACHE_VERSION)
+
+
+def _path_digest(path: str) -> str:
+    return hashlib.sha1(path.encode('utf-8')).hexdigest()[:16]
+
+
+def _read_pickle(f) -> Iterator[List[Dict[str, Any]]]:
+    with f:
+        while True:
+            try:
+                yield pickle.load(f)
+            except EOFError:
+                return
+
+
+def _read_parquet(parquet_file) -> Iterator[List[Dict[str, Any]]]:
+    for batch in parquet_file.iter_batches(batch_size=DEFAULT_CHUNK_SIZE):
+        # Parquet stores NaN cells as nulls; give them back as NaN
+        yield [{k: math.nan if v is None else v for k, v in row.items()} for row in batch.to_pylist()]
+
+
+class _PickleWriter:
+    """Cache entry made of a header and one pickled list of rows per chunk."""
+
+    def __init__(self, path: str):
+        self._file = open(path, 'wb')
+        pickle.dump(_PICKLE_HEADER, self._file, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def write(self, rows: List[Dict[str, Any]]) -> None:
+        pickle.dump(rows, self._file, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class _ParquetWriter:
+    """Cache entry made of one Parquet row group per chunk."""
+
+    def __init__(self, path: str):
+        self._path = path
+        self._writer = None
+
+    def write(self, rows: List[Dict[str, Any]]) -> None:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        # NaN in text columns cannot be stored as is: write nulls instead
+        rows = [{k: None if isinstance(v, float) and math.isnan(v) else v for k, v in row.items()} for row in rows]
+        if self._writer is None:
+            table = pa.Table.from_pylist(rows)
+            self._writer = pq.ParquetWriter(self._path, table.schema)
+        else:
+            # Later chunks must fit the column types of the first one
+            table = pa.Table.from_pylist(rows, schema=self._writer.schema)
+        self._writer.write_table(table)
+
+    def close(self) -> None:
+        if self._writer is None:
+            # No rows: an empty file makes an entry pyarrow cannot read, so none is kept
+            raise ValueError("sin filas")
+        self._writer.close()
@@ -4,16 +4,30 @@ Evidence generation utilities for PyRate Framework.
 Automatically generates evidence files for test executions:
 - API tests: TXT files with request/response details
 - UI tests: DOCX files with screenshots and step descriptions
+
+In archive mode the files of a run go into a single ZIP with a JSON index
+(see :mod:`pyrate.archive`) instead of one file each.
+
+Files are written in the background by an :class:`EvidencePipeline`, so
+test execution does not wait for document rendering.
 """
 
 import os
 import json
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from datetime import datetime
-from typing import List, Dict, Any, Optional
-from docx import Document
-from docx.shared import Inches, RGBColor
+from typing import Callable, List, Dict, Any, Optional, Union
 from io import BytesIO
 
+from .archive import EvidenceArchive
+from .artifacts import response_data, screenshot_bytes
+from .imaging import fit_width
+from .logger import log_error, log_success
+
+# Width of screenshots in UI evidence documents
+EMBED_WIDTH_INCHES = 5.0
+
 
 class EvidenceGenerator:
     """
@@ -21,27 +35,73 @@ class EvidenceGenerator:
     
     API evidence is saved as TXT files with request/response information.
     UI evidence is saved as DOCX files with screenshots and step details.
+    Screenshots are downscaled to the pixels shown at the embed width and
+    re-encoded as JPEG before insertion (requires Pillow).
     
     Attributes:
         output_folder: Directory where evidence files are saved
+        image_width: Maximum screenshot width in pixels (None embeds the original)
+        image_quality: JPEG quality of embedded screenshots (1-100)
+        image_workers: Threads preparing the screenshots of a document
+        archive: Write the files of a run into one ZIP archive (see :meth:`close`)
     """
     
-    def __init__(self, output_folder: str = "evidence"):
+    def __init__(
+        self,
+        output_folder: str = "evidence",
+        image_width: Optional[int] = 1000,
+        image_quality: int = 75,
+        image_workers: int = 4,
+        archive: bool = False
+    ):
         """
         Initialize evidence generator.
         
         Args:
             output_folder: Directory for evidence files (created if doesn't exist)
+            image_width: Maximum screenshot width in pixels; the default shows
+                the 5-inch embed at 200 DPI. None embeds the original capture.
+            image_quality: JPEG quality of embedded screenshots (1-100)
+            image_workers: Threads preparing the screenshots of a document
+            archive: Write the files into ``<output_folder>/evidence_<timestamp>.zip``
+                until :meth:`close` is called, instead of one file each
         """
         self.output_folder = output_folder
+        self.image_width = image_width
+        self.image_quality = image_quality
+        self.image_workers = max(1, image_workers)
+        self.archive = archive
+        self._archive: Optional[EvidenceArchive] = None
+        self._archive_lock = threading.Lock()
         os.makedirs(self.output_folder, exist_ok=True)
 
+    @property
+    def archive_path(self) -> Optional[str]:
+        """Path of the archive being written, or None if nothing was archived since the last close."""
+        with self._archive_lock:
+            return self._archive.path if self._archive is not None else None
+
+    def close(self) -> Optional[str]:
+        """
+        Finish the current evidence archive; the next file starts a new one.
+
+        Returns:
+            Path of the finished archive, or None if nothing was archived
+        """
+        with self._archive_lock:
+            archive, self._archive = self._archive, None
+        if archive is None:
+            return None
+        archive.close()
+        return archive.path
+
     def generate_api_evidence(
         self, 
         scenario_name: str, 
         method: str, 
         response_data: Any, 
-        iteration: int = 0
+        iteration: int = 0,
+        status: Optional[str] = None
     ) -> str:
         """
         Generate TXT evidence file for API test execution.
@@ -51,9 +111,10 @@ class EvidenceGenerator:
             method: HTTP method used (GET, POST, etc.)
             response_data: Response data (usually dict or string)
             iteration: Data iteration number (for data-driven tests)
+            status: Scenario result ("PASS"/"FAIL"), recorded in the archive index
             
         Returns:
-            Path to the generated evidence file
+            Path to the generated evidence file (``<archive>!<entry>`` in archive mode)
             
         Example:
             >>> gen = EvidenceGenerator()
@@ -83,6 +144,10 @@ RESPONSE (JSON):
 {json.dumps(response_data, indent=4, ensure_ascii=False)}
         """
 
+        if self.archive:
+            return self._add_to_archive(filename, content.strip().encode("utf-8"),
+                                        scenario_name, iteration, status)
+
         with open(filename, "w", encoding="utf-8") as f:
             f.write(content.strip())
 
@@ -103,7 +168,7 @@ RESPONSE (JSON):
             iteration: Data iteration number (for data-driven tests)
             
         Returns:
-            Path to the generated DOCX file
+            Path to the generated DOCX file (``<archive>!<entry>`` in archive mode)
             
         Example:
             >>> steps = [
@@ -116,6 +181,10 @@ RESPONSE (JSON):
             ... ]
             >>> path = gen.generate_ui_evidence("Login Flow", steps)
         """
+        # python-docx is only loaded when UI evidence is written
+        from docx import Document
+        from docx.shared import Inches, RGBColor
+
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         safe_name = "".join([c if c.isalnum() else "_" for c in scenario_name])
         filename = f"{self.output_folder}/UI_{safe_name}_Iter{iteration + 1}.docx"
@@ -134,8 +203,10 @@ RESPONSE (JSON):
 
         doc.add_heading('Detalle Paso a Paso', level=1)
 
+        images = self._prepare_images([screenshot_bytes(step) for step in steps_log])
+
         # Iterar pasos
-        for step in steps_log:
+        for step, image in zip(steps_log, images):
             # Texto del paso
             p_step = doc.add_paragraph()
             run_step = p_step.add_run(f"Paso: {step['name']}")
@@ -154,18 +225,181 @@ RESPONSE (JSON):
             # Respuesta API (si hubo)
             if step.get('response_data'):
                 doc.add_paragraph("Respuesta API:", style='Caption')
-                doc.add_paragraph(str(step['response_data'])[:1000])
+                doc.add_paragraph(str(response_data(step))[:1000])
 
-            # Screenshot (si hubo)
-            if step.get('screenshot_bytes'):
+            # Screenshot (si hubo, en memoria o en el almacén de artefactos)
+            if image:
                 doc.add_paragraph("Evidencia Visual:", style='Caption')
                 try:
-                    image_stream = BytesIO(step['screenshot_bytes'])
-                    doc.add_picture(image_stream, width=Inches(5.0))
+                    image_stream = BytesIO(image)
+                    doc.add_picture(image_stream, width=Inches(EMBED_WIDTH_INCHES))
                 except Exception as e:
                     doc.add_paragraph(f"[No se pudo adjuntar imagen: {str(e)}]")
 
             doc.add_paragraph("-" * 50)
 
+        if self.archive:
+            buffer = BytesIO()
+            doc.save(buffer)
+            status = "FAIL" if any(step.get('status') == 'FAIL' for step in steps_log) else "PASS"
+            return self._add_to_archive(filename, buffer.getvalue(), scenario_name, iteration, status)
+
         doc.save(filename)
-        return filename
\ No newline at end of file
+        return filename
+
+    def _add_to_archive(self, filename: str, data: bytes, scenario_name: str,
+                        iteration: int, status: Optional[str]) -> str:
+        with self._archive_lock:
+            if self._archive is None:
+                self._archive = EvidenceArchive.for_run(self.output_folder)
+            archive = self._archive
+        entry = archive.add(os.path.basename(filename), data,
+                            scenario=scenario_name, iteration=iteration + 1, status=status)
+        return f"{archive.path}!{entry}"
+
+    def _prepare_images(self, images: List[Optional[bytes]]) -> List[Optional[bytes]]:
+        """Downscale and re-encode screenshots in parallel (Pillow releases the GIL)."""
+        if not self.image_width or sum(1 for image in images if image) == 0:
+            return images
+
+        def prepare(image):
+            if not image:
+                return image
+            try:
+                return fit_width(image, self.image_width, "jpeg", self.image_quality)
+            except Exception:
+                return image  # Unreadable image: embed it as captured
+
+        with ThreadPoolExecutor(max_workers=min(self.image_workers, len(images))) as pool:
+            return list(pool.map(prepare, images))
+
+
+class EvidencePipeline:
+    """
+    Writes evidence files on background threads through a bounded queue.
+
+    Offers the same ``generate_*`` methods as :class:`EvidenceGenerator`,
+    but they return as soon as the document is queued. When ``max_pending``
+    documents are already waiting, the caller blocks until one is written
+    (backpressure), so a slow disk cannot make memory grow without bound.
+    Results and errors are reported to the log as each file is finished;
+    :meth:`flush` waits for every queued file.
+
+    Attributes:
+        generator: EvidenceGenerator that renders the files
+        workers: Writer threads (0 writes synchronously on the caller's thread)
+        max_pending: Maximum documents queued or being written
+
+    Example:
+        >>> pipeline = EvidencePipeline(EvidenceGenerator(), workers=2)
+        >>> pipeline.generate_ui_evidence("Login Flow", steps)
+        >>> errors = pipeline.flush()
+    """
+
+    def __init__(self, generator: EvidenceGenerator, workers: int = 2, max_pending: int = 16):
+        """
+        Initialize the pipeline (threads are started on first use).
+
+        Args:
+            generator: EvidenceGenerator that renders the files
+            workers: Writer threads (0 writes synchronously)
+            max_pending: Maximum documents queued or being written
+        """
+        self.generator = generator
+        self.workers = max(0, workers)
+        self.max_pending = max(1, max_pending)
+        self._slots = threading.BoundedSemaphore(self.max_pending)
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending: set = set()
+        self._errors: List[str] = []
+
+    def generate_ui_evidence(
+        self,
+        scenario_name: str,
+        steps_log: List[Dict[str, Any]],
+        iteration: int = 0
+    ) -> Union[Future, Optional[str]]:
+        """
+        Queue the DOCX evidence of a UI scenario (see EvidenceGenerator).
+
+        Returns:
+            Future of the file path, or the path itself when writing synchronously
+        """
+        return self._submit("📄 Evidencia UI", self.generator.generate_ui_evidence,
+                            scenario_name, list(steps_log), iteration=iteration)
+
+    def generate_api_evidence(
+        self,
+        scenario_name: str,
+        method: str,
+        response_data: Any,
+        iteration: int = 0,
+        status: Optional[str] = None
+    ) -> Union[Future, Optional[str]]:
+        """
+        Queue the TXT evidence of an API scenario (see EvidenceGenerator).
+
+        Returns:
+            Future of the file path, or the path itself when writing synchronously
+        """
+        return self._submit("📄 Log API", self.generator.generate_api_evidence,
+                            scenario_name, method, response_data, iteration=iteration, status=status)
+
+    def flush(self) -> List[str]:
+        """
+        Wait until every queued file is written.
+
+        Returns:
+            Errors reported since the previous flush, as "scenario: message"
+        """
+        with self._lock:
+            pending = list(self._pending)
+        wait(pending)
+        with self._lock:
+            errors, self._errors = self._errors, []
+        return errors
+
+    def close(self) -> List[str]:
+        """Flush, then stop the writer threads (they restart on the next file)."""
+        errors = self.flush()
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+        return errors
+
+    def _submit(self, label: str, func: Callable[..., str], *args, **kwargs):
+        if self.workers == 0:
+            return self._write(label, func, args, kwargs)
+
+        self._slots.acquire()  # Blocks while max_pending files are queued
+        try:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.workers, thread_name_prefix="pyrate-evidence"
+                    )
+                future = self._executor.submit(self._write, label, func, args, kwargs)
+                self._pending.add(future)
+        except Exception:
+            self._slots.release()
+            raise
+        future.add_done_callback(self._done)
+        return future
+
+    def _done(self, future: Future) -> None:
+        with self._lock:
+            self._pending.discard(future)
+        self._slots.release()
+
+    def _write(self, label: str, func: Callable[..., str], args: tuple, kwargs: dict) -> Optional[str]:
+        try:
+            path = func(*args, **kwargs)
+        except Exception as e:
+            log_error("EVIDENCIA", f"Error generando evidencia de '{args[0]}': {e}")
+            with self._lock:
+                self._errors.append(f"{args[0]}: {e}")
+            return None
+        log_success(f"{label}: {path}")
+        return path
@@ -0,0 +1,160 @@
+"""
+Cache of files loaded with ``read()`` for PyRate Framework.
+
+``request read('body.json')`` and similar steps run in every scenario and
+data iteration. :class:`ReadCache` parses each file once and keeps the result
+in an LRU cache bounded by the total size of the cached files; entries are
+validated with the file's mtime and size, so edits are picked up.
+
+Cached values are shared by every step that reads the file, so JSON objects
+and arrays are returned as :class:`FrozenDict` / :class:`FrozenList`: they
+behave like (and are) ``dict`` and ``list`` but cannot be modified. Call
+``.copy()`` for a mutable (shallow) copy.
+
+Example:
+    >>> cache = ReadCache(max_bytes=64 * 1024 * 1024)
+    >>> body = cache.load("data/order.json")
+    >>> body["items"][0]["sku"]
+    'A-1'
+"""
+
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Tuple
+
+
+def _immutable(self, *args, **kwargs):
+    raise TypeError(f"'{type(self).__name__}' es de solo lectura (usa .copy() para modificarlo)")
+
+
+class FrozenDict(dict):
+    """Read-only ``dict`` shared between steps; ``copy()`` returns a mutable dict."""
+
+    __slots__ = ()
+    __setitem__ = __delitem__ = __ior__ = _immutable
+    clear = pop = popitem = setdefault = update = _immutable
+
+    def __reduce__(self):
+        return (type(self), (dict(self),))
+
+
+class FrozenList(list):
+    """Read-only ``list`` shared between steps; ``copy()`` returns a mutable list."""
+
+    __slots__ = ()
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _immutable
+    append = extend = insert = pop = remove = clear = sort = reverse = _immutable
+
+    def __reduce__(self):
+        return (type(self), (list(self),))
+
+
+def freeze(value: Any) -> Any:
+    """
+    Recursively convert dicts and lists to FrozenDict and FrozenList.
+
+    Args:
+        value: Parsed JSON value (or any value)
+
+    Returns:
+        Read-only equivalent of value (other types are returned as they are)
+    """
+    if isinstance(value, dict):
+        return FrozenDict({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return FrozenList([freeze(item) for item in value])
+    return value
+
+
+def parse_read_file(path: str) -> Any:
+    """
+    Parse a file as ``read()`` does.
+
+    Args:
+        path: File path
+
+    Returns:
+        Parsed JSON for .json files, a list of lines for .feature files,
+        the text otherwise
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        if path.endswith('.json'): return json.load(f)
+        if path.endswith('.feature'): return f.readlines()
+        return f.read()
+
+
+class ReadCache:
+    """
+    LRU cache of parsed ``read()`` files, bounded by total file size.
+
+    Files larger than the whole budget are parsed on every read and not
+    cached (nor frozen). The cache can be used from several threads.
+
+    Attributes:
+        max_bytes: Budget, as the sum of the sizes of the cached files
+            (0 disables caching)
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024):
+        """
+        Initialize the cache.
+
+        Args:
+            max_bytes: Maximum total size of the cached files
+        """
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, Tuple[int, int, Any]]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def load(self, path: str, parser: Callable[[str], Any] = parse_read_file) -> Any:
+        """
+        Return the parsed, read-only content of a file.
+
+        Args:
+            path: File path
+            parser: Function parsing the file (only called on a cache miss)
+
+        Returns:
+            Cached (read-only) value, or the freshly parsed value of a file
+            that is not cached
+
+        Raises:
+            OSError: If the file cannot be read
+            Exception: Whatever the parser raises
+        """
+        key = os.path.abspath(path)
+        stat = os.stat(key)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size:
+                self._entries.move_to_end(key)
+                return entry[2]
+
+        value = parser(key)
+        if self.max_bytes and stat.st_size <= self.max_bytes:
+            # Only shared values need to be read-only
+            value = freeze(value)
+            with self._lock:
+                self._evict(key)
+                self._entries[key] = (stat.st_mtime_ns, stat.st_size, value)
+                self._size += stat.st_size
+                while self._size > self.max_bytes:
+                    self._evict(next(iter(self._entries)))
+        return value
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _evict(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._size -= entry[1]
@@ -0,0 +1,102 @@
+"""
+HTTP connection pooling for PyRate Framework.
+
+API steps send their requests through one ``requests.Session`` per host, so
+TCP connections and TLS sessions are kept alive and reused across steps,
+scenarios and data iterations instead of being re-established per request.
+
+Sessions never store cookies: like the module-level ``requests.request``,
+every step only sends the headers and auth configured in the scenario.
+
+Example:
+    >>> pool = SessionPool(pool_size=10)
+    >>> res = pool.request("GET", "https://api.example.com/users/1", timeout=30)
+    >>> pool.close()
+"""
+
+import threading
+from http.cookiejar import DefaultCookiePolicy
+from typing import TYPE_CHECKING, Dict, Tuple
+from urllib.parse import urlsplit
+
+if TYPE_CHECKING:
+    import requests
+
+
+class SessionPool:
+    """
+    Keep-alive ``requests.Session`` objects keyed by scheme and host.
+
+    Attributes:
+        pool_size: Maximum pooled connections kept per host
+    """
+
+    def __init__(self, pool_size: int = 10):
+        """
+        Initialize the session pool.
+
+        Args:
+            pool_size: Maximum pooled connections kept per host
+        """
+        self.pool_size = pool_size
+        self._sessions: Dict[Tuple[str, str], 'requests.Session'] = {}
+        self._lock = threading.Lock()
+
+    def session_for(self, url: str) -> 'requests.Session':
+        """
+        Return the session for the host of a URL, creating it if needed.
+
+        Args:
+            url: Request URL
+
+        Returns:
+            Session bound to the URL's scheme and host
+        """
+        parts = urlsplit(url)
+        key = (parts.scheme.lower(), parts.netloc.lower())
+        session = self._sessions.get(key)
+        if session is None:
+            with self._lock:
+                session = self._sessions.get(key)
+                if session is None:
+                    session = self._new_session()
+                    self._sessions[key] = session
+        return session
+
+    def request(self, method: str, url: str, **kwargs) -> 'requests.Response':
+        """
+        Send a request through the pooled session of its host.
+
+        Args:
+            method: HTTP method
+            url: Request URL
+            **kwargs: Passed to ``requests.Session.request`` (headers, json, auth, verify, timeout...)
+
+        Returns:
+            The response
+        """
+        return self.session_for(url).request(method, url, **kwargs)
+
+    def close(self) -> None:
+        """Close every session and its pooled connections."""
+        with self._lock:
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+        for session in sessions:
+            session.close()
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def _new_session(self) -> 'requests.Session':
+        # requests is imported with the first API request, not at startup
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        session = requests.Session()
+        # Stateless like requests.request(): never carry cookies between steps
+        session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_size)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
@@ -0,0 +1,122 @@
+"""
+Image helpers for PyRate Framework.
+
+Resizes and re-encodes screenshots with Pillow, which is optional: without
+it images are returned unchanged and a warning is logged once.
+
+    pip install pyrate-framework[images]
+
+Example:
+    >>> small = fit_image(png_bytes, max_dimension=1280, image_format="jpeg", quality=70)
+"""
+
+from io import BytesIO
+from typing import Optional
+
+from .logger import log_warning
+
+_pil_missing_warned = False
+
+
+def _import_pil():
+    global _pil_missing_warned
+    try:
+        from PIL import Image
+    except ImportError:
+        if not _pil_missing_warned:
+            log_warning("Pillow no está instalado: las imágenes no se redimensionan (pip install pyrate-framework[images])")
+            _pil_missing_warned = True
+        return None
+    return Image
+
+
+def fit_image(data: bytes, max_dimension: int, image_format: str = "png", quality: int = 80) -> bytes:
+    """
+    Downscale an image so its longest side is at most ``max_dimension``.
+
+    Images already within the limit are returned as they are.
+
+    Args:
+        data: Encoded image (PNG or JPEG)
+        max_dimension: Maximum width/height in pixels
+        image_format: Output format, "png" or "jpeg"
+        quality: JPEG quality (1-100)
+
+    Returns:
+        Encoded image bytes
+    """
+    Image = _import_pil()
+    if Image is None:
+        return data
+    with Image.open(BytesIO(data)) as img:
+        if max(img.size) <= max_dimension:
+            return data
+        img.thumbnail((max_dimension, max_dimension))
+        return encode_image(img, image_format, quality)
+
+
+def fit_width(data: bytes, max_width: int, image_format: str = "jpeg", quality: int = 75) -> bytes:
+    """
+    Downscale an image to at most ``max_width`` pixels wide and re-encode it.
+
+    The re-encoded image is only used when it is smaller than the original.
+
+    Args:
+        data: Encoded image (PNG or JPEG)
+        max_width: Maximum width in pixels (the aspect ratio is kept)
+        image_format: Output format, "png" or "jpeg"
+        quality: JPEG quality (1-100)
+
+    Returns:
+        Encoded image bytes
+    """
+    Image = _import_pil()
+    if Image is None:
+        return data
+    with Image.open(BytesIO(data)) as img:
+        if img.width > max_width:
+            img = img.resize((max_width, max(1, round(img.height * max_width / img.width))), Image.LANCZOS)
+        encoded = encode_image(img, image_format, quality)
+    return encoded if len(encoded) < len(data) else data
+
+
+def make_thumbnail(data: bytes, max_dimension: int = 320, quality: int = 70) -> Optional[bytes]:
+    """
+    Build a small JPEG preview of an image.
+
+    Args:
+        data: Encoded image (PNG or JPEG)
+        max_dimension: Maximum width/height of the preview in pixels
+        quality: JPEG quality (1-100)
+
+    Returns:
+        JPEG bytes, or None if Pillow is not installed
+    """
+    Image = _import_pil()
+    if Image is None:
+        return None
+    with Image.open(BytesIO(data)) as img:
+        img.thumbnail((max_dimension, max_dimension))
+        return encode_image(img, "jpeg", quality)
+
+
+def encode_image(img, image_format: str = "png", quality: int = 80) -> bytes:
+    """
+    Encode a Pillow image as PNG or JPEG.
+
+    Args:
+        img: Pillow image
+        image_format: "png" or "jpeg"
+        quality: JPEG quality (1-100)
+
+    Returns:
+        Encoded image bytes
+    """
+    out = BytesIO()
+    if image_format == "jpeg":
+        if img.mode not in ("RGB", "L"):
+            img = img.convert("RGB")
+        img.save(out, format="JPEG", quality=quality, optimize=True)
+    else:
+        img.save(out, format="PNG", optimize=True)
+    return out.getvalue()
@@ -0,0 +1,142 @@
+"""
+Parallel execution of feature files for PyRate Framework.
+
+Feature files are distributed over a pool of worker processes. Each worker
+owns a single PyRateRunner (and therefore its own browser, launched on first
+use and kept until the worker exits) and writes its evidence into a
+dedicated subfolder; execution logs are sent back to the
+parent and merged, in file order, into one HTML report. The parent also
+streams each file's results to ``results.jsonl`` as they arrive. With
+``evidence_archive``, the workers' archives are merged into one archive in
+the evidence folder once the pool has shut down.
+
+Example:
+    >>> from pyrate.parallel import collect_features, run_parallel
+    >>> files = collect_features("tests/features")
+    >>> log, ok = run_parallel(files, workers=8, tags="@smoke")
+"""
+
+import dataclasses
+import os
+from multiprocessing.util import Finalize
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from .archive import EvidenceArchive, merge_archives
+from .config import PyRateConfig
+from .core import PyRateRunner
+from .logger import log_info
+from .report_generator import generate_report
+from .sinks import ResultStream, write_junit
+
+# Runner owned by the current worker process (set by _init_worker)
+_worker_runner: Optional[PyRateRunner] = None
+
+
+def collect_features(folder: str) -> List[str]:
+    """
+    Find all .feature files below a folder, in a stable order.
+
+    Args:
+        folder: Root folder to walk
+
+    Returns:
+        Sorted list of feature file paths
+    """
+    features = []
+    for root, dirs, files in os.walk(folder):
+        dirs.sort()
+        for file in sorted(files):
+            if file.endswith(".feature"):
+                features.append(os.path.join(root, file))
+    return features
+
+
+def _init_worker(tags: Optional[str], config: PyRateConfig) -> None:
+    """Create the worker's runner (one run per worker) with its own evidence subfolder."""
+    global _worker_runner
+    worker_config = dataclasses.replace(
+        config,
+        evidence_folder=os.path.join(config.evidence_folder, f"worker-{os.getpid()}")
+    )
+    _worker_runner = PyRateRunner(tags=tags, config=worker_config).start_run(report=False)
+    # Close the browser when the pool shuts the worker down
+    Finalize(_worker_runner, _worker_runner.close, exitpriority=10)
+
+
+def _run_feature(file_path: str) -> Tuple[List[Dict[str, Any]], bool, Optional[str]]:
+    """Execute one feature file in the worker and return its log, result and evidence archive."""
+    runner = _worker_runner
+    runner.execution_log = []
+    runner.is_success = True
+    runner.execute_file(file_path, report=False)
+    # The file's evidence is complete by the time its log reaches the parent;
+    # a file that could not be written fails the feature
+    runner.flush_evidence()
+    return runner.execution_log, runner.is_success, runner.evidence_gen.archive_path
+
+
+def run_parallel(
+    files: Sequence[str],
+    workers: int,
+    tags: Optional[str] = None,
+    config: Optional[PyRateConfig] = None,
+    report: bool = True
+) -> Tuple[List[Dict[str, Any]], bool]:
+    """
+    Execute feature files over a pool of worker processes.
+
+    Args:
+        files: Feature files to execute
+        workers: Number of worker processes
+        tags: Optional tag filter (e.g. "@smoke")
+        config: Configuration shared by all workers (defaults if None)
+        report: Generate the merged HTML report at the end
+
+    Returns:
+        Tuple of (merged execution log, overall success)
+    """
+    config = config if config is not None else PyRateConfig()
+    workers = max(1, min(workers, len(files))) if files else 1
+    log_info(f"🚀 Ejecución paralela: {len(files)} features en {workers} procesos")
+
+    results = None
+    if report and config.results_jsonl:
+        results = ResultStream(os.path.join(config.reports_folder, "results.jsonl"))
+
+    execution_log: List[Dict[str, Any]] = []
+    is_success = True
+    archives = []
+    try:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(tags, config)) as pool:
+            # map() yields results in submission order, so the merged log is deterministic
+            for file_log, file_success, archive in pool.map(_run_feature, files):
+                if archive and archive not in archives:
+                    archives.append(archive)
+                execution_log.extend(file_log)
+                is_success = is_success and file_success
+                if results is not None:
+                    results.extend(file_log)
+    finally:
+        if results is not None:
+            results.close()
+        if archives:
+            # Workers close their archives when they exit, i.e. when the pool has shut down
+            _merge_worker_archives(archives, config.evidence_folder)
+
+    if report and execution_log:
+        generate_report(execution_log, is_success, config.reports_folder, config.report_paged_threshold)
+        if config.results_junit:
+            write_junit(execution_log, os.path.join(config.reports_folder, "junit.xml"))
+    return execution_log, is_success
+
+
+def _merge_worker_archives(paths: List[str], evidence_folder: str) -> Optional[str]:
+    """Merge the archives written by this run's workers into one archive of the run."""
+    path = merge_archives(paths, EvidenceArchive.for_run(evidence_folder).path)
+    for folder in {os.path.dirname(p) for p in paths}:
+        if not os.listdir(folder):
+            os.rmdir(folder)
+    if path:
+        log_info(f"🗜️ Evidencias de {len(paths)} procesos archivadas en: {path}")
+    return path
@@ -0,0 +1,288 @@
+"""
+Feature execution plans for PyRate Framework.
+
+A ``.feature`` file is parsed once into an immutable :class:`FeaturePlan`
+(scenarios, tags, steps with their verb and description already split out)
+and cached in memory, and optionally on disk, keyed by the file's content
+hash. Repeated ``execute_file`` calls and ``call read()`` of shared
+sub-features reuse the compiled plan instead of re-parsing the file.
+
+Example:
+    >>> cache = PlanCache(cache_folder=".pyrate_cache")
+    >>> plan = cache.load("tests/features/login.feature")
+    >>> [sc.name for sc in plan.scenarios]
+    ['Login OK', 'Login KO']
+"""
+
+import hashlib
+import os
+import pickle
+import re
+import threading
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, Iterable, Optional, Sequence, Tuple, Union
+
+from .template import Template, compile_template
+
+# Bump when the pickled plan layout changes so stale disk entries are ignored
+PLAN_FORMAT_VERSION = 2
+
+_TAG_LINE = re.compile(r'^#?\s*@')
+_TAG_COMMENT = re.compile(r'^#\s*@')
+_DATA_SOURCE = re.compile(r'Data source: (.*)', re.IGNORECASE)
+# Same keyword/verb split as steps.step_verb, plus the remaining arguments
+_STEP_PARTS = re.compile(r'^\*?\s*(?:(given|and|when|then)\s+)?(\S+)\s*(.*)$', re.IGNORECASE)
+
+
+@dataclass(frozen=True)
+class StepPlan:
+    """
+    A single executable step.
+
+    Attributes:
+        text: Step line as written (variables not yet injected)
+        description: Descriptive comment preceding the step, if any
+        keyword: Gherkin keyword ("Given", "And", ...) or None
+        verb: Lowercase command verb used for registry dispatch
+        arguments: Text following the verb
+        template: Tokenized text used to inject #(name) variables
+    """
+    text: str
+    description: Optional[str] = None
+    keyword: Optional[str] = None
+    verb: Optional[str] = None
+    arguments: str = ""
+    template: Optional[Template] = None
+
+
+@dataclass(frozen=True)
+class ScenarioPlan:
+    """
+    A scenario with its normalized tags and compiled steps.
+
+    Attributes:
+        name: Scenario name ("Default" when the file has no Scenario:)
+        tags: Tag lines without '#' and '@' (e.g. "smoke")
+        steps: Compiled steps in execution order
+    """
+    name: str
+    tags: Tuple[str, ...]
+    steps: Tuple[StepPlan, ...]
+
+
+@dataclass(frozen=True)
+class FeaturePlan:
+    """
+    Compiled feature file.
+
+    Attributes:
+        scenarios: Scenarios in file order
+        data_source: Path from a "Data source:" line, if declared
+        tags: Union of all scenario tags
+    """
+    scenarios: Tuple[ScenarioPlan, ...]
+    data_source: Optional[str] = None
+    tags: FrozenSet[str] = frozenset()
+
+
+def compile_step(line: str, description: Optional[str] = None) -> StepPlan:
+    """
+    Split a command line into keyword, verb and arguments.
+
+    Args:
+        line: Stripped step line
+        description: Optional descriptive comment for the step
+
+    Returns:
+        StepPlan for the line
+    """
+    template = compile_template(line)
+    match = _STEP_PARTS.match(line)
+    if not match:
+        return StepPlan(text=line, description=description, template=template)
+    return StepPlan(
+        text=line,
+        description=description,
+        keyword=match.group(1),
+        verb=match.group(2).lower(),
+        arguments=match.group(3).strip(),
+        template=template,
+    )
+
+
+def compile_steps(lines: Iterable[str]) -> Tuple[StepPlan, ...]:
+    """
+    Compile raw scenario lines into steps.
+
+    Empty lines and tags (``@smoke``, ``# @smoke``) are skipped. Any other
+    comment becomes the description of the next command; when several
+    comments precede a command only the last one is kept.
+
+    Args:
+        lines: Raw lines of a scenario
+
+    Returns:
+        Tuple of StepPlan
+    """
+    steps = []
+    pending_description = None
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith('@'):
+            continue
+        if line.startswith('#'):
+            if not _TAG_COMMENT.match(line):
+                pending_description = line[1:].strip()
+            continue
+        steps.append(compile_step(line, pending_description or None))
+        pending_description = None
+    return tuple(steps)
+
+
+def _normalize_tag(tag: str) -> str:
+    return tag.replace('#', '').replace('@', '').strip()
+
+
+def parse_feature(lines: Sequence[str]) -> FeaturePlan:
+    """
+    Parse feature lines into a FeaturePlan.
+
+    Args:
+        lines: Lines of a .feature file
+
+    Returns:
+        Compiled FeaturePlan
+    """
+    data_source = None
+    for line in lines[:10]:
+        if match := _DATA_SOURCE.match(line):
+            data_source = match.group(1).strip().strip("'").strip('"')
+            break
+
+    raw_scenarios = []
+    current_sc = {'name': 'Default', 'tags': [], 'steps': []}
+    current_tags = []
+    found_kw = False
+    for line in lines:
+        raw = line.strip()
+        if not raw or raw.lower().startswith("data source:"): continue
+        if _TAG_LINE.match(raw):
+            current_tags.append(raw.replace('#', '').strip())
+            continue
+        if raw.lower().startswith("scenario:"):
+            if found_kw: raw_scenarios.append(current_sc)
+            found_kw = True
+            current_sc = {'name': raw.split(":", 1)[1].strip(), 'tags': current_tags, 'steps': []}
+            current_tags = []
+            continue
+        current_sc['steps'].append(raw)
+    if current_sc['steps']: raw_scenarios.append(current_sc)
+
+    scenarios = tuple(
+        ScenarioPlan(
+            name=sc['name'],
+            tags=tuple(_normalize_tag(t) for t in sc['tags']),
+            steps=compile_steps(sc['steps']),
+        )
+        for sc in raw_scenarios
+    )
+    all_tags = frozenset(t for sc in scenarios for t in sc.tags)
+    return FeaturePlan(scenarios=scenarios, data_source=data_source, tags=all_tags)
+
+
+class PlanCache:
+    """
+    In-memory (and optional on-disk) cache of compiled feature plans.
+
+    Entries are validated with the file's mtime and size; when those change
+    the content is re-hashed, so touching a file without editing it does
+    not trigger a re-parse. Disk entries are named by content hash and are
+    shared by every process pointing at the same cache folder.
+
+    Attributes:
+        cache_folder: Directory for pickled plans, or None for memory only
+    """
+
+    def __init__(self, cache_folder: Optional[str] = None):
+        """
+        Initialize the plan cache.
+
+        Args:
+            cache_folder: Directory for the on-disk cache (disabled if None)
+        """
+        self.cache_folder = cache_folder
+        self._entries: Dict[str, Tuple[int, int, str, FeaturePlan]] = {}
+        self._lock = threading.Lock()
+        if self.cache_folder:
+            os.makedirs(self.cache_folder, exist_ok=True)
+
+    def load(self, file_path: Union[str, os.PathLike]) -> FeaturePlan:
+        """
+        Return the compiled plan for a feature file.
+
+        Args:
+            file_path: Path to the .feature file
+
+        Returns:
+            Cached or freshly compiled FeaturePlan
+
+        Raises:
+            OSError: If the file cannot be read
+        """
+        key = os.path.abspath(file_path)
+        stat = os.stat(key)
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry and entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size:
+            return entry[3]
+
+        with open(key, 'rb') as f:
+            content = f.read()
+        digest = hashlib.sha256(content).hexdigest()
+
+        if entry and entry[2] == digest:
+            plan = entry[3]
+        else:
+            plan = self._load_from_disk(digest)
+            if plan is None:
+                plan = parse_feature(content.decode('utf-8').splitlines(keepends=True))
+                self._save_to_disk(digest, plan)
+
+        with self._lock:
+            self._entries[key] = (stat.st_mtime_ns, stat.st_size, digest, plan)
+        return plan
+
+    def clear(self) -> None:
+        """Drop all in-memory entries (disk entries are kept)."""
+        with self._lock:
+            self._entries.clear()
+
+    def _disk_path(self, digest: str) -> str:
+        return os.path.join(self.cache_folder, f"{digest}.v{PLAN_FORMAT_VERSION}.plan")
+
+    def _load_from_disk(self, digest: str) -> Optional[FeaturePlan]:
+        if not self.cache_folder:
+            return None
+        try:
+            with open(self._disk_path(digest), 'rb') as f:
+                plan = pickle.load(f)
+            return plan if isinstance(plan, FeaturePlan) else None
+        except Exception:
+            # Missing or unreadable entry: fall back to parsing
+            return None
+
+    def _save_to_disk(self, digest: str, plan: FeaturePlan) -> None:
+        if not self.cache_folder:
+            return
+        path = self._disk_path(digest)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(plan, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+        except OSError:
+            # The disk cache is an optimization; never fail a run because of it
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
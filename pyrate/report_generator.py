@@ -6,26 +6,56 @@ screenshots, and iteration grouping for data-driven tests.
 """
 
 import os
+import shutil
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, TextIO, Tuple
 import traceback
 import json
 from collections import defaultdict
 
+from .artifacts import ArtifactStore, report_screenshot, response_data
+from .imaging import make_thumbnail
 
-def generate_report(execution_log: List[Dict[str, Any]], is_success: bool) -> None:
+
+# Logs with more steps than this get the paged viewer instead of static cards
+PAGED_REPORT_THRESHOLD = 5000
+
+
+def generate_report(
+    execution_log: List[Dict[str, Any]],
+    is_success: bool,
+    output_folder: str = "reports",
+    paged_threshold: int = PAGED_REPORT_THRESHOLD
+) -> Optional[str]:
     """
     Generate interactive HTML report from execution log.
     
     Creates a beautiful, interactive HTML dashboard with:
     - Execution metrics (pass/fail counts, success rate)
     - Steps grouped by iteration (for data-driven tests)
-    - Screenshots embedded in collapsible sections
+    - Screenshot thumbnails (lazy-loaded) linking to the full image
     - Color-coded pass/fail indicators
+
+    The dashboard is streamed to disk one iteration card at a time, so memory
+    use does not grow with the size of the HTML. The timestamped report is
+    then hard-linked (or copied) to ``ultimo_reporte.html``. Screenshots are
+    not embedded: they are written to ``<output_folder>/screenshots/`` (or
+    referenced in the artifact store) with a JPEG thumbnail next to them.
+
+    Logs with more than ``paged_threshold`` steps get a paged viewer: the
+    steps are written to a ``report_<timestamp>.data.js`` sidecar and the
+    page renders one page of Test Cases at a time, with filters by status,
+    scenario and tag.
     
     Args:
         execution_log: List of step execution records
         is_success: Overall execution success status
+        output_folder: Directory for the report files (default: "reports")
+        paged_threshold: Step count above which the paged viewer is used
+            (0 always uses it)
+
+    Returns:
+        Path of the timestamped report, or None if it could not be written
         
     Example:
         >>> log = [
@@ -38,8 +68,7 @@ def generate_report(execution_log: List[Dict[str, Any]], is_success: bool) -> No
 
     try:
         # 1. Crear directorio
-        if not os.path.exists("reports"):
-            os.makedirs("reports")
+        os.makedirs(output_folder, exist_ok=True)
 
         # 2. Métricas y Datos Generales
         now = datetime.now()
@@ -56,17 +85,11 @@ def generate_report(execution_log: List[Dict[str, Any]], is_success: bool) -> No
         # MÉTRICAS POR TEST CASES (NO POR PASOS)
         # ========================================
         total_test_cases = len(iterations_map)
-        passed_test_cases = 0
-        failed_test_cases = 0
-        
-        # Contar test cases exitosos y fallidos
-        for it_num, steps in iterations_map.items():
-            # Un test case FALLA si CUALQUIER paso falla
-            has_failure = any(s.get('status') == 'FAIL' for s in steps)
-            if has_failure:
-                failed_test_cases += 1
-            else:
-                passed_test_cases += 1
+        # Un test case FALLA si CUALQUIER paso falla
+        failed_test_cases = sum(
+            1 for steps in iterations_map.values() if any(s.get('status') == 'FAIL' for s in steps)
+        )
+        passed_test_cases = total_test_cases - failed_test_cases
         
         # Calcular efectividad por test cases
         success_rate = round((passed_test_cases / total_test_cases) * 100, 2) if total_test_cases > 0 else 0
@@ -78,74 +101,13 @@ def generate_report(execution_log: List[Dict[str, Any]], is_success: bool) -> No
         passed_steps = sum(1 for s in execution_log if s.get('status') != 'FAIL')
         failed_steps = total_steps - passed_steps
 
-        # 4. Construcción del HTML por Test Cases
-        iterations_html = ""
-
-        for it_num, steps in sorted(iterations_map.items()):
-            # Verificamos si esta iteración tuvo fallos para pintar el borde rojo o verde
-            it_has_fail = any(s['status'] == 'FAIL' for s in steps)
-            it_color = "#e74c3c" if it_has_fail else "#27ae60"
-            it_icon = "❌" if it_has_fail else "✅"
-            it_status = "FALLIDO" if it_has_fail else "EXITOSO"  # <-- AÑADIDO
-
-            # Tabla interna de la iteración
-            rows_html = ""
-            for i, step in enumerate(steps):
-                status_badge = '<span class="badge bg-pass">PASS</span>'
-                row_class = ""
-                if step['status'] == 'FAIL':
-                    status_badge = '<span class="badge bg-fail">FAIL</span>'
-                    row_class = "row-fail"
-
-                details_html = ""
-                if step.get('error'):
-                    details_html += f'<div class="error-msg">❌ {step["error"]}</div>'
-
-                if step.get('response_data'):
-                    content = str(step['response_data'])
-                    if "<html" in content or "<!DOCTYPE" in content:
-                        content = content.replace("<", "&lt;").replace(">", "&gt;")
-                    details_html += f"<details><summary>📦 Ver Datos</summary><pre>{content}</pre></details>"
-
-                if step.get('screenshot'):
-                    details_html += f"<div class='screenshot-box'><details><summary>📷 Ver Captura</summary><img src='data:image/png;base64,{step['screenshot']}' /></details></div>"
-
-                rows_html += f"""
-                <tr class="{row_class}">
-                    <td style="text-align: center;">{i + 1}</td>
-                    <td>{step['name']}</td>
-                    <td style="text-align: center;">{status_badge}</td>
-                    <td>{details_html}</td>
-                </tr>
-                """
-
-            # Bloque HTML del Test Case Completo
-            iterations_html += f"""
-            <div class="iteration-card" style="border-left: 5px solid {it_color};">
-                <div class="iteration-header">
-                    <h3>{it_icon} Test Case #{it_num} - {it_status}</h3>
-                    <span class="step-count">{len(steps)} pasos</span>
-                </div>
-                <div class="table-container">
-                    <table>
-                        <thead>
-                            <tr>
-                                <th style="width: 5%">#</th>
-                                <th style="width: 40%">Paso</th>
-                                <th style="width: 10%; text-align: center;">Estado</th>
-                                <th style="width: 45%">Datos</th>
-                            </tr>
-                        </thead>
-                        <tbody>
-                            {rows_html}
-                        </tbody>
-                    </table>
-                </div>
-            </div>
-            """
-
-        # 5. Plantilla HTML Final
-        html_content = f"""
+        # 4. Escritura en streaming: cabecera, una tarjeta por Test Case (o datos paginados) y pie
+        paged = total_steps > paged_threshold
+        filename = os.path.join(output_folder, f"report_{timestamp}.html")
+        latest_filename = os.path.join(output_folder, "ultimo_reporte.html")
+        screenshots = ArtifactStore(os.path.join(output_folder, "screenshots"))
+        with open(filename, "w", encoding="utf-8") as f:
+            f.write(f"""
         <!DOCTYPE html>
         <html lang="es">
         <head>
@@ -184,12 +146,15 @@ def generate_report(execution_log: List[Dict[str, Any]], is_success: bool) -> No
 
                 .bg-pass {{ background: var(--success); }} .bg-fail {{ background: var(--fail); }}
                 details {{ margin-top: 5px; }} summary {{ color: #3498db; font-weight: 600; cursor: pointer; }}
+                .screenshot-box .thumb {{ max-width: 240px; margin-top: 5px; border: 1px solid #ddd; border-radius: 5px; cursor: zoom-in; }}
                 pre {{ background: #2d3436; color: #dfe6e9; padding: 10px; border-radius: 5px; overflow-x: auto; max-height: 300px; font-size: 0.8rem; margin-top: 5px; }}
                 
                 /* FILTER BUTTONS */
                 .filter-btn {{ background: white; border: 2px solid #ddd; padding: 8px 16px; border-radius: 20px; cursor: pointer; font-size: 0.9rem; transition: all 0.3s; }}
                 .filter-btn:hover {{ background: #f8f9fa; border-color: #bbb; }}
                 .filter-btn.active {{ background: var(--primary); color: white; border-color: var(--primary); }}
+                .filter-select {{ border: 2px solid #ddd; padding: 6px 10px; border-radius: 20px; font-size: 0.9rem; background: white; }}
+                .pager {{ display: flex; gap: 10px; align-items: center; justify-content: center; margin: 20px 0; }}
             </style>
         </head>
         <body>
@@ -214,6 +179,14 @@ def generate_report(execution_log: List[Dict[str, Any]], is_success: bool) -> No
                     </div>
                 </div>
 
+""")
+            if paged:
+                data_file = f"report_{timestamp}.data.js"
+                _write_report_data(os.path.join(output_folder, data_file), iterations_map, screenshots, output_folder)
+                f.write(_PAGED_BODY.format(data_file=data_file, total_test_cases=total_test_cases,
+                                           passed_test_cases=passed_test_cases, failed_test_cases=failed_test_cases))
+            else:
+                f.write(f"""
                 <!-- Filtros -->
                 <div style="background: white; padding: 15px 20px; border-radius: 10px; margin-bottom: 20px; box-shadow: 0 2px 5px rgba(0,0,0,0.05); display: flex; gap: 15px; align-items: center;">
                     <span style="font-weight: 600; color: #2c3e50;">🔍 Filtrar:</span>
@@ -224,7 +197,10 @@ def generate_report(execution_log: List[Dict[str, Any]], is_success: bool) -> No
 
                 <h2 style="color: #2c3e50; border-bottom: 2px solid #eee; padding-bottom: 10px;">Detalle por Test Case</h2>
 
-                {iterations_html}
+""")
+                for it_num, steps in sorted(iterations_map.items()):
+                    _write_iteration_card(f, it_num, steps, screenshots, output_folder)
+            f.write(f"""
 
             </div>
 
@@ -267,8 +243,10 @@ def generate_report(execution_log: List[Dict[str, Any]], is_success: bool) -> No
                     }}
                 }});
 
+""")
+            f.write(_PAGED_SCRIPT if paged else """
                 // Filtros
-                function filterIterations(type) {{
+                function filterIterations(type) {
                     const cards = document.querySelectorAll('.iteration-card');
                     const buttons = document.querySelectorAll('.filter-btn');
                     
@@ -278,34 +256,367 @@ def generate_report(execution_log: List[Dict[str, Any]], is_success: bool) -> No
                     // Add active to clicked button
                     document.getElementById('btn-' + type).classList.add('active');
                     
-                    cards.forEach(card => {{
-                        if (type === 'all') {{
+                    cards.forEach(card => {
+                        if (type === 'all') {
                             card.style.display = 'block';
-                        }} else if (type === 'pass') {{
+                        } else if (type === 'pass') {
                             // Show only cards with green border (all passed)
                             const borderColor = card.style.borderLeftColor;
                             card.style.display = borderColor.includes('39, 174, 96') ? 'block' : 'none';
-                        }} else if (type === 'fail') {{
+                        } else if (type === 'fail') {
                             // Show only cards with red border (has failures)
                             const borderColor = card.style.borderLeftColor;
                             card.style.display = borderColor.includes('231, 76, 60') ? 'block' : 'none';
-                        }}
-                    }});
-                }}
+                        }
+                    });
+                }
+""")
+            f.write("""
             </script>
         </body>
         </html>
-        """
+""")
 
-        # 6. Guardar archivos
-        filename = f"reports/report_{timestamp}.html"
-        latest_filename = "reports/ultimo_reporte.html"
-        with open(filename, "w", encoding="utf-8") as f:
-            f.write(html_content)
-        with open(latest_filename, "w", encoding="utf-8") as f:
-            f.write(html_content)
+        # 5. "Último reporte" sin volver a escribir el HTML
+        _link_or_copy(filename, latest_filename)
         print("\n✅ REPORTE AGRUPADO GENERADO CORRECTAMENTE.")
+        return filename
 
     except Exception as e:
         print("\n❌ ERROR GENERANDO REPORTE:")
-        traceback.print_exc()
\ No newline at end of file
+        traceback.print_exc()
+        return None
+
+
+_PAGED_BODY = """
+                <!-- Filtros -->
+                <div style="background: white; padding: 15px 20px; border-radius: 10px; margin-bottom: 20px; box-shadow: 0 2px 5px rgba(0,0,0,0.05); display: flex; flex-wrap: wrap; gap: 15px; align-items: center;">
+                    <span style="font-weight: 600; color: #2c3e50;">🔍 Filtrar:</span>
+                    <button onclick="setStatus('all')" class="filter-btn active" id="btn-all">Todos ({total_test_cases})</button>
+                    <button onclick="setStatus('pass')" class="filter-btn" id="btn-pass">✅ Exitosos ({passed_test_cases})</button>
+                    <button onclick="setStatus('fail')" class="filter-btn" id="btn-fail">❌ Fallidos ({failed_test_cases})</button>
+                    <select id="filter-scenario" class="filter-select" onchange="setFilter('scenario', this.value)"><option value="">Todos los escenarios</option></select>
+                    <select id="filter-tag" class="filter-select" onchange="setFilter('tag', this.value)"><option value="">Todos los tags</option></select>
+                </div>
+
+                <h2 style="color: #2c3e50; border-bottom: 2px solid #eee; padding-bottom: 10px;">Detalle por Test Case</h2>
+
+                <div id="cases"></div>
+                <div class="pager">
+                    <button class="filter-btn" onclick="setPage(-1)">◀</button>
+                    <span id="page-info"></span>
+                    <button class="filter-btn" onclick="setPage(1)">▶</button>
+                    <select id="page-size" class="filter-select" onchange="setFilter('size', Number(this.value))">
+                        <option>25</option><option selected>50</option><option>100</option><option>500</option>
+                    </select>
+                </div>
+                <script src="{data_file}"></script>
+"""
+
+# Client-side viewer for window.PYRATE_REPORT (see _write_report_data)
+_PAGED_SCRIPT = """
+                // Visor paginado
+                const CASES = window.PYRATE_REPORT || [];
+                const state = { status: 'all', scenario: '', tag: '', size: 50, page: 0 };
+
+                function esc(value) {
+                    return String(value).replace(/[&<>"']/g, c => ({'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;'}[c]));
+                }
+
+                function stepMatches(step) {
+                    return (!state.scenario || step[6] === state.scenario) && (!state.tag || step[7].includes(state.tag));
+                }
+
+                function visibleCases() {
+                    return CASES.filter(c =>
+                        (state.status === 'all' || (state.status === 'fail') === c.fail) &&
+                        (!state.scenario || c.scenarios.includes(state.scenario)) &&
+                        (!state.tag || c.tags.includes(state.tag)));
+                }
+
+                function renderStep(step, i) {
+                    const [name, status, error, data, full, thumb] = step;
+                    let details = '';
+                    if (error) details += '<div class="error-msg">❌ ' + esc(error) + '</div>';
+                    if (data) details += '<details><summary>📦 Ver Datos</summary><pre>' + esc(data) + '</pre></details>';
+                    if (full) details += "<div class='screenshot-box'><a href='" + esc(full) + "' target='_blank' title='📷 Ver Captura'><img class='thumb' src='" + esc(thumb) + "' loading='lazy' alt='Captura' /></a></div>";
+                    const badge = status === 'FAIL' ? '<span class="badge bg-fail">FAIL</span>' : '<span class="badge bg-pass">PASS</span>';
+                    return '<tr class="' + (status === 'FAIL' ? 'row-fail' : '') + '"><td style="text-align: center;">' + (i + 1) +
+                        '</td><td>' + esc(name) + '</td><td style="text-align: center;">' + badge + '</td><td>' + details + '</td></tr>';
+                }
+
+                function renderCase(c) {
+                    const steps = c.steps.filter(stepMatches);
+                    const color = c.fail ? '#e74c3c' : '#27ae60';
+                    return '<div class="iteration-card" style="border-left: 5px solid ' + color + ';"><div class="iteration-header"><h3>' +
+                        (c.fail ? '❌' : '✅') + ' Test Case #' + esc(c.n) + ' - ' + (c.fail ? 'FALLIDO' : 'EXITOSO') +
+                        '</h3><span class="step-count">' + steps.length + ' pasos</span></div><div class="table-container"><table><thead><tr>' +
+                        '<th style="width: 5%">#</th><th style="width: 40%">Paso</th><th style="width: 10%; text-align: center;">Estado</th><th style="width: 45%">Datos</th>' +
+                        '</tr></thead><tbody>' + steps.map(renderStep).join('') + '</tbody></table></div></div>';
+                }
+
+                function render() {
+                    const cases = visibleCases();
+                    const pages = Math.max(1, Math.ceil(cases.length / state.size));
+                    state.page = Math.min(Math.max(state.page, 0), pages - 1);
+                    const start = state.page * state.size;
+                    document.getElementById('cases').innerHTML = cases.slice(start, start + state.size).map(renderCase).join('');
+                    document.getElementById('page-info').textContent = 'Página ' + (state.page + 1) + ' de ' + pages + ' (' + cases.length + ' test cases)';
+                }
+
+                function setStatus(type) {
+                    document.querySelectorAll('[id^="btn-"]').forEach(btn => btn.classList.remove('active'));
+                    document.getElementById('btn-' + type).classList.add('active');
+                    setFilter('status', type);
+                }
+
+                function setFilter(name, value) {
+                    state[name] = value;
+                    state.page = 0;
+                    render();
+                }
+
+                function setPage(delta) {
+                    state.page += delta;
+                    render();
+                    window.scrollTo(0, document.getElementById('cases').offsetTop);
+                }
+
+                function fillSelect(id, values) {
+                    const select = document.getElementById(id);
+                    [...new Set(values)].sort().forEach(v => select.add(new Option(v, v)));
+                }
+
+                fillSelect('filter-scenario', CASES.flatMap(c => c.scenarios));
+                fillSelect('filter-tag', CASES.flatMap(c => c.tags));
+                render();
+"""
+
+
+def _write_report_data(
+    path: str,
+    iterations_map: Dict[Any, List[Dict[str, Any]]],
+    screenshots: ArtifactStore,
+    output_folder: str
+) -> None:
+    """
+    Stream the Test Cases of a paged report to its JavaScript sidecar.
+
+    The sidecar assigns ``window.PYRATE_REPORT`` (a script, unlike a JSON
+    file, also loads from ``file://``). Each Test Case is one compact JSON
+    object per line; its steps are arrays of
+    ``[name, status, error, data, full image, thumbnail, scenario, tags]``.
+    """
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("window.PYRATE_REPORT = [\n")
+        for n, (it_num, steps) in enumerate(sorted(iterations_map.items())):
+            rows = []
+            for step in steps:
+                links = _screenshot_links(step, screenshots, output_folder) or (None, None)
+                data = response_data(step) if step.get('response_data') else None
+                rows.append([
+                    step['name'], step['status'], step.get('error'),
+                    str(data) if data is not None else None, links[0], links[1],
+                    step.get('scenario'), step.get('tags') or []
+                ])
+            case = {
+                "n": it_num,
+                "fail": any(s['status'] == 'FAIL' for s in steps),
+                "scenarios": sorted({row[6] for row in rows if row[6]}),
+                "tags": sorted({tag for row in rows for tag in row[7]}),
+                "steps": rows,
+            }
+            if n:
+                f.write(",\n")
+            f.write(json.dumps(case, ensure_ascii=False, separators=(",", ":"), default=str))
+        f.write("\n];\n")
+
+
+def _write_iteration_card(
+    f: TextIO,
+    it_num: Any,
+    steps: List[Dict[str, Any]],
+    screenshots: ArtifactStore,
+    output_folder: str
+) -> None:
+    """Write the card of one Test Case (iteration) and its step rows."""
+    # Verificamos si esta iteración tuvo fallos para pintar el borde rojo o verde
+    it_has_fail = any(s['status'] == 'FAIL' for s in steps)
+    it_color = "#e74c3c" if it_has_fail else "#27ae60"
+    it_icon = "❌" if it_has_fail else "✅"
+    it_status = "FALLIDO" if it_has_fail else "EXITOSO"
+
+    f.write(f"""
+            <div class="iteration-card" style="border-left: 5px solid {it_color};">
+                <div class="iteration-header">
+                    <h3>{it_icon} Test Case #{it_num} - {it_status}</h3>
+                    <span class="step-count">{len(steps)} pasos</span>
+                </div>
+                <div class="table-container">
+                    <table>
+                        <thead>
+                            <tr>
+                                <th style="width: 5%">#</th>
+                                <th style="width: 40%">Paso</th>
+                                <th style="width: 10%; text-align: center;">Estado</th>
+                                <th style="width: 45%">Datos</th>
+                            </tr>
+                        </thead>
+                        <tbody>
+""")
+    for i, step in enumerate(steps):
+        f.write(_render_step_row(i, step, screenshots, output_folder))
+    f.write("""
+                        </tbody>
+                    </table>
+                </div>
+            </div>
+""")
+
+
+def _render_step_row(i: int, step: Dict[str, Any], screenshots: ArtifactStore, output_folder: str) -> str:
+    """Render the table row of one step."""
+    status_badge = '<span class="badge bg-pass">PASS</span>'
+    row_class = ""
+    if step['status'] == 'FAIL':
+        status_badge = '<span class="badge bg-fail">FAIL</span>'
+        row_class = "row-fail"
+
+    details_html = ""
+    if step.get('error'):
+        details_html += f'<div class="error-msg">❌ {step["error"]}</div>'
+
+    if step.get('response_data'):
+        content = str(response_data(step))
+        if "<html" in content or "<!DOCTYPE" in content:
+            content = content.replace("<", "&lt;").replace(">", "&gt;")
+        details_html += f"<details><summary>📦 Ver Datos</summary><pre>{content}</pre></details>"
+
+    links = _screenshot_links(step, screenshots, output_folder)
+    if links:
+        full, thumb = links
+        details_html += f"<div class='screenshot-box'><a href='{full}' target='_blank' title='📷 Ver Captura'><img class='thumb' src='{thumb}' loading='lazy' alt='Captura' /></a></div>"
+
+    return f"""
+                <tr class="{row_class}">
+                    <td style="text-align: center;">{i + 1}</td>
+                    <td>{step['name']}</td>
+                    <td style="text-align: center;">{status_badge}</td>
+                    <td>{details_html}</td>
+                </tr>
+"""
+
+
+def _screenshot_links(step: Dict[str, Any], screenshots: ArtifactStore, output_folder: str) -> Optional[Tuple[str, str]]:
+    """
+    Files of a step's report screenshot, as URLs relative to the report.
+
+    The full image is reused from the artifact store when the step was
+    spilled, otherwise written to the report's screenshot store. The
+    thumbnail is generated once per image (the full image is used when
+    Pillow is not installed).
+
+    Returns:
+        Tuple of (full image URL, thumbnail URL), or None without screenshot
+    """
+    ref = step.get('screenshot_ref') if step.get('status') == 'FAIL' else None
+    if ref and os.path.exists(ref):
+        full_path = ref
+        image = None
+    else:
+        image = report_screenshot(step)
+        if image is None:
+            return None
+        extension = ".jpg" if step.get('screenshot_type') == "image/jpeg" else ".png"
+        full_path = screenshots.put(image, extension)
+
+    name = os.path.splitext(os.path.basename(full_path))[0]
+    thumb_path = os.path.join(screenshots.folder, "thumbs", f"{name}.jpg")
+    if not os.path.exists(thumb_path):
+        try:
+            thumbnail = make_thumbnail(image if image is not None else report_screenshot(step))
+        except Exception:
+            thumbnail = None  # Unreadable image: the browser gets the full file
+        if thumbnail is None:
+            thumb_path = full_path
+        else:
+            os.makedirs(os.path.dirname(thumb_path), exist_ok=True)
+            tmp_path = f"{thumb_path}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(thumbnail)
+            os.replace(tmp_path, thumb_path)
+
+    def url(path):
+        return os.path.relpath(path, output_folder).replace(os.sep, "/")
+    return url(full_path), url(thumb_path)
+
+
+def _link_or_copy(source: str, target: str) -> None:
+    """Point target at source's content: hard link when possible, copy otherwise."""
+    tmp_target = f"{target}.{os.getpid()}.tmp"
+    try:
+        os.link(source, tmp_target)
+    except OSError:
+        shutil.copyfile(source, tmp_target)
+    os.replace(tmp_target, target)
+
+
+class ReportCheckpoint:
+    """
+    Append-only JSON Lines copy of the execution log, written during a run.
+
+    Each call to :meth:`append` writes only the step records added since the
+    previous call, so results of finished feature files survive a crash
+    without re-rendering the report. Screenshot bytes are not written
+    (base64 captures of failing steps and artifact references are).
+
+    Example:
+        >>> checkpoint = ReportCheckpoint("reports/checkpoint.jsonl")
+        >>> checkpoint.append(runner.execution_log)
+        >>> generate_report(load_checkpoint("reports/checkpoint.jsonl"), is_success=False)
+    """
+
+    def __init__(self, path: str):
+        """
+        Start a new checkpoint file, replacing any previous one.
+
+        Args:
+            path: Checkpoint file path
+        """
+        self.path = path
+        self._written = 0
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        open(path, "w", encoding="utf-8").close()
+
+    def append(self, execution_log: List[Dict[str, Any]]) -> int:
+        """
+        Append the records not yet written.
+
+        Args:
+            execution_log: The runner's cumulative log
+
+        Returns:
+            Number of records appended
+        """
+        new_records = execution_log[self._written:]
+        if new_records:
+            with open(self.path, "a", encoding="utf-8") as f:
+                for record in new_records:
+                    line = {k: v for k, v in record.items() if k != 'screenshot_bytes'}
+                    f.write(json.dumps(line, ensure_ascii=False, default=str) + "\n")
+            self._written = len(execution_log)
+        return len(new_records)
+
+
+def load_checkpoint(path: str) -> List[Dict[str, Any]]:
+    """
+    Read the step records of a checkpoint file.
+
+    Args:
+        path: File written by ReportCheckpoint
+
+    Returns:
+        Execution log usable with generate_report()
+    """
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
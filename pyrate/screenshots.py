@@ -0,0 +1,144 @@
+"""
+Screenshot capture policy for PyRate Framework.
+
+Decides after which UI steps a screenshot is taken and how it is encoded.
+
+Modes:
+    - ``off``: never capture
+    - ``failures``: only the failing step
+    - ``all``: every step (the historical behaviour)
+    - ``every_n``: every ``every``-th step of a scenario, plus failures
+    - ``last_step``: the last step of each scenario, plus failures
+    - ``navigation``: steps that changed the page URL, plus failures
+
+Failing steps are captured in every mode except ``off`` as long as
+``screenshot_on_fail`` is enabled.
+
+Example:
+    >>> policy = ScreenshotPolicy(mode="last_step", image_format="jpeg", quality=70)
+    >>> policy.capture_after_step(step_number=3, total_steps=5)
+    False
+"""
+
+from typing import Any, Optional
+
+from .imaging import fit_image
+
+SCREENSHOT_MODES = ("off", "failures", "all", "every_n", "last_step", "navigation")
+SCREENSHOT_FORMATS = ("png", "jpeg")
+SCREENSHOT_CLIPS = ("viewport", "full_page", "element")
+
+
+class ScreenshotPolicy:
+    """
+    When and how UI screenshots are captured.
+
+    Attributes:
+        mode: One of SCREENSHOT_MODES
+        every: Step interval for the ``every_n`` mode
+        on_fail: Capture failing steps
+        image_format: "png" or "jpeg"
+        quality: JPEG quality (1-100)
+        clip: "viewport", "full_page" or "element" (the element targeted by the step)
+        max_dimension: Downscale captures so their longest side fits (None keeps the size)
+    """
+
+    def __init__(
+        self,
+        mode: str = "all",
+        every: int = 5,
+        on_fail: bool = True,
+        image_format: str = "png",
+        quality: int = 80,
+        clip: str = "viewport",
+        max_dimension: Optional[int] = None
+    ):
+        self.mode = mode
+        self.every = max(1, every)
+        self.on_fail = on_fail and mode != "off"
+        self.image_format = image_format
+        self.quality = quality
+        self.clip = clip
+        self.max_dimension = max_dimension
+
+    @classmethod
+    def from_config(cls, config) -> 'ScreenshotPolicy':
+        """
+        Build the policy from a PyRateConfig.
+
+        Without an explicit ``screenshot_mode``, ``screenshot_on_pass``
+        selects between ``all`` and ``failures``.
+        """
+        mode = config.screenshot_mode
+        if mode is None:
+            mode = "all" if config.screenshot_on_pass else "failures"
+        return cls(
+            mode=mode,
+            every=config.screenshot_every,
+            on_fail=config.screenshot_on_fail,
+            image_format=config.screenshot_format,
+            quality=config.screenshot_quality,
+            clip=config.screenshot_clip,
+            max_dimension=config.screenshot_max_dimension
+        )
+
+    @property
+    def tracks_navigation(self) -> bool:
+        """Whether the runner must compare page URLs around each step."""
+        return self.mode == "navigation"
+
+    def capture_after_step(self, step_number: int, total_steps: int, navigated: bool = False) -> bool:
+        """
+        Decide whether a successful step is captured.
+
+        Args:
+            step_number: 1-based position of the step in its scenario
+            total_steps: Number of steps in the scenario
+            navigated: The step changed the page URL
+
+        Returns:
+            True to take a screenshot
+        """
+        if self.mode == "all":
+            return True
+        if self.mode == "every_n":
+            return step_number % self.every == 0
+        if self.mode == "last_step":
+            return step_number == total_steps
+        if self.mode == "navigation":
+            return navigated
+        return False
+
+    def capture(self, page: Any, element: Any = None) -> bytes:
+        """
+        Take a screenshot with the configured clip and encoding.
+
+        Args:
+            page: Playwright page to capture
+            element: Locator of the element used by the step, for the ``element`` clip
+
+        Returns:
+            Encoded image bytes
+        """
+        options = {"type": self.image_format}
+        if self.image_format == "jpeg":
+            options["quality"] = self.quality
+
+        data = None
+        if self.clip == "element" and element is not None:
+            try:
+                data = element.first.screenshot(**options)
+            except Exception:
+                # Element gone (e.g. after a click that navigated): fall back to the viewport
+                data = None
+        if data is None:
+            data = page.screenshot(full_page=self.clip == "full_page", **options)
+
+        if self.max_dimension:
+            data = fit_image(data, self.max_dimension, self.image_format, self.quality)
+        return data
+
+    @property
+    def mime_type(self) -> str:
+        """MIME type of the captured images."""
+        return f"image/{self.image_format}"
@@ -0,0 +1,182 @@
+"""
+Row selection for data-driven features.
+
+Picks which rows of a data source become iterations, on the streamed rows of
+:func:`~pyrate.data_loader.iter_dataset`, so unselected rows are never kept
+in memory. Selections are applied in this order:
+
+1. ``rows_range``: a 1-based, inclusive range of row numbers (``"1000:2000"``,
+   ``"500:"``, ``":100"`` or a single ``"42"``); reading stops after the range
+2. ``row_filter``: a Python expression over the row's columns
+   (``"country == 'AR' and age >= 18"``); ``row['column name']`` works for
+   columns that are not valid identifiers
+3. ``sample``: N rows picked at random (with ``seed``, the same N rows on
+   every run); only the sampled rows are kept in memory
+4. ``shard``: ``"k/n"`` keeps every n-th remaining row starting with the k-th,
+   so n CI nodes with the same options run disjoint parts of the suite
+
+Selected rows keep their original row number, so iterations in the report,
+evidence and results match the data file.
+
+Example:
+    >>> rows = [{"id": i} for i in range(10)]
+    >>> [n for n, row in select_rows(rows, rows_range="3:8", shard="1/2")]
+    [2, 4, 6]
+"""
+
+import builtins
+import random
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .exceptions import DataFileError
+
+# Built-ins available to row filter expressions
+_FILTER_BUILTINS = {
+    name: getattr(builtins, name)
+    for name in ('abs', 'bool', 'float', 'int', 'len', 'max', 'min', 'round', 'str')
+}
+
+
+def parse_row_range(spec: str) -> Tuple[int, Optional[int]]:
+    """
+    Parse a row range.
+
+    Args:
+        spec: "start:end", "start:", ":end" or "n" (1-based, inclusive)
+
+    Returns:
+        Tuple of (start, end), end being None for an open range
+
+    Raises:
+        ValueError: If the range is malformed or empty
+    """
+    text = str(spec).strip()
+    start_text, separator, end_text = text.partition(':')
+    try:
+        start = int(start_text) if start_text.strip() else 1
+        end = int(end_text) if end_text.strip() else None
+    except ValueError:
+        raise ValueError(f"Rango de filas inválido: '{spec}' (usa inicio:fin, ej: 1000:2000)")
+    if not separator:
+        end = start
+    if start < 1 or (end is not None and end < start):
+        raise ValueError(f"Rango de filas inválido: '{spec}' (las filas empiezan en 1)")
+    return start, end
+
+
+def parse_shard(spec: str) -> Tuple[int, int]:
+    """
+    Parse a row shard.
+
+    Args:
+        spec: "k/n", the k-th (1-based) of n shards
+
+    Returns:
+        Tuple of (k, n)
+
+    Raises:
+        ValueError: If the shard is malformed or k is not between 1 and n
+    """
+    index, _, total = str(spec).strip().partition('/')
+    try:
+        k, n = int(index), int(total)
+    except ValueError:
+        raise ValueError(f"Shard inválido: '{spec}' (usa k/n, ej: 3/8)")
+    if not 1 <= k <= n:
+        raise ValueError(f"Shard inválido: '{spec}' (k debe estar entre 1 y n)")
+    return k, n
+
+
+def compile_row_filter(expression: str) -> Callable[[Dict[str, Any]], bool]:
+    """
+    Compile a row filter expression.
+
+    Args:
+        expression: Python expression using the row's columns as variables
+            (and ``row`` for the whole row)
+
+    Returns:
+        Predicate taking a row
+
+    Raises:
+        ValueError: If the expression is not valid Python
+    """
+    try:
+        code = compile(expression, '<row_filter>', 'eval')
+    except SyntaxError as e:
+        raise ValueError(f"Filtro de filas inválido: '{expression}' ({e.msg})")
+    namespace = {'__builtins__': _FILTER_BUILTINS}
+
+    def predicate(row: Dict[str, Any]) -> bool:
+        return bool(eval(code, namespace, {**row, 'row': row}))
+    return predicate
+
+
+def select_rows(
+    rows: Iterable[Dict[str, Any]],
+    rows_range: Optional[str] = None,
+    row_filter: Optional[str] = None,
+    sample: Optional[int] = None,
+    seed: Optional[int] = None,
+    shard: Optional[str] = None
+) -> Iterator[Tuple[int, Dict[str, Any]]]:
+    """
+    Select data rows, keeping their position in the data file.
+
+    Options are validated right away; rows are read while the result is consumed.
+
+    Args:
+        rows: Data rows (usually a stream from iter_dataset)
+        rows_range: Row numbers to keep, "start:end" (1-based, inclusive)
+        row_filter: Python expression a row must satisfy
+        sample: Number of rows picked at random
+        seed: Random seed for sample (None: different rows on every run)
+        shard: "k/n", keep the k-th of n shards
+
+    Returns:
+        Iterator of (zero-based row index, row) tuples, in file order
+
+    Raises:
+        ValueError: If an option is invalid
+        DataFileError: If the filter fails on a row (while iterating)
+    """
+    items: Iterator[Tuple[int, Dict[str, Any]]] = enumerate(rows)
+    if rows_range:
+        start, end = parse_row_range(rows_range)
+        items = islice(items, start - 1, end)
+    if row_filter:
+        items = _filtered(items, compile_row_filter(row_filter), row_filter)
+    if sample is not None:
+        if sample < 0:
+            raise ValueError("sample no puede ser negativo")
+        items = _sampled(items, sample, seed)
+    if shard:
+        k, n = parse_shard(shard)
+        items = (item for position, item in enumerate(items) if position % n == k - 1)
+    return items
+
+
+def _filtered(items, predicate, expression):
+    for index, row in items:
+        try:
+            selected = predicate(row)
+        except Exception as e:
+            raise DataFileError(f"Error evaluando el filtro '{expression}' en la fila {index + 1}: {e}")
+        if selected:
+            yield index, row
+
+
+def _sampled(items, size, seed):
+    """Reservoir sampling: one pass, only ``size`` rows in memory, yielded in file order."""
+    rng = random.Random(seed)
+    reservoir: List[Tuple[int, Dict[str, Any]]] = []
+    for seen, item in enumerate(items):
+        if seen < size:
+            reservoir.append(item)
+        else:
+            slot = rng.randint(0, seen)
+            if slot < size:
+                reservoir[slot] = item
+    reservoir.sort(key=lambda item: item[0])
+    yield from reservoir
@@ -0,0 +1,230 @@
+"""
+Machine-readable result sinks for PyRate Framework.
+
+Besides the HTML dashboard, a run can publish its results for CI systems
+and dashboards, built from the same step records as the report:
+
+    - ``results.jsonl``: one JSON line per step and per finished scenario,
+      appended (and flushed) as they complete, so the results of a crashed
+      or killed run are kept up to its last step.
+    - ``junit.xml``: JUnit XML written at the end of the run, with one
+      ``testsuite`` per feature file and one ``testcase`` per scenario run.
+
+Example:
+    >>> stream = ResultStream("reports/results.jsonl")
+    >>> stream.step(step_record)
+    >>> stream.scenario(scenario_log)
+    >>> write_junit(runner.execution_log, "reports/junit.xml")
+"""
+
+import json
+import os
+import re
+import threading
+from typing import Any, Dict, List, Sequence
+from xml.etree import ElementTree as ET
+
+# Inline image copies are left out of the results; artifact references are kept
+_EXCLUDED_FIELDS = ('screenshot_bytes', 'screenshot')
+
+# Characters not allowed in XML 1.0 documents
+_INVALID_XML_CHARS = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f\ufffe\uffff]')
+
+
+def step_result(step: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    JSON record of a step.
+
+    Args:
+        step: Step record from the execution log
+
+    Returns:
+        The record with ``"type": "step"`` and without inline screenshots
+    """
+    result = {"type": "step"}
+    result.update((k, v) for k, v in step.items() if k not in _EXCLUDED_FIELDS)
+    return result
+
+
+def scenario_result(steps: Sequence[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    JSON summary of a scenario run.
+
+    Args:
+        steps: Step records of the scenario, in execution order
+
+    Returns:
+        Record with the scenario's status, step count, duration and first error
+    """
+    first = steps[0]
+    failed = next((s for s in steps if s.get('status') == 'FAIL'), None)
+    return {
+        "type": "scenario",
+        "feature": first.get('feature'),
+        "scenario": first.get('scenario'),
+        "iteration": first.get('iteration'),
+        "tags": first.get('tags', []),
+        "status": "FAIL" if failed else "PASS",
+        "steps": len(steps),
+        "duration": round(sum(s.get('duration') or 0 for s in steps), 3),
+        "error": failed.get('error') if failed else None,
+    }
+
+
+def group_scenarios(execution_log: Sequence[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+    """
+    Split an execution log into scenario runs.
+
+    Consecutive records with the same ``scenario_run`` id belong to the same
+    run, so repeated scenario names stay separate. Records without an id
+    (older logs) are grouped by feature, scenario and iteration.
+
+    Args:
+        execution_log: Step records in execution order
+
+    Returns:
+        List of step record lists, one per scenario run
+    """
+    groups: List[List[Dict[str, Any]]] = []
+    last_key = None
+    for step in execution_log:
+        key = (step.get('scenario_run'), step.get('feature'), step.get('scenario'), step.get('iteration'))
+        if not groups or key != last_key:
+            groups.append([])
+            last_key = key
+        groups[-1].append(step)
+    return groups
+
+
+class ResultStream:
+    """
+    Append-only JSON Lines results, written as steps and scenarios finish.
+
+    Each line is flushed right away. Writes are serialized, so iterations
+    running in parallel threads can share a stream.
+
+    Attributes:
+        path: Results file
+    """
+
+    def __init__(self, path: str):
+        """
+        Start a new results file, replacing any previous one.
+
+        Args:
+            path: Results file path
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._file = open(path, "w", encoding="utf-8")
+
+    def step(self, step: Dict[str, Any]) -> None:
+        """Append the record of a finished step."""
+        self._write(step_result(step))
+
+    def scenario(self, steps: Sequence[Dict[str, Any]]) -> None:
+        """Append the summary of a finished scenario (nothing if it ran no steps)."""
+        if steps:
+            self._write(scenario_result(steps))
+
+    def extend(self, execution_log: Sequence[Dict[str, Any]]) -> None:
+        """
+        Append the steps and scenario summaries of an already finished log.
+
+        Args:
+            execution_log: Step records, e.g. those returned by a worker process
+        """
+        for steps in group_scenarios(execution_log):
+            for step in steps:
+                self.step(step)
+            self.scenario(steps)
+
+    def close(self) -> None:
+        """Close the file; later writes reopen it in append mode."""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def _write(self, record: Dict[str, Any]) -> None:
+        line = json.dumps(record, ensure_ascii=False, default=str) + "\n"
+        with self._lock:
+            if self._file is None:
+                self._file = open(self.path, "a", encoding="utf-8")
+            self._file.write(line)
+            self._file.flush()
+
+
+def write_junit(execution_log: Sequence[Dict[str, Any]], path: str, name: str = "PyRate") -> str:
+    """
+    Write JUnit XML for an execution log.
+
+    Each feature file becomes a ``testsuite`` and each scenario run a
+    ``testcase`` (named with its iteration when the feature is data-driven).
+    A failing step becomes the ``failure`` of its test case; the executed
+    steps are listed in ``system-out``.
+
+    Args:
+        execution_log: Step records in execution order
+        path: Output file (replaced atomically)
+        name: Name of the root ``testsuites`` element
+
+    Returns:
+        The output path
+    """
+    suites: Dict[str, List[List[Dict[str, Any]]]] = {}
+    for steps in group_scenarios(execution_log):
+        suites.setdefault(steps[0].get('feature') or name, []).append(steps)
+
+    root = ET.Element("testsuites", name=name)
+    total_tests = total_failures = 0
+    total_time = 0.0
+    for feature, runs in suites.items():
+        data_driven = len({steps[0].get('iteration') for steps in runs}) > 1
+        suite = ET.SubElement(root, "testsuite", name=_xml_text(feature))
+        failures = 0
+        suite_time = 0.0
+        for steps in runs:
+            summary = scenario_result(steps)
+            case_name = summary['scenario'] or "Default"
+            if data_driven:
+                case_name += f" [iteración {summary['iteration']}]"
+            case = ET.SubElement(
+                suite, "testcase",
+                classname=_xml_text(feature),
+                name=_xml_text(case_name),
+                time=f"{summary['duration']:.3f}"
+            )
+            failed = next((s for s in steps if s.get('status') == 'FAIL'), None)
+            if failed is not None:
+                failures += 1
+                failure = ET.SubElement(case, "failure", message=_xml_text(str(failed.get('error') or "")))
+                failure.text = _xml_text(f"{failed.get('name')}\n{failed.get('error') or ''}")
+            out = ET.SubElement(case, "system-out")
+            out.text = _xml_text("\n".join(f"[{s.get('status')}] {s.get('name')}" for s in steps))
+            suite_time += summary['duration']
+
+        suite.set("tests", str(len(runs)))
+        suite.set("failures", str(failures))
+        suite.set("errors", "0")
+        suite.set("skipped", "0")
+        suite.set("time", f"{suite_time:.3f}")
+        total_tests += len(runs)
+        total_failures += failures
+        total_time += suite_time
+
+    root.set("tests", str(total_tests))
+    root.set("failures", str(total_failures))
+    root.set("errors", "0")
+    root.set("time", f"{total_time:.3f}")
+
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    ET.ElementTree(root).write(tmp_path, encoding="utf-8", xml_declaration=True)
+    os.replace(tmp_path, path)
+    return path
+
+
+def _xml_text(value: str) -> str:
+    return _INVALID_XML_CHARS.sub("", value)
@@ -0,0 +1,127 @@
+"""
+Step registry for PyRate Framework.
+
+Maps Gherkin step lines to handler functions. Every command is registered
+with the verb that follows its leading keyword (Given/And/When/Then or ``*``)
+and a precompiled pattern, so dispatching a line is a single dictionary
+lookup followed by the few patterns that share its verb.
+
+Examples:
+    >>> registry = StepRegistry()
+    >>> @registry.step('url', r'Given url (.*)')
+    ... def step_url(runner, match, step_record):
+    ...     runner.context['base_url'] = match.group(1)
+    >>> handler, match = registry.resolve("Given url 'https://api.example.com'")
+    >>> handler is step_url
+    True
+"""
+
+import re
+from typing import Callable, Dict, List, Optional, Pattern, Tuple
+
+# Leading keyword (optional) followed by the command verb
+_VERB_PATTERN = re.compile(r'^\*?\s*(?:(?:given|and|when|then)\s+)?(\S+)', re.IGNORECASE)
+
+
+def step_verb(line: str) -> Optional[str]:
+    """
+    Extract the lowercase command verb of a step line.
+
+    Args:
+        line: Step line (e.g. "And click '#login'")
+
+    Returns:
+        The verb ("click"), or None for an empty line
+
+    Example:
+        >>> step_verb("* def token = response.token")
+        'def'
+    """
+    match = _VERB_PATTERN.match(line)
+    return match.group(1).lower() if match else None
+
+
+class StepRegistry:
+    """
+    Registry of step handlers keyed by command verb.
+
+    Handlers are called as ``handler(runner, match, step_record)`` where
+    ``match`` is the result of the handler's own pattern against the line.
+    Patterns sharing a verb are tried in registration order, so more
+    specific patterns (e.g. ``check radio``) must be registered first.
+    """
+
+    def __init__(self):
+        self._handlers: Dict[str, List[Tuple[Pattern, Callable]]] = {}
+
+    def register(
+        self,
+        verb: str,
+        pattern: str,
+        handler: Callable,
+        flags: int = re.IGNORECASE,
+        prepend: bool = False
+    ) -> None:
+        """
+        Register a handler for a command verb.
+
+        Args:
+            verb: Command verb following the keyword (e.g. "click")
+            pattern: Regex matched from the start of the step line
+            handler: Callable receiving (runner, match, step_record)
+            flags: Regex flags (case-insensitive by default)
+            prepend: Try this pattern before the ones already registered
+                (used to override an existing command in a copied registry)
+        """
+        entries = self._handlers.setdefault(verb.lower(), [])
+        entry = (re.compile(pattern, flags), handler)
+        if prepend:
+            entries.insert(0, entry)
+        else:
+            entries.append(entry)
+
+    def step(self, verb: str, pattern: str, flags: int = re.IGNORECASE, prepend: bool = False) -> Callable:
+        """
+        Decorator form of :meth:`register`.
+
+        Example:
+            >>> @registry.step('wait', r'(?:Given|And)\\s+wait (\\d+)')
+            ... def step_wait(runner, match, step_record): ...
+        """
+        def decorator(handler: Callable) -> Callable:
+            self.register(verb, pattern, handler, flags, prepend)
+            return handler
+        return decorator
+
+    def resolve(self, line: str, verb: Optional[str] = None) -> Tuple[Optional[Callable], Optional[re.Match]]:
+        """
+        Find the handler for a step line.
+
+        Args:
+            line: Step line with variables already injected
+            verb: Precomputed verb of the line (computed if omitted)
+
+        Returns:
+            Tuple of (handler, match), or (None, None) if no command matches
+        """
+        if verb is None:
+            verb = step_verb(line)
+        for pattern, handler in self._handlers.get(verb, ()):
+            match = pattern.match(line)
+            if match:
+                return handler, match
+        return None, None
+
+    def copy(self) -> 'StepRegistry':
+        """
+        Return an independent copy, so subclasses can add or override commands.
+
+        Returns:
+            New StepRegistry with the same handlers
+        """
+        clone = StepRegistry()
+        clone._handlers = {verb: list(entries) for verb, entries in self._handlers.items()}
+        return clone
+
+    def __contains__(self, verb: str) -> bool:
+        return verb.lower() in self._handlers
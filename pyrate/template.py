@@ -0,0 +1,96 @@
+"""
+Variable interpolation for PyRate Framework.
+
+Step lines reference variables with ``#(name)`` placeholders. A line is
+tokenized once into literal text and placeholder names; rendering only
+looks up the names that actually appear, instead of trying every known
+variable (including the whole environment) against the line.
+
+Example:
+    >>> template = compile_template("Given url '#(BASE_URL)/users'")
+    >>> template.render({"BASE_URL": "https://api.example.com"})
+    "Given url 'https://api.example.com/users'"
+"""
+
+import re
+from functools import lru_cache
+from typing import Mapping, Tuple
+
+_PLACEHOLDER = re.compile(r'#\(([^)]*)\)')
+
+
+class Template:
+    """
+    Tokenized step line.
+
+    Placeholders whose variable is missing or None are left as written,
+    and substituted values are not scanned again for placeholders.
+
+    Attributes:
+        source: Original line
+        parts: Alternating literal text and variable names (names at odd indexes)
+        names: Variable names referenced by the line
+    """
+
+    __slots__ = ('source', 'parts', 'names')
+
+    def __init__(self, source: str):
+        """
+        Tokenize a line.
+
+        Args:
+            source: Line that may contain #(name) placeholders
+        """
+        self.source = source
+        self.parts: Tuple[str, ...] = tuple(_PLACEHOLDER.split(source))
+        self.names: Tuple[str, ...] = self.parts[1::2]
+
+    def render(self, variables: Mapping) -> str:
+        """
+        Substitute placeholders with their values.
+
+        Args:
+            variables: Mapping of variable names to values
+
+        Returns:
+            Rendered line
+        """
+        if not self.names:
+            return self.source
+        out = []
+        for i, part in enumerate(self.parts):
+            if i % 2 == 0:
+                out.append(part)
+            else:
+                value = variables.get(part)
+                out.append(f"#({part})" if value is None else str(value))
+        return "".join(out)
+
+    def __getstate__(self):
+        return (self.source,)
+
+    def __setstate__(self, state):
+        self.__init__(state[0])
+
+    def __eq__(self, other):
+        return isinstance(other, Template) and other.source == self.source
+
+    def __hash__(self):
+        return hash(self.source)
+
+    def __repr__(self):
+        return f"Template({self.source!r})"
+
+
+@lru_cache(maxsize=4096)
+def compile_template(source: str) -> Template:
+    """
+    Return the (cached) Template for a line.
+
+    Args:
+        source: Line that may contain #(name) placeholders
+
+    Returns:
+        Template instance
+    """
+    return Template(source)
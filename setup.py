@@ -75,6 +75,12 @@ setup(
             "mypy>=1.0",
             "twine>=4.0",
         ],
+        "async": [
+            "httpx>=0.24",
+        ],
+        "images": [
+            "Pillow>=9.0",
+        ],
     },
     entry_points={
         'console_scripts': [
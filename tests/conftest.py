@@ -0,0 +1,163 @@
+"""
+Shared pytest fixtures.
+"""
+import base64
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+# 1x1 PNG returned by the fake pages' screenshot()
+PNG_1X1 = base64.b64decode(
+    "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mP8z8BQDwAEhQGAhKmMIQAAAABJRU5ErkJggg=="
+)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    connections = set()
+
+    def do_GET(self):
+        _Handler.connections.add(self.client_address)
+        body = json.dumps({"path": self.path, "cookie": self.headers.get("Cookie")}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Set-Cookie", "session=abc; Path=/")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    """Local HTTP/1.1 JSON server echoing the request path; yields its base URL."""
+    _Handler.connections.clear()
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture
+def server_connections(server):
+    """Client addresses of the connections accepted by ``server``."""
+    return _Handler.connections
+
+
+class FakeLocator:
+    def __init__(self, page, selector):
+        self.page = page
+        self.selector = selector
+        self.first = self
+
+    def click(self):
+        if self.selector == "#next":
+            self.page.url += "/next"
+
+    def fill(self, value):
+        pass
+
+    def screenshot(self, **kwargs):
+        self.page.screenshots.append(dict(kwargs, element=self.selector))
+        return self.page.image
+
+
+class FakePage:
+    def __init__(self, context):
+        self.context = context
+        self.url = None
+        self.closed = False
+        self.image = PNG_1X1
+        self.screenshots = []  # kwargs of every screenshot() call
+
+    def goto(self, url, timeout=None):
+        self.url = url
+
+    def locator(self, selector):
+        return FakeLocator(self, selector)
+
+    def click(self, selector):
+        self.locator(selector).click()
+
+    def fill(self, selector, value):
+        pass
+
+    def screenshot(self, **kwargs):
+        self.screenshots.append(kwargs)
+        return self.image
+
+    def close(self):
+        self.closed = True
+
+
+class FakeBrowserContext:
+    def __init__(self, browser):
+        self.browser = browser
+        self.pages = []
+        self.closed = False
+
+    def new_page(self):
+        page = FakePage(self)
+        self.pages.append(page)
+        return page
+
+    def close(self):
+        self.closed = True
+        for page in self.pages:
+            page.closed = True
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.contexts = []
+        self.closed = False
+
+    def new_context(self, **kwargs):
+        context = FakeBrowserContext(self)
+        self.contexts.append(context)
+        return context
+
+    def is_connected(self):
+        return not self.closed
+
+    def close(self):
+        self.closed = True
+
+
+class FakePlaywright:
+    """Stand-in for sync_playwright() recording launches and stops."""
+
+    def __init__(self):
+        self.browsers = []
+        self.starts = 0
+        self.stops = 0
+        self.chromium = self
+
+    def __call__(self):
+        return self
+
+    def start(self):
+        self.starts += 1
+        return self
+
+    def launch(self, **kwargs):
+        browser = FakeBrowser()
+        self.browsers.append(browser)
+        return browser
+
+    def stop(self):
+        self.stops += 1
+
+
+@pytest.fixture
+def fake_playwright(monkeypatch):
+    """Replace Playwright in the runner so browser steps run without Chromium."""
+    fake = FakePlaywright()
+    monkeypatch.setattr("pyrate.core.sync_playwright", fake)
+    return fake
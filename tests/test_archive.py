@@ -0,0 +1,150 @@
+"""
+Tests for evidence archives and the `pyrate evidence extract` command.
+"""
+import os
+import sys
+import zipfile
+
+from pyrate.archive import SIDECAR_SUFFIX, EvidenceArchive, extract_evidence, merge_archives, read_index
+from pyrate.cli import main
+from pyrate.config import PyRateConfig
+from pyrate.core import PyRateRunner
+from pyrate.parallel import run_parallel
+
+
+def _archive(tmp_path):
+    archive = EvidenceArchive(str(tmp_path / "evidence.zip"))
+    archive.add("API_Login_Iter1.txt", b"ok", scenario="Login", iteration=1, status="PASS")
+    archive.add("API_Login_Iter1.txt", b"again", scenario="Login", iteration=1, status="FAIL")
+    archive.add("UI_Cart_Iter2.docx", b"docx", scenario="Cart", iteration=2, status="FAIL")
+    archive.close()
+    return archive.path
+
+
+class TestEvidenceArchive:
+    """Test writing and reading archives."""
+
+    def test_index_and_unique_names(self, tmp_path):
+        """Every file is indexed and repeated names get a suffix."""
+        path = _archive(tmp_path)
+
+        assert read_index(path) == [
+            {"file": "API_Login_Iter1.txt", "scenario": "Login", "iteration": 1, "status": "PASS"},
+            {"file": "API_Login_Iter1-2.txt", "scenario": "Login", "iteration": 1, "status": "FAIL"},
+            {"file": "UI_Cart_Iter2.docx", "scenario": "Cart", "iteration": 2, "status": "FAIL"},
+        ]
+        with zipfile.ZipFile(path) as archive:
+            assert archive.getinfo("UI_Cart_Iter2.docx").compress_type == zipfile.ZIP_STORED
+            assert archive.getinfo("API_Login_Iter1.txt").compress_type == zipfile.ZIP_DEFLATED
+
+    def test_empty_archive_not_written(self, tmp_path):
+        """Closing an archive without entries creates no file."""
+        archive = EvidenceArchive(str(tmp_path / "empty.zip"))
+
+        archive.close()
+
+        assert not os.path.exists(archive.path)
+
+    def test_extract_filters(self, tmp_path):
+        """Files are selected through the index."""
+        path = _archive(tmp_path)
+
+        failed = extract_evidence(path, str(tmp_path / "out"), status="fail")
+        cart = extract_evidence(path, str(tmp_path / "cart"), scenario="Cart", iteration=2)
+
+        assert sorted(os.path.basename(p) for p in failed) == ["API_Login_Iter1-2.txt", "UI_Cart_Iter2.docx"]
+        assert [os.path.basename(p) for p in cart] == ["UI_Cart_Iter2.docx"]
+
+    def test_cli_extract(self, tmp_path, monkeypatch):
+        """`pyrate evidence extract` writes the selected files."""
+        path = _archive(tmp_path)
+        monkeypatch.setattr(sys, "argv", ["pyrate", "evidence", "extract", path, "-o", str(tmp_path / "cli"),
+                                          "--scenario", "Login"])
+
+        main()
+
+        assert sorted(os.listdir(tmp_path / "cli")) == ["API_Login_Iter1-2.txt", "API_Login_Iter1.txt"]
+
+    def test_interrupted_archive_recovered(self, tmp_path):
+        """An archive left open by a killed run is rebuilt from its entries and sidecar index."""
+        archive = EvidenceArchive(str(tmp_path / "live.zip"))
+        archive.add("API_Login_Iter1.txt", b"ok", scenario="Login", iteration=1, status="PASS")
+        archive.add("API_Login_Iter2.txt", b"fail" * 100, scenario="Login", iteration=2, status="FAIL")
+        archive.add("API_Login_Iter3.txt", b"cut" * 100, scenario="Login", iteration=3, status="PASS")
+        # Snapshot of the files as a killed process leaves them, last entry cut short
+        data = (tmp_path / "live.zip").read_bytes()
+        (tmp_path / "killed.zip").write_bytes(data[:-10])
+        (tmp_path / ("killed.zip" + SIDECAR_SUFFIX)).write_bytes((tmp_path / ("live.zip" + SIDECAR_SUFFIX)).read_bytes())
+        archive.close()
+        path = str(tmp_path / "killed.zip")
+
+        extracted = extract_evidence(path, str(tmp_path / "out"), status="FAIL")
+
+        assert [os.path.basename(p) for p in extracted] == ["API_Login_Iter2.txt"]
+        assert (tmp_path / "out" / "API_Login_Iter2.txt").read_bytes() == b"fail" * 100
+        assert [item["iteration"] for item in read_index(path)] == [1, 2]
+        assert not os.path.exists(path + SIDECAR_SUFFIX)
+        assert not os.path.exists(archive.path + SIDECAR_SUFFIX)
+
+    def test_merge_archives(self, tmp_path):
+        """Merged archives keep every entry and its metadata; the sources are removed."""
+        first = _archive(tmp_path)
+        second = EvidenceArchive(str(tmp_path / "second.zip"))
+        second.add("API_Login_Iter1.txt", b"other", scenario="Login", iteration=3, status="PASS")
+        second.close()
+
+        path = merge_archives([first, second.path], str(tmp_path / "merged.zip"))
+
+        assert [(item["file"], item["iteration"]) for item in read_index(path)] == [
+            ("API_Login_Iter1.txt", 1), ("API_Login_Iter1-2.txt", 1), ("UI_Cart_Iter2.docx", 2),
+            ("API_Login_Iter1-3.txt", 3),
+        ]
+        assert not os.path.exists(first) and not os.path.exists(second.path)
+
+
+class TestRunnerArchive:
+    """Test archive mode in the runner."""
+
+    def test_one_archive_per_run(self, tmp_path, monkeypatch):
+        """Data-driven evidence goes into one indexed archive instead of loose files."""
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "rows.csv").write_text("n\n1\n2\n3\n", encoding="utf-8")
+        feature = tmp_path / "t.feature"
+        feature.write_text("Data source: rows.csv\nScenario: calc\n    * def a = #(n)\n", encoding="utf-8")
+        runner = PyRateRunner(config=PyRateConfig(evidence_folder="evidence", evidence_archive=True))
+
+        runner.execute_file(str(feature), report=False)
+
+        files = os.listdir(tmp_path / "evidence")
+        assert len(files) == 1 and files[0].startswith("evidence_") and files[0].endswith(".zip")
+        index = read_index(str(tmp_path / "evidence" / files[0]))
+        # Files are written by background threads, so the index follows completion order
+        assert sorted((item["file"], item["iteration"], item["status"]) for item in index) == [
+            ("API_calc_Iter1.txt", 1, "PASS"), ("API_calc_Iter2.txt", 2, "PASS"), ("API_calc_Iter3.txt", 3, "PASS")
+        ]
+
+    def test_parallel_run_one_archive(self, tmp_path, monkeypatch):
+        """With -n, the archives of this run's workers (and only those) are merged into one archive."""
+        monkeypatch.chdir(tmp_path)
+        files = []
+        for name in ("a", "b"):
+            (tmp_path / f"{name}.csv").write_text("n\n1\n2\n", encoding="utf-8")
+            feature = tmp_path / f"{name}.feature"
+            feature.write_text(f"Data source: {name}.csv\nScenario: {name}\n    * def a = #(n)\n", encoding="utf-8")
+            files.append(str(feature))
+        config = PyRateConfig(evidence_folder="evidence", reports_folder="reports", evidence_archive=True)
+        # Archive of another run writing into the same evidence folder
+        other = EvidenceArchive(str(tmp_path / "evidence" / "worker-1" / "evidence_other.zip"))
+        other.add("API_other_Iter1.txt", b"other", scenario="other", iteration=1, status="PASS")
+        other.close()
+
+        run_parallel(files, workers=2, config=config, report=False)
+
+        archives = [name for name in os.listdir(tmp_path / "evidence") if name.endswith(".zip")]
+        assert len(archives) == 1
+        assert os.listdir(tmp_path / "evidence" / "worker-1") == ["evidence_other.zip"]
+        assert [name for name in os.listdir(tmp_path / "evidence") if name.startswith("worker-")] == ["worker-1"]
+        index = read_index(str(tmp_path / "evidence" / archives[0]))
+        assert sorted(item["file"] for item in index) == [
+            "API_a_Iter1.txt", "API_a_Iter2.txt", "API_b_Iter1.txt", "API_b_Iter2.txt"
+        ]
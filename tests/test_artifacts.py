@@ -0,0 +1,81 @@
+"""
+Tests for the content-addressed artifact store.
+"""
+import os
+
+from pyrate.artifacts import ArtifactStore, read_artifact, report_screenshot, response_data, screenshot_bytes
+from pyrate.config import PyRateConfig
+from pyrate.core import PyRateRunner
+from pyrate.report_generator import generate_report
+
+
+class TestArtifactStore:
+    """Test storing and reading artifacts."""
+
+    def test_identical_content_stored_once(self, tmp_path):
+        """Equal bytes map to the same file."""
+        store = ArtifactStore(str(tmp_path / "artifacts"))
+        first = store.put(b"image", ".png")
+        second = store.put(b"image", ".png")
+
+        assert first == second
+        assert first.endswith(".png")
+        assert read_artifact(first) == b"image"
+        assert len(list((tmp_path / "artifacts").rglob("*.png"))) == 1
+
+    def test_spill_moves_screenshot_and_large_response(self, tmp_path):
+        """Spilled records keep references and a short response preview."""
+        store = ArtifactStore(str(tmp_path))
+        record = {"status": "FAIL", "screenshot_bytes": b"png", "screenshot": "cG5n",
+                  "screenshot_type": "image/jpeg", "response_data": "x" * 100}
+
+        store.spill(record, inline_limit=10)
+
+        assert record['screenshot_bytes'] is None and record['screenshot'] is None
+        assert record['screenshot_ref'].endswith(".jpg")
+        assert record['response_data'] == "x" * 10
+        assert screenshot_bytes(record) == b"png"
+        assert report_screenshot(record) == b"png"
+        assert response_data(record) == "x" * 100
+
+    def test_small_response_stays_inline(self, tmp_path):
+        """Responses within the limit are not written to disk."""
+        store = ArtifactStore(str(tmp_path / "artifacts"))
+        record = {"response_data": "ok", "screenshot_bytes": None}
+
+        store.spill(record, inline_limit=10)
+
+        assert 'response_ref' not in record
+        assert not os.path.exists(tmp_path / "artifacts")
+
+    def test_passing_step_screenshot_not_in_report(self, tmp_path):
+        """As in memory mode, only failing steps embed their capture."""
+        store = ArtifactStore(str(tmp_path))
+        record = store.spill({"status": "PASS", "screenshot_bytes": b"png"}, inline_limit=10)
+
+        assert report_screenshot(record) is None
+
+
+class TestBoundedMemoryRunner:
+    """Test the runner with artifact_store enabled."""
+
+    def test_log_keeps_only_references(self, tmp_path, monkeypatch, fake_playwright):
+        """Screenshots leave the execution log but still reach evidence and report."""
+        monkeypatch.chdir(tmp_path)
+        feature = tmp_path / "ui.feature"
+        feature.write_text("Scenario: ui\n    Given driver 'https://example.com'\n    And fly away\n",
+                           encoding="utf-8")
+        config = PyRateConfig(evidence_folder="evidence", artifact_store=True)
+
+        with PyRateRunner(config=config) as runner:
+            runner.execute_file(str(feature), report=False)
+
+        assert all(step['screenshot_bytes'] is None for step in runner.execution_log)
+        assert all(step['screenshot_ref'].startswith(os.path.join("reports", "artifacts"))
+                   for step in runner.execution_log)
+        assert os.path.exists(tmp_path / "evidence" / "UI_ui_Iter1.docx")
+
+        generate_report(runner.execution_log, runner.is_success)
+        html = (tmp_path / "reports" / "ultimo_reporte.html").read_text(encoding="utf-8")
+        ref = runner.execution_log[-1]['screenshot_ref']
+        assert f"href='{os.path.relpath(ref, 'reports')}'" in html
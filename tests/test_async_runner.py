@@ -0,0 +1,140 @@
+"""
+Tests for the asyncio API runner.
+
+Uses the local HTTP server from conftest.py so no external network is needed.
+"""
+import asyncio
+import threading
+
+import pytest
+from pyrate.async_runner import AsyncPyRateRunner
+from pyrate.config import PyRateConfig
+
+pytest.importorskip("httpx")
+
+
+def _api_feature(tmp_path, server, rows):
+    csv_file = tmp_path / "ids.csv"
+    csv_file.write_text("id\n" + "\n".join(rows) + "\n", encoding="utf-8")
+    feature = tmp_path / "api.feature"
+    feature.write_text(
+        f"Data source: {csv_file}\nScenario: get user\n"
+        f"    Given url '{server}'\n"
+        "    And path 'users/#(id)'\n"
+        "    When method get\n"
+        "    Then status 200\n"
+        "    And match response.path == '/users/#(id)'\n"
+        "    * def seen = response.path\n"
+        "    * print seen\n",
+        encoding="utf-8"
+    )
+    return str(feature)
+
+
+class _BlockingEvidence:
+    """Evidence pipeline stub that waits, like a full queue, until released."""
+
+    def __init__(self):
+        self.release = threading.Event()
+        self.released = []
+
+    def generate_api_evidence(self, *args, **kwargs):
+        self.released.append(self.release.wait(2))
+
+    def flush(self):
+        return []
+
+    def close(self):
+        return []
+
+
+class TestAsyncRunner:
+    """Test concurrent execution of API iterations."""
+
+    def test_iterations_run_in_dataset_order(self, tmp_path, monkeypatch, server):
+        """All rows pass and the log follows dataset order."""
+        monkeypatch.chdir(tmp_path)
+        feature = _api_feature(tmp_path, server, [str(i) for i in range(12)])
+        runner = AsyncPyRateRunner(config=PyRateConfig(evidence_folder="evidence"), concurrency=4)
+
+        runner.execute_file(feature, report=False)
+
+        assert runner.is_success
+        prints = [s for s in runner.execution_log if s['raw_command'].startswith('* print')]
+        assert [s['response_data'] for s in prints] == [f"/users/{i}" for i in range(12)]
+        assert [s['iteration'] for s in prints] == list(range(1, 13))
+
+    def test_execute_file_async_is_awaitable(self, tmp_path, monkeypatch, server):
+        """execute_file_async can be awaited from caller-owned event loops."""
+        monkeypatch.chdir(tmp_path)
+        feature = _api_feature(tmp_path, server, ["1", "2"])
+        runner = AsyncPyRateRunner(config=PyRateConfig(evidence_folder="evidence"))
+
+        asyncio.run(runner.execute_file_async(feature, report=False))
+
+        assert runner.is_success
+        assert len(runner.execution_log) == 14
+        assert runner._clients == {}
+
+    def test_failed_status_marks_run(self, tmp_path, monkeypatch, server):
+        """A failed assertion stops the iteration and marks the run as failed."""
+        monkeypatch.chdir(tmp_path)
+        feature = tmp_path / "bad.feature"
+        feature.write_text(
+            f"Scenario: bad\n    Given url '{server}'\n    When method get\n"
+            "    Then status 404\n    * print 'unreachable'\n",
+            encoding="utf-8"
+        )
+        runner = AsyncPyRateRunner(config=PyRateConfig(evidence_folder="evidence"))
+
+        runner.execute_file(str(feature), report=False)
+
+        assert not runner.is_success
+        assert runner.execution_log[-1]['status'] == "FAIL"
+        assert len(runner.execution_log) == 3
+
+    def test_ui_features_rejected(self, tmp_path, monkeypatch):
+        """Features with browser steps are refused before anything runs."""
+        monkeypatch.chdir(tmp_path)
+        feature = tmp_path / "ui.feature"
+        feature.write_text("Scenario: ui\n    Given driver 'https://example.com'\n", encoding="utf-8")
+        runner = AsyncPyRateRunner()
+
+        runner.execute_file(str(feature), report=False)
+
+        assert not runner.is_success
+        assert runner.execution_log == []
+
+    def test_cookies_not_persisted(self, tmp_path, monkeypatch, server):
+        """Cookies set by a response are not sent on later requests, as with the sync runner."""
+        monkeypatch.chdir(tmp_path)
+        feature = tmp_path / "cookies.feature"
+        feature.write_text(
+            f"Scenario: login\n    Given url '{server}/login'\n    When method get\n"
+            f"Scenario: me\n    Given url '{server}/me'\n    When method get\n",
+            encoding="utf-8"
+        )
+        runner = AsyncPyRateRunner(config=PyRateConfig(evidence_folder="evidence"))
+
+        runner.execute_file(str(feature), report=False)
+
+        assert runner.is_success
+        assert '"cookie": null' in runner.execution_log[-1]['response_data']
+
+    def test_evidence_queued_off_event_loop(self, tmp_path, monkeypatch, server):
+        """A full evidence queue does not block the other tasks on the event loop."""
+        monkeypatch.chdir(tmp_path)
+        feature = _api_feature(tmp_path, server, ["1"])
+        runner = AsyncPyRateRunner(config=PyRateConfig(evidence_folder="evidence"))
+        runner.evidence = evidence = _BlockingEvidence()
+
+        async def release_later():
+            await asyncio.sleep(0.1)
+            evidence.release.set()
+
+        async def run():
+            await asyncio.gather(runner.execute_file_async(feature, report=False), release_later())
+
+        asyncio.run(run())
+
+        assert evidence.released == [True]
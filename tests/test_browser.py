@@ -0,0 +1,136 @@
+"""
+Tests for the browser lifecycle and context pool of PyRateRunner.
+
+Playwright is replaced by the fake_playwright fixture from conftest.py, so
+no browser binary is needed.
+"""
+import pytest
+from pyrate.browser import BrowserContextPool
+from pyrate.config import PyRateConfig
+from pyrate.core import PyRateRunner
+from pyrate.exceptions import PyRateError
+
+
+def _ui_feature(folder, name):
+    path = folder / name
+    path.write_text(f"Scenario: {name}\n    Given driver 'https://example.com/{name}'\n", encoding="utf-8")
+    return str(path)
+
+
+@pytest.fixture
+def runner(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    return PyRateRunner(config=PyRateConfig(evidence_folder="evidence"))
+
+
+class TestBrowserLifecycle:
+    """Test when the browser is launched and closed."""
+
+    def test_browser_not_launched_for_api_features(self, runner, tmp_path, fake_playwright):
+        """Playwright is only started by a driver step."""
+        feature = tmp_path / "api.feature"
+        feature.write_text("Scenario: api\n    * def a = 1\n", encoding="utf-8")
+
+        with runner:
+            runner.execute_file(str(feature), report=False)
+
+        assert fake_playwright.starts == 0
+
+    def test_run_launches_browser_once(self, runner, tmp_path, fake_playwright):
+        """Inside a run, all files share one browser, closed by close()."""
+        files = [_ui_feature(tmp_path, f"f{i}.feature") for i in range(3)]
+
+        with runner:
+            for feature in files:
+                runner.execute_file(feature, report=False)
+            assert len(fake_playwright.browsers) == 1
+            assert not fake_playwright.browsers[0].closed
+
+        assert runner.is_success
+        assert fake_playwright.browsers[0].closed
+        assert fake_playwright.stops == 1
+        assert runner.browser_engine is None
+
+    def test_each_scenario_gets_fresh_context(self, runner, tmp_path, fake_playwright):
+        """Scenarios in a run are isolated in their own browser contexts."""
+        files = [_ui_feature(tmp_path, f"f{i}.feature") for i in range(2)]
+
+        with runner:
+            for feature in files:
+                runner.execute_file(feature, report=False)
+
+        assert len(fake_playwright.browsers[0].contexts) == 3  # 2 scenarios + 1 warm
+
+    def test_standalone_file_closes_browser(self, runner, tmp_path, fake_playwright):
+        """Without a run, every execute_file launches and closes its own browser."""
+        files = [_ui_feature(tmp_path, f"f{i}.feature") for i in range(2)]
+
+        for feature in files:
+            runner.execute_file(feature, report=False)
+
+        assert len(fake_playwright.browsers) == 2
+        assert all(browser.closed for browser in fake_playwright.browsers)
+
+    def test_disconnected_browser_relaunched(self, runner, tmp_path, fake_playwright):
+        """A crashed browser is replaced on the next driver step."""
+        files = [_ui_feature(tmp_path, f"f{i}.feature") for i in range(2)]
+
+        with runner:
+            runner.execute_file(files[0], report=False)
+            fake_playwright.browsers[0].closed = True
+            runner.execute_file(files[1], report=False)
+
+        assert len(fake_playwright.browsers) == 2
+        assert runner.is_success
+
+
+class TestBrowserContextPool:
+    """Test warm context hand-out and disposal."""
+
+    def test_prewarm_and_refill(self, fake_playwright):
+        """Warm contexts are handed out and replaced after release."""
+        browser = fake_playwright.launch()
+        pool = BrowserContextPool(browser, size=2, max_contexts=4)
+        pool.prewarm()
+        assert len(browser.contexts) == 2
+
+        page = pool.acquire()
+        assert page is browser.contexts[0].pages[0]
+        pool.release(page)
+
+        assert page.context.closed
+        assert pool.live == 2
+        assert len(browser.contexts) == 3
+
+    def test_cap_on_live_contexts(self, fake_playwright):
+        """acquire() refuses to exceed max_contexts."""
+        pool = BrowserContextPool(fake_playwright.launch(), size=0, max_contexts=2)
+        pool.acquire()
+        pool.acquire()
+
+        with pytest.raises(PyRateError):
+            pool.acquire()
+
+    def test_close_disposes_everything(self, fake_playwright):
+        """close() closes idle and in-use contexts."""
+        browser = fake_playwright.launch()
+        pool = BrowserContextPool(browser, size=1)
+        pool.prewarm()
+        pool.acquire()
+
+        pool.close()
+
+        assert pool.live == 0
+        assert all(context.closed for context in browser.contexts)
+
+    def test_runner_disposes_scenario_contexts(self, runner, tmp_path, fake_playwright):
+        """Finished scenarios leave only the warm context open."""
+        files = [_ui_feature(tmp_path, f"f{i}.feature") for i in range(3)]
+
+        with runner:
+            for feature in files:
+                runner.execute_file(feature, report=False)
+            open_contexts = [c for c in fake_playwright.browsers[0].contexts if not c.closed]
+            assert len(open_contexts) == runner.config.browser_context_pool
+
+        assert all(c.closed for c in fake_playwright.browsers[0].contexts)
@@ -6,7 +6,7 @@ import os
 import tempfile
 import pandas as pd
 import json
-from pyrate.data_loader import load_dataset
+from pyrate.data_loader import iter_dataset, load_dataset
 from pyrate.exceptions import DataFileError
 class TestCSVLoading:
     """Test CSV file loading."""
@@ -72,6 +72,155 @@ class TestJSONLoading:
             assert data[1]["name"] == "Item 2"
         finally:
             os.unlink(temp_path)
+class TestStreaming:
+    """Test row streaming with iter_dataset."""
+
+    def test_csv_streamed_in_chunks(self, tmp_path):
+        """The first rows are available before the whole file is parsed."""
+        path = tmp_path / "big.csv"
+        path.write_text("id\n" + "\n".join(str(i) for i in range(10)) + "\n", encoding="utf-8")
+
+        rows = iter_dataset(str(path), chunk_size=3)
+
+        assert next(rows) == {"id": 0}
+        assert [row["id"] for row in rows] == list(range(1, 10))
+
+    def test_csv_types_consistent_across_chunks(self, tmp_path):
+        """A blank after the first chunk does not turn the column's later values into floats."""
+        path = tmp_path / "rows.csv"
+        path.write_text("id,code,active\n1,007,true\n2,010,false\n,011,\n4,12,true\n", encoding="utf-8")
+
+        rows = list(iter_dataset(str(path), chunk_size=2))
+
+        assert [type(row["id"]) for row in rows] == [int, int, float, int]
+        assert [row["id"] for row in rows if row["id"] == row["id"]] == [1, 2, 4]
+        assert [row["code"] for row in rows] == [7, 10, 11, 12]
+        assert [row["active"] for row in rows if row["active"] == row["active"]] == [True, False, True]
+
+    def test_csv_late_values_keep_their_type(self, tmp_path):
+        """Values after the first chunk that do not fit the column's type load as pandas reads them."""
+        path = tmp_path / "rows.csv"
+        lines = ["zip,score"] + [f"{10000 + i},{i}" for i in range(10)] + ["A1B,1.5", "10010,2"]
+        path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+        rows = list(iter_dataset(str(path), chunk_size=4))
+
+        assert rows[10] == {"zip": "A1B", "score": 1.5}
+        assert rows[11] == {"zip": 10010, "score": 2}
+        assert [row["zip"] for row in rows[:10]] == list(range(10000, 10010))
+
+    def test_json_lines(self, tmp_path):
+        """JSON Lines files yield one row per non-blank line."""
+        path = tmp_path / "rows.jsonl"
+        path.write_text('{"id": 1}\n\n{"id": 2, "tags": ["a"]}\n', encoding="utf-8")
+
+        assert load_dataset(str(path)) == [{"id": 1}, {"id": 2, "tags": ["a"]}]
+
+    def test_json_lines_error_has_line(self, tmp_path):
+        """A broken line is reported with its number."""
+        path = tmp_path / "rows.ndjson"
+        path.write_text('{"id": 1}\n{"id": \n', encoding="utf-8")
+
+        with pytest.raises(DataFileError, match="línea 2"):
+            load_dataset(str(path))
+
+    def test_json_array_read_incrementally(self, tmp_path):
+        """Array elements split across read blocks are decoded correctly."""
+        from pyrate.data_loader import _iter_json
+        data = [{"id": i, "name": "x" * i, "score": i * 1.5, "ok": i % 2 == 0, "none": None} for i in range(30)]
+        path = tmp_path / "rows.json"
+        path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+
+        for block_size in (1, 5, 64):
+            assert list(_iter_json(str(path), block_size)) == data
+
+    def test_truncated_json_array(self, tmp_path):
+        """An unterminated array raises DataFileError."""
+        path = tmp_path / "rows.json"
+        path.write_text('[{"id": 1}, {"id": 2}', encoding="utf-8")
+
+        with pytest.raises(DataFileError, match="incompleto"):
+            load_dataset(str(path))
+
+    def test_xlsx_read_only(self, tmp_path):
+        """Workbooks are read row by row; blank rows are skipped and empty cells are NaN."""
+        from openpyxl import Workbook
+        workbook = Workbook()
+        sheet = workbook.active
+        sheet.append(["name", "age"])
+        sheet.append(["Alice", 30])
+        sheet.append([None, None])
+        sheet.append(["Bob", None])
+        path = tmp_path / "data.xlsx"
+        workbook.save(path)
+
+        rows = load_dataset(str(path))
+
+        assert [row["name"] for row in rows] == ["Alice", "Bob"]
+        assert rows[0]["age"] == 30 and rows[1]["age"] != rows[1]["age"]
+
+    def test_missing_file_fails_before_iterating(self):
+        """Path errors are raised when the stream is created."""
+        with pytest.raises(DataFileError, match="Archivo no encontrado"):
+            iter_dataset("nonexistent_file.jsonl")
+
+
+class TestDatasetCache:
+    """Test the on-disk cache of parsed data sources."""
+
+    @staticmethod
+    def _csv(tmp_path, rows=3):
+        path = tmp_path / "users.csv"
+        path.write_text("user,age\n" + "".join(f"u{i},{i if i % 2 else ''}\n" for i in range(rows)), encoding="utf-8")
+        return path
+
+    def test_second_load_reads_cache(self, tmp_path, monkeypatch):
+        """Once cached, the source is not parsed again and the rows are identical."""
+        import pyrate.data_loader as data_loader
+        path = self._csv(tmp_path)
+        cache = str(tmp_path / "cache")
+        first = load_dataset(str(path), cache_folder=cache)
+
+        def no_parsing(*args):
+            raise AssertionError("parsed again")
+        monkeypatch.setattr(data_loader, "_iter_csv", no_parsing)
+
+        assert repr(load_dataset(str(path), cache_folder=cache)) == repr(first)
+        assert len(os.listdir(cache)) == 1
+
+    def test_modified_file_replaces_entry(self, tmp_path):
+        """A new size or mtime is a cache miss, and the old entry is removed."""
+        path = self._csv(tmp_path)
+        cache = str(tmp_path / "cache")
+        load_dataset(str(path), cache_folder=cache)
+        old_entry = os.listdir(cache)
+
+        self._csv(tmp_path, rows=5)
+        rows = load_dataset(str(path), cache_folder=cache)
+
+        assert [row["user"] for row in rows] == ["u0", "u1", "u2", "u3", "u4"]
+        assert len(os.listdir(cache)) == 1 and os.listdir(cache) != old_entry
+
+    def test_partial_read_not_cached(self, tmp_path):
+        """An entry only appears once every row was read."""
+        path = self._csv(tmp_path, rows=10)
+        cache = tmp_path / "cache"
+
+        rows = iter_dataset(str(path), chunk_size=2, cache_folder=str(cache))
+        next(rows)
+        rows.close()
+
+        assert os.listdir(cache) == []
+
+    def test_json_not_cached(self, tmp_path):
+        """JSON sources are read directly."""
+        path = tmp_path / "rows.json"
+        path.write_text('[{"id": 1}]', encoding="utf-8")
+
+        assert load_dataset(str(path), cache_folder=str(tmp_path / "cache")) == [{"id": 1}]
+        assert not (tmp_path / "cache").exists()
+
+
 class TestErrorHandling:
     """Test error handling for data loader."""
     
@@ -0,0 +1,156 @@
+"""
+Tests for evidence generation and the background evidence pipeline.
+"""
+import os
+import threading
+import zipfile
+from io import BytesIO
+
+import pytest
+from pyrate.config import PyRateConfig
+from pyrate.core import PyRateRunner
+from pyrate.evidence import EvidenceGenerator, EvidencePipeline
+
+
+class _SlowGenerator:
+    """Generator stub whose API evidence waits until released."""
+
+    def __init__(self):
+        self.release = threading.Event()
+        self.written = []
+
+    def generate_api_evidence(self, scenario_name, method, response_data, iteration=0, status=None):
+        self.release.wait(5)
+        if scenario_name == "broken":
+            raise ValueError("disco lleno")
+        self.written.append(scenario_name)
+        return f"{scenario_name}.txt"
+
+
+def _noisy_png(width, height):
+    Image = pytest.importorskip("PIL.Image")
+    out = BytesIO()
+    Image.effect_noise((width, height), 64).convert("RGB").save(out, format="PNG")
+    return out.getvalue()
+
+
+def _docx_media(path):
+    with zipfile.ZipFile(path) as docx:
+        return {name: docx.read(name) for name in docx.namelist() if name.startswith("word/media/")}
+
+
+class TestUIEvidence:
+    """Test screenshots embedded in DOCX evidence."""
+
+    def test_screenshots_downscaled_to_embed_width(self, tmp_path):
+        """Large captures are resized and stored as JPEG."""
+        from PIL import Image
+        capture = _noisy_png(1600, 1200)
+        steps = [{"name": f"paso {i}", "status": "PASS", "screenshot_bytes": capture} for i in range(2)]
+
+        small = EvidenceGenerator(str(tmp_path / "small"), image_width=800, image_quality=60)
+        full = EvidenceGenerator(str(tmp_path / "full"), image_width=None)
+        small_path = small.generate_ui_evidence("Login", steps)
+        full_path = full.generate_ui_evidence("Login", steps)
+
+        media = _docx_media(small_path)
+        assert media and all(name.endswith((".jpg", ".jpeg")) for name in media)
+        assert {Image.open(BytesIO(data)).size for data in media.values()} == {(800, 600)}
+        assert os.path.getsize(small_path) < os.path.getsize(full_path) / 4
+
+    def test_unreadable_image_kept(self, tmp_path):
+        """A capture Pillow cannot read is embedded as it is (and reported by python-docx)."""
+        pytest.importorskip("PIL")
+        steps = [{"name": "paso", "status": "PASS", "screenshot_bytes": b"not an image"}]
+
+        path = EvidenceGenerator(str(tmp_path)).generate_ui_evidence("Roto", steps)
+
+        assert os.path.exists(path)
+
+
+class TestEvidencePipeline:
+    """Test background evidence writing."""
+
+    def test_flush_waits_for_queued_files(self, tmp_path):
+        """Files are queued without blocking and written by flush()."""
+        pipeline = EvidencePipeline(EvidenceGenerator(str(tmp_path)), workers=2)
+
+        futures = [pipeline.generate_api_evidence(f"s{i}", "GET", {"id": i}, iteration=i) for i in range(4)]
+
+        assert pipeline.flush() == []
+        assert all(os.path.exists(f.result()) for f in futures)
+        pipeline.close()
+
+    def test_backpressure(self):
+        """With max_pending files in flight, the next submission waits."""
+        generator = _SlowGenerator()
+        pipeline = EvidencePipeline(generator, workers=1, max_pending=1)
+        pipeline.generate_api_evidence("first", "GET", {})
+
+        second = threading.Thread(target=pipeline.generate_api_evidence, args=("second", "GET", {}))
+        second.start()
+        second.join(0.2)
+        assert second.is_alive()
+
+        generator.release.set()
+        second.join(5)
+        pipeline.close()
+        assert generator.written == ["first", "second"]
+
+    def test_errors_reported_on_flush(self):
+        """A failing file is logged and returned by flush(), without raising."""
+        generator = _SlowGenerator()
+        generator.release.set()
+        pipeline = EvidencePipeline(generator, workers=1)
+
+        pipeline.generate_api_evidence("broken", "GET", {})
+        pipeline.generate_api_evidence("ok", "GET", {})
+
+        assert pipeline.flush() == ["broken: disco lleno"]
+        assert generator.written == ["ok"]
+        assert pipeline.flush() == []
+        pipeline.close()
+
+    def test_synchronous_mode(self, tmp_path):
+        """workers=0 writes on the caller's thread and returns the path."""
+        pipeline = EvidencePipeline(EvidenceGenerator(str(tmp_path)), workers=0)
+
+        path = pipeline.generate_api_evidence("sync", "GET", {})
+
+        assert os.path.exists(path)
+
+    def test_runner_flushes_at_end_of_file(self, tmp_path, monkeypatch):
+        """Evidence exists once execute_file returns."""
+        monkeypatch.chdir(tmp_path)
+        feature = tmp_path / "t.feature"
+        feature.write_text("Scenario: uno\n    * def a = 1\nScenario: dos\n    * def b = 2\n", encoding="utf-8")
+        runner = PyRateRunner(config=PyRateConfig(evidence_folder="evidence", evidence_workers=2))
+
+        runner.execute_file(str(feature), report=False)
+
+        assert sorted(os.listdir(tmp_path / "evidence")) == ["API_dos_Iter1.txt", "API_uno_Iter1.txt"]
+
+    def test_write_errors_fail_the_run(self, tmp_path, monkeypatch):
+        """A file that cannot be written is logged and marks the run (and a parallel feature) as failed."""
+        import pyrate.parallel
+
+        def broken(*args, **kwargs):
+            raise OSError("disco lleno")
+
+        monkeypatch.chdir(tmp_path)
+        feature = tmp_path / "t.feature"
+        feature.write_text("Scenario: uno\n    * def a = 1\n", encoding="utf-8")
+        runner = PyRateRunner(config=PyRateConfig(evidence_folder="evidence", evidence_workers=2))
+        monkeypatch.setattr(runner.evidence_gen, "generate_api_evidence", broken)
+        errors = []
+        monkeypatch.setattr("pyrate.core.log_error", lambda tag, message: errors.append(message))
+
+        runner.execute_file(str(feature), report=False)
+
+        assert not runner.is_success
+        assert errors == ["Evidencia no generada: uno: disco lleno"]
+
+        monkeypatch.setattr(pyrate.parallel, "_worker_runner", runner)
+        log, ok, _ = pyrate.parallel._run_feature(str(feature))
+
+        assert log and not ok
@@ -0,0 +1,116 @@
+"""
+Tests for the read() file cache and its read-only values.
+"""
+import json
+import os
+import pickle
+
+import pytest
+from pyrate.core import PyRateRunner
+from pyrate.fixtures import FrozenDict, FrozenList, ReadCache, freeze, parse_read_file
+
+
+def _write_json(path, data):
+    path.write_text(json.dumps(data), encoding="utf-8")
+    return str(path)
+
+
+class TestFrozenValues:
+    """Test the read-only dict and list."""
+
+    def test_nested_values_are_read_only(self):
+        """Every level is frozen, and still a dict or list."""
+        value = freeze({"items": [{"sku": "A-1"}]})
+
+        assert isinstance(value, dict) and isinstance(value["items"], list)
+        with pytest.raises(TypeError, match="solo lectura"):
+            value["items"][0]["sku"] = "B-2"
+        with pytest.raises(TypeError):
+            value["items"].append({})
+        with pytest.raises(TypeError):
+            value.update(total=1)
+
+    def test_copies_and_serialization(self):
+        """copy() is mutable; JSON and pickle round-trips keep the content."""
+        value = freeze({"items": [1, 2]})
+
+        copy = value.copy()
+        copy["total"] = 2
+
+        assert type(copy) is dict and "total" not in value
+        assert json.loads(json.dumps(value)) == {"items": [1, 2]}
+        restored = pickle.loads(pickle.dumps(value))
+        assert type(restored) is FrozenDict and type(restored["items"]) is FrozenList
+
+
+class TestReadCache:
+    """Test the LRU cache of parsed files."""
+
+    def test_parsed_once(self, tmp_path):
+        """Later loads return the same object without parsing."""
+        path = _write_json(tmp_path / "body.json", {"id": 1})
+        cache = ReadCache()
+        calls = []
+
+        def parser(p):
+            calls.append(p)
+            return parse_read_file(p)
+
+        first = cache.load(path, parser)
+
+        assert cache.load(path, parser) is first
+        assert len(calls) == 1
+
+    def test_changed_file_reloaded(self, tmp_path):
+        """A new mtime or size invalidates the entry."""
+        path = _write_json(tmp_path / "body.json", {"id": 1})
+        cache = ReadCache()
+        cache.load(path)
+
+        _write_json(tmp_path / "body.json", {"id": 22})
+
+        assert cache.load(path) == {"id": 22}
+
+    def test_bounded_by_file_sizes(self, tmp_path):
+        """Least recently used files are evicted; files over the budget are not cached."""
+        paths = [_write_json(tmp_path / f"{name}.json", {"v": "x" * 40}) for name in "abc"]
+        size = os.path.getsize(paths[0])
+        cache = ReadCache(max_bytes=2 * size)
+
+        a = cache.load(paths[0])
+        cache.load(paths[1])
+        cache.load(paths[0])
+        cache.load(paths[2])
+
+        assert len(cache) == 2
+        assert cache.load(paths[0]) is a
+        big = _write_json(tmp_path / "big.json", {"v": "x" * 200})
+        assert cache.load(big) is not cache.load(big)
+
+    def test_disabled(self, tmp_path):
+        """max_bytes=0 parses every time."""
+        path = _write_json(tmp_path / "body.json", {"id": 1})
+        cache = ReadCache(max_bytes=0)
+
+        assert cache.load(path) is not cache.load(path)
+        assert len(cache) == 0
+
+
+class TestRunnerRead:
+    """Test read() in steps."""
+
+    def test_request_body_shared_across_iterations(self, tmp_path, monkeypatch):
+        """Each data iteration reuses the parsed body and the resolved path."""
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "data").mkdir()
+        _write_json(tmp_path / "data" / "order.json", {"items": [{"sku": "A-1"}]})
+        runner = PyRateRunner()
+        bodies = []
+
+        for row in ({"n": 1}, {"n": 2}):
+            runner.context = runner._new_scenario_context(row)
+            runner._process_step("And request read('order.json')", {})
+            bodies.append(runner.context['request_body'])
+
+        assert bodies[0] is bodies[1] and bodies[0] == {"items": [{"sku": "A-1"}]}
+        assert runner._resolved_paths == {(str(tmp_path), "order.json"): os.path.join("data", "order.json")}
@@ -0,0 +1,69 @@
+"""
+Tests for pooled HTTP sessions.
+
+Uses a local HTTP/1.1 server so no external network is needed.
+"""
+from pyrate.core import PyRateRunner
+from pyrate.config import PyRateConfig
+from pyrate.http_client import SessionPool
+
+
+class TestSessionPool:
+    """Test session reuse per host."""
+
+    def test_same_host_shares_session(self):
+        """URLs on the same scheme and host share one session."""
+        pool = SessionPool()
+        assert pool.session_for("https://api.example.com/a") is pool.session_for("https://API.example.com/b")
+        assert len(pool) == 1
+
+    def test_different_hosts_use_different_sessions(self):
+        """Each host gets its own session."""
+        pool = SessionPool()
+        assert pool.session_for("https://a.example.com") is not pool.session_for("https://b.example.com")
+        assert pool.session_for("http://a.example.com") is not pool.session_for("https://a.example.com")
+
+    def test_connection_reused(self, server, server_connections):
+        """Consecutive requests reuse the same keep-alive connection."""
+        pool = SessionPool(pool_size=2)
+        for i in range(3):
+            assert pool.request("GET", f"{server}/users/{i}", timeout=5).status_code == 200
+        pool.close()
+
+        assert len(server_connections) == 1
+
+    def test_cookies_not_persisted(self, server):
+        """Cookies set by a response are not sent on later requests."""
+        pool = SessionPool()
+        pool.request("GET", f"{server}/login", timeout=5)
+        res = pool.request("GET", f"{server}/me", timeout=5)
+        pool.close()
+
+        assert res.json()["cookie"] is None
+
+    def test_close_drops_sessions(self):
+        """close() empties the pool."""
+        pool = SessionPool()
+        pool.session_for("https://api.example.com")
+        pool.close()
+        assert len(pool) == 0
+
+
+class TestRunnerUsesPool:
+    """Test API steps through the runner."""
+
+    def test_method_step_uses_pooled_session(self, server):
+        """method steps go through the runner's session pool."""
+        runner = PyRateRunner(config=PyRateConfig(api_pool_size=4))
+        runner.context = runner.base_context.copy()
+
+        log = runner._execute_lines([
+            f"Given url '{server}'",
+            "And path 'users/1'",
+            "When method get",
+            "Then status 200",
+            "And match response.path == '/users/1'",
+        ])
+
+        assert [step['status'] for step in log] == ["PASS"] * 5
+        assert len(runner.http) == 1
@@ -0,0 +1,162 @@
+"""
+Tests for parallel feature execution.
+"""
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from pyrate.config import PyRateConfig
+from pyrate.core import PyRateRunner, _map_window
+from pyrate.parallel import collect_features, run_parallel
+
+
+def _write_feature(folder, name, value):
+    path = folder / name
+    path.write_text(f"Scenario: {name}\n    * def value = {value}\n    * print value\n", encoding="utf-8")
+    return str(path)
+
+
+class TestCollectFeatures:
+    """Test feature discovery."""
+
+    def test_sorted_recursive(self, tmp_path):
+        """Feature files are found recursively, folder by folder, in sorted order."""
+        (tmp_path / "b").mkdir()
+        _write_feature(tmp_path, "z.feature", 1)
+        _write_feature(tmp_path / "b", "a.feature", 2)
+        (tmp_path / "notes.txt").write_text("x")
+
+        files = collect_features(str(tmp_path))
+
+        assert files == [str(tmp_path / "z.feature"), str(tmp_path / "b" / "a.feature")]
+
+
+class TestRunParallel:
+    """Test process-pool execution."""
+
+    def test_logs_merged_in_file_order(self, tmp_path, monkeypatch):
+        """Worker logs are merged in submission order into one report."""
+        monkeypatch.chdir(tmp_path)
+        features = tmp_path / "features"
+        features.mkdir()
+        files = [_write_feature(features, f"f{i}.feature", i) for i in range(4)]
+        config = PyRateConfig(evidence_folder="evidence", reports_folder="reports")
+
+        log, ok = run_parallel(files, workers=2, config=config)
+
+        assert ok
+        assert [step['response_data'] for step in log if step['raw_command'].startswith('* print')] == \
+            ['0', '1', '2', '3']
+        assert os.path.exists(tmp_path / "reports" / "ultimo_reporte.html")
+
+    def test_workers_use_own_evidence_folders(self, tmp_path, monkeypatch):
+        """Each worker writes evidence into its own subfolder."""
+        monkeypatch.chdir(tmp_path)
+        files = [_write_feature(tmp_path, f"f{i}.feature", i) for i in range(2)]
+        config = PyRateConfig(evidence_folder="evidence", reports_folder="reports")
+
+        run_parallel(files, workers=2, config=config, report=False)
+
+        subfolders = os.listdir(tmp_path / "evidence")
+        assert subfolders and all(name.startswith("worker-") for name in subfolders)
+        assert not os.path.exists(tmp_path / "reports" / "ultimo_reporte.html")
+
+    def test_failure_propagates(self, tmp_path, monkeypatch):
+        """A failing feature marks the merged run as failed."""
+        monkeypatch.chdir(tmp_path)
+        ok_file = _write_feature(tmp_path, "ok.feature", 1)
+        bad_file = tmp_path / "bad.feature"
+        bad_file.write_text("Scenario: bad\n    And fly to the moon\n", encoding="utf-8")
+        config = PyRateConfig(evidence_folder="evidence", reports_folder="reports")
+
+        log, ok = run_parallel([ok_file, str(bad_file)], workers=2, config=config, report=False)
+
+        assert not ok
+        assert log[-1]['status'] == "FAIL"
+
+    def test_cli_parallel_creates_no_parent_runner(self, tmp_path, monkeypatch):
+        """`pyrate run <folder> -n N` leaves the runners to the workers."""
+        import sys
+        import pyrate.core
+        import pyrate.parallel
+        from pyrate.cli import main
+        monkeypatch.chdir(tmp_path)
+        _write_feature(tmp_path, "a.feature", 1)
+        calls = []
+        monkeypatch.setattr(pyrate.parallel, "run_parallel", lambda files, workers, **kwargs: calls.append(files))
+        monkeypatch.setattr(pyrate.core, "PyRateRunner", None)  # Any use in the parent fails
+        monkeypatch.setattr(sys, "argv", ["pyrate", "run", str(tmp_path), "-n", "2"])
+
+        main()
+
+        assert calls == [[str(tmp_path / "a.feature")]]
+
+
+class TestParallelIterations:
+    """Test thread-pool execution of data-driven iterations."""
+
+    def _data_feature(self, tmp_path, rows, tag=""):
+        csv_file = tmp_path / "users.csv"
+        csv_file.write_text("user\n" + "\n".join(rows) + "\n", encoding="utf-8")
+        feature = tmp_path / "data.feature"
+        feature.write_text(
+            f"Data source: {csv_file}\n{tag}\nScenario: per row\n"
+            "    * def greeting = 'hola-#(user)'\n"
+            "    * print greeting\n",
+            encoding="utf-8"
+        )
+        return str(feature)
+
+    def test_iteration_workers_keep_order(self, tmp_path, monkeypatch):
+        """Rows run concurrently but the log follows dataset order."""
+        monkeypatch.chdir(tmp_path)
+        rows = [f"u{i}" for i in range(20)]
+        feature = self._data_feature(tmp_path, rows)
+        runner = PyRateRunner(config=PyRateConfig(iteration_workers=4))
+
+        runner.execute_file(feature, report=False)
+
+        prints = [s for s in runner.execution_log if s['raw_command'].startswith('* print')]
+        assert [s['response_data'] for s in prints] == [f"'hola-u{i}'" for i in range(20)]
+        assert [s['iteration'] for s in prints] == list(range(1, 21))
+        assert runner.is_success
+
+    def test_parallel_iterations_do_not_leak_vars(self, tmp_path, monkeypatch):
+        """Variables defined in one parallel iteration are not shared."""
+        monkeypatch.chdir(tmp_path)
+        feature = self._data_feature(tmp_path, ["a", "b"])
+        runner = PyRateRunner(config=PyRateConfig(iteration_workers=2))
+
+        runner.execute_file(feature, report=False)
+
+        assert 'greeting' not in runner.base_context['vars']
+        assert 'user' not in runner.base_context['vars']
+
+    def test_rows_read_a_window_ahead(self):
+        """Parallel iterations pull rows from the stream only a window ahead."""
+        consumed = []
+
+        def rows():
+            for i in range(100):
+                consumed.append(i)
+                yield i
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            results = _map_window(pool, lambda x: x * 2, rows(), window=4)
+            first = next(results)
+            assert first == 0 and len(consumed) <= 4
+            assert list(results) == [x * 2 for x in range(1, 100)]
+
+    def test_parallel_tag_enables_threads(self, tmp_path):
+        """A @parallel tag opts a feature in."""
+        feature = self._data_feature(tmp_path, ["a", "b"], tag="# @parallel")
+        runner = PyRateRunner()
+
+        assert runner._iteration_workers(runner.plan_cache.load(feature)) > 1
+
+    def test_ui_features_stay_sequential(self, tmp_path):
+        """Features with browser steps never run iterations in threads."""
+        feature = tmp_path / "ui.feature"
+        feature.write_text("# @parallel\nScenario: ui\n    Given driver 'https://example.com'\n", encoding="utf-8")
+        runner = PyRateRunner(config=PyRateConfig(iteration_workers=4))
+
+        assert runner._iteration_workers(runner.plan_cache.load(str(feature))) == 1
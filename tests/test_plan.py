@@ -0,0 +1,148 @@
+"""
+Tests for compiled feature plans and the plan cache.
+"""
+import os
+import pytest
+from pyrate.plan import PlanCache, StepPlan, compile_steps, parse_feature
+
+
+FEATURE = """Data source: 'tests/data/users.csv'
+# @smoke
+Scenario: Get user
+    # Set base URL
+    Given url 'https://api.example.com'
+    And path 'users/1'
+    When method get
+
+# @regression
+Scenario: Second
+    * def a = 1
+"""
+
+
+class TestCompileSteps:
+    """Test step compilation."""
+
+    def test_keyword_verb_and_arguments(self):
+        """Steps are split into keyword, verb and arguments."""
+        step, = compile_steps(["And click '#login'"])
+
+        assert step.keyword == "And"
+        assert step.verb == "click"
+        assert step.arguments == "'#login'"
+
+    def test_star_prefix_without_keyword(self):
+        """'* def' steps have no keyword."""
+        step, = compile_steps(["* def token = abc"])
+
+        assert step.keyword is None
+        assert step.verb == "def"
+        assert step.arguments == "token = abc"
+
+    def test_description_attached_to_next_step(self):
+        """Only the last comment before a command is kept as description."""
+        steps = compile_steps(["# first", "# second", "Given url 'x'", "And path 'y'"])
+
+        assert steps[0].description == "second"
+        assert steps[1].description is None
+
+    def test_tags_and_empty_lines_skipped(self):
+        """Tags and blank lines are not steps or descriptions."""
+        steps = compile_steps(["@smoke", "# @ui @regression", "", "Given url 'x'"])
+
+        assert len(steps) == 1
+        assert steps[0].description is None
+
+    def test_empty_comment_is_not_description(self):
+        """An empty comment clears the pending description."""
+        steps = compile_steps(["# describe", "#", "Given url 'x'"])
+
+        assert steps[0].description is None
+
+
+class TestParseFeature:
+    """Test feature parsing."""
+
+    def test_scenarios_and_tags(self):
+        """Scenarios keep their names, normalized tags and steps."""
+        plan = parse_feature(FEATURE.splitlines(keepends=True))
+
+        assert [sc.name for sc in plan.scenarios] == ["Get user", "Second"]
+        assert plan.scenarios[0].tags == ("smoke",)
+        assert plan.tags == frozenset({"smoke", "regression"})
+        assert plan.scenarios[0].steps[0].description == "Set base URL"
+
+    def test_data_source(self):
+        """Data source line is extracted without quotes."""
+        plan = parse_feature(FEATURE.splitlines(keepends=True))
+
+        assert plan.data_source == "tests/data/users.csv"
+
+    def test_default_scenario(self):
+        """Files without Scenario: produce a single Default scenario."""
+        plan = parse_feature(["Given url 'x'\n", "When method get\n"])
+
+        assert len(plan.scenarios) == 1
+        assert plan.scenarios[0].name == "Default"
+
+    def test_plan_is_immutable(self):
+        """Compiled plans cannot be modified."""
+        plan = parse_feature(FEATURE.splitlines(keepends=True))
+
+        with pytest.raises(AttributeError):
+            plan.scenarios[0].name = "changed"
+
+
+class TestPlanCache:
+    """Test in-memory and on-disk caching."""
+
+    def test_same_plan_returned_while_unchanged(self, tmp_path):
+        """Unchanged files are served from memory."""
+        feature = tmp_path / "a.feature"
+        feature.write_text(FEATURE, encoding="utf-8")
+        cache = PlanCache()
+
+        assert cache.load(str(feature)) is cache.load(str(feature))
+
+    def test_edited_file_is_recompiled(self, tmp_path):
+        """Content changes produce a new plan."""
+        feature = tmp_path / "a.feature"
+        feature.write_text("Given url 'x'\n", encoding="utf-8")
+        cache = PlanCache()
+        first = cache.load(str(feature))
+
+        feature.write_text("Given url 'x'\nAnd path 'y'\n", encoding="utf-8")
+        second = cache.load(str(feature))
+
+        assert first is not second
+        assert len(second.scenarios[0].steps) == 2
+
+    def test_touched_file_keeps_plan(self, tmp_path):
+        """A new mtime with identical content reuses the plan."""
+        feature = tmp_path / "a.feature"
+        feature.write_text(FEATURE, encoding="utf-8")
+        cache = PlanCache()
+        first = cache.load(str(feature))
+
+        stat = os.stat(feature)
+        os.utime(feature, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        assert cache.load(str(feature)) is first
+
+    def test_disk_cache_shared_between_instances(self, tmp_path):
+        """Plans written to disk are reused by a fresh cache."""
+        feature = tmp_path / "a.feature"
+        feature.write_text(FEATURE, encoding="utf-8")
+        folder = tmp_path / "cache"
+
+        PlanCache(cache_folder=str(folder)).load(str(feature))
+        assert len(os.listdir(folder)) == 1
+
+        plan = PlanCache(cache_folder=str(folder)).load(str(feature))
+        assert isinstance(plan.scenarios[0].steps[0], StepPlan)
+        assert plan.scenarios[0].name == "Get user"
+
+    def test_missing_file_raises(self, tmp_path):
+        """Missing files raise OSError."""
+        with pytest.raises(OSError):
+            PlanCache().load(str(tmp_path / "missing.feature"))
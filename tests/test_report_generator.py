@@ -0,0 +1,193 @@
+"""
+Tests for report generation over a run.
+"""
+import json
+import os
+import re
+from io import BytesIO
+
+import pytest
+from pyrate.config import PyRateConfig
+from pyrate.core import PyRateRunner
+from pyrate.report_generator import ReportCheckpoint, generate_report, load_checkpoint
+
+
+def _feature(folder, name, value):
+    path = folder / name
+    path.write_text(f"Scenario: {name}\n    * def value = {value}\n    * print value\n", encoding="utf-8")
+    return str(path)
+
+
+@pytest.fixture
+def reports(monkeypatch):
+    """Record generate_report() calls made by the runner."""
+    calls = []
+    monkeypatch.setattr("pyrate.core.generate_report", lambda log, ok, *args: calls.append(len(log)))
+    return calls
+
+
+class TestGenerateReport:
+    """Test the streamed HTML dashboard."""
+
+    def test_cards_and_latest_copy(self, tmp_path):
+        """Every iteration gets a card and the latest report has the same content."""
+        log = [
+            {"name": "step a", "status": "PASS", "iteration": 1, "response_data": "{}"},
+            {"name": "step b", "status": "FAIL", "iteration": 2, "error": "boom", "screenshot": "QUJD"},
+        ]
+
+        path = generate_report(log, False, str(tmp_path / "out"))
+
+        html = open(path, encoding="utf-8").read()
+        assert html.count('class="iteration-card"') == 2
+        assert "Test Case #2 - FALLIDO" in html
+        assert "base64" not in html
+        assert "loading='lazy'" in html
+        assert html.rstrip().endswith("</html>")
+        latest = tmp_path / "out" / "ultimo_reporte.html"
+        assert latest.read_text(encoding="utf-8") == html
+
+    def test_screenshots_written_next_to_report(self, tmp_path):
+        """Failed-step captures become files with a JPEG thumbnail."""
+        Image = pytest.importorskip("PIL.Image")
+        buffer = BytesIO()
+        Image.new("RGB", (1200, 800), "blue").save(buffer, format="PNG")
+        log = [{"name": "s", "status": "FAIL", "iteration": 1, "screenshot_bytes": buffer.getvalue(),
+                "screenshot": "unused"}]
+
+        path = generate_report(log, False, str(tmp_path))
+
+        html = open(path, encoding="utf-8").read()
+        full = re.search(r"href='([^']+)'", html).group(1)
+        thumb = re.search(r"<img class='thumb' src='([^']+)'", html).group(1)
+        assert (tmp_path / full).read_bytes() == buffer.getvalue()
+        assert thumb.startswith("screenshots/thumbs/")
+        assert max(Image.open(tmp_path / thumb).size) == 320
+
+    def test_latest_is_replaced(self, tmp_path):
+        """A later report replaces the latest one without touching older reports."""
+        first = generate_report([{"name": "one", "status": "PASS", "iteration": 1}], True, str(tmp_path))
+        first_html = open(first, encoding="utf-8").read()
+        os.rename(first, first + ".old")
+
+        generate_report([{"name": "two", "status": "PASS", "iteration": 1}], True, str(tmp_path))
+
+        assert "two" in (tmp_path / "ultimo_reporte.html").read_text(encoding="utf-8")
+        assert open(first + ".old", encoding="utf-8").read() == first_html
+
+    def test_large_log(self, tmp_path):
+        """Large logs render without building the whole page in memory."""
+        log = [{"name": f"step {i}", "status": "PASS", "iteration": i // 10 + 1} for i in range(20000)]
+
+        path = generate_report(log, True, str(tmp_path), paged_threshold=len(log))
+
+        assert open(path, encoding="utf-8").read().count('class="iteration-card"') == 2000
+
+
+class TestPagedReport:
+    """Test the paged viewer used for large logs."""
+
+    def _log(self):
+        return [
+            {"name": "a", "status": "PASS", "iteration": 1, "scenario": "login", "tags": ["smoke"]},
+            {"name": "b", "status": "FAIL", "iteration": 2, "error": "boom", "scenario": "cart", "tags": []},
+        ]
+
+    def test_data_in_sidecar(self, tmp_path):
+        """Above the threshold, steps go to a JS sidecar instead of static cards."""
+        path = generate_report(self._log(), False, str(tmp_path), paged_threshold=1)
+
+        html = open(path, encoding="utf-8").read()
+        sidecar = re.search(r'<script src="(report_[^"]+\.data\.js)"', html).group(1)
+        assert "boom" not in html
+        assert 'id="filter-tag"' in html
+
+        data = (tmp_path / sidecar).read_text(encoding="utf-8")
+        cases = json.loads(data[data.index("["):data.rindex("]") + 1])
+        assert [c["n"] for c in cases] == [1, 2]
+        assert cases[0]["tags"] == ["smoke"] and cases[1]["scenarios"] == ["cart"]
+        assert cases[1]["fail"] and cases[1]["steps"][0][:3] == ["b", "FAIL", "boom"]
+
+    def test_small_logs_stay_static(self, tmp_path):
+        """Below the threshold, the static dashboard is kept."""
+        path = generate_report(self._log(), False, str(tmp_path))
+
+        assert open(path, encoding="utf-8").read().count('class="iteration-card"') == 2
+        assert not list(tmp_path.glob("*.data.js"))
+
+    def test_records_carry_scenario_and_tags(self, tmp_path, monkeypatch, reports):
+        """Step records know their scenario and tags, for the report filters."""
+        monkeypatch.chdir(tmp_path)
+        feature = tmp_path / "t.feature"
+        feature.write_text("# @smoke @login\nScenario: entrar\n    * def a = 1\n", encoding="utf-8")
+        runner = PyRateRunner()
+
+        runner.execute_file(str(feature))
+
+        assert runner.execution_log[0]['scenario'] == "entrar"
+        assert runner.execution_log[0]['tags'] == ["login", "smoke"]
+
+
+class TestReportPerRun:
+    """Test when the runner renders the HTML report."""
+
+    def test_run_reports_once_on_close(self, tmp_path, monkeypatch, reports):
+        """Inside a run, files are not reported individually."""
+        monkeypatch.chdir(tmp_path)
+        files = [_feature(tmp_path, f"f{i}.feature", i) for i in range(3)]
+
+        with PyRateRunner() as runner:
+            for feature in files:
+                runner.execute_file(feature)
+            assert reports == []
+
+        assert reports == [6]
+
+    def test_standalone_file_reports(self, tmp_path, monkeypatch, reports):
+        """Outside a run, execute_file still reports by default."""
+        monkeypatch.chdir(tmp_path)
+
+        PyRateRunner().execute_file(_feature(tmp_path, "a.feature", 1))
+
+        assert reports == [2]
+
+    def test_run_without_report(self, tmp_path, monkeypatch, reports):
+        """start_run(report=False) leaves reporting to the caller."""
+        monkeypatch.chdir(tmp_path)
+        runner = PyRateRunner().start_run(report=False)
+        runner.execute_file(_feature(tmp_path, "a.feature", 1))
+        runner.close()
+
+        assert reports == []
+
+
+class TestReportCheckpoint:
+    """Test the incremental JSONL checkpoint."""
+
+    def test_appends_only_new_records(self, tmp_path):
+        """Each append writes the records added since the previous one."""
+        path = str(tmp_path / "reports" / "checkpoint.jsonl")
+        checkpoint = ReportCheckpoint(path)
+        log = [{"name": "a", "status": "PASS", "screenshot_bytes": b"png"}]
+
+        assert checkpoint.append(log) == 1
+        log.append({"name": "b", "status": "FAIL", "screenshot_bytes": None})
+        assert checkpoint.append(log) == 1
+        assert checkpoint.append(log) == 0
+
+        records = load_checkpoint(path)
+        assert [r['name'] for r in records] == ["a", "b"]
+        assert 'screenshot_bytes' not in records[0]
+
+    def test_run_writes_checkpoint_per_file(self, tmp_path, monkeypatch, reports):
+        """With report_checkpoint, finished files are appended during the run."""
+        monkeypatch.chdir(tmp_path)
+        files = [_feature(tmp_path, f"f{i}.feature", i) for i in range(2)]
+        checkpoint = tmp_path / "reports" / "checkpoint.jsonl"
+
+        with PyRateRunner(config=PyRateConfig(report_checkpoint=True)) as runner:
+            runner.execute_file(files[0])
+            assert len(load_checkpoint(str(checkpoint))) == 2
+            runner.execute_file(files[1])
+
+        assert len(load_checkpoint(str(checkpoint))) == 4
@@ -0,0 +1,109 @@
+"""
+Tests for the screenshot capture policy.
+
+Browser steps run against the fake_playwright fixture from conftest.py.
+"""
+from io import BytesIO
+
+import pytest
+from pyrate.config import PyRateConfig
+from pyrate.core import PyRateRunner
+from pyrate.screenshots import ScreenshotPolicy
+
+
+def _run(tmp_path, monkeypatch, fake_playwright, steps, **config):
+    monkeypatch.chdir(tmp_path)
+    runner = PyRateRunner(config=PyRateConfig(evidence_folder="evidence", **config))
+    runner.context = runner.base_context.copy()
+    log = runner._execute_lines(["Given driver 'https://example.com'"] + steps)
+    page = runner.context['page']
+    return runner, log, page
+
+
+class TestScreenshotPolicy:
+    """Test capture decisions."""
+
+    def test_defaults_follow_screenshot_on_pass(self):
+        """Without a mode, screenshot_on_pass selects all or failures."""
+        assert ScreenshotPolicy.from_config(PyRateConfig()).mode == "all"
+        assert ScreenshotPolicy.from_config(PyRateConfig(screenshot_on_pass=False)).mode == "failures"
+
+    def test_every_n(self):
+        """every_n captures every n-th step."""
+        policy = ScreenshotPolicy(mode="every_n", every=3)
+        assert [policy.capture_after_step(n, 9) for n in range(1, 7)] == [False, False, True, False, False, True]
+
+    def test_last_step(self):
+        """last_step captures only the final step."""
+        policy = ScreenshotPolicy(mode="last_step")
+        assert not policy.capture_after_step(2, 3)
+        assert policy.capture_after_step(3, 3)
+
+    def test_off_disables_failures(self):
+        """The off mode also skips failing steps."""
+        assert not ScreenshotPolicy(mode="off", on_fail=True).on_fail
+
+    def test_invalid_options_rejected(self):
+        """Unknown modes, formats or clips fail validation."""
+        with pytest.raises(ValueError):
+            PyRateConfig(screenshot_mode="sometimes")
+        with pytest.raises(ValueError):
+            PyRateConfig(screenshot_format="gif")
+        with pytest.raises(ValueError):
+            PyRateConfig(screenshot_clip="window")
+        assert PyRateConfig(screenshot_format="jpg").screenshot_format == "jpeg"
+
+
+class TestRunnerCapture:
+    """Test screenshots taken while running UI steps."""
+
+    def test_failures_mode_skips_passing_steps(self, tmp_path, monkeypatch, fake_playwright):
+        """screenshot_on_pass=False leaves passing steps without images."""
+        runner, log, page = _run(tmp_path, monkeypatch, fake_playwright, ["And click '#a'"],
+                                 screenshot_on_pass=False)
+
+        assert all(step['screenshot_bytes'] is None for step in log)
+        assert page.screenshots == []
+
+    def test_failure_captured(self, tmp_path, monkeypatch, fake_playwright):
+        """Failing steps are captured and base64-encoded for the report."""
+        runner, log, page = _run(tmp_path, monkeypatch, fake_playwright, ["And fly away"],
+                                 screenshot_mode="failures")
+
+        assert log[-1]['status'] == "FAIL"
+        assert log[-1]['screenshot']
+        assert len(page.screenshots) == 1
+
+    def test_navigation_mode(self, tmp_path, monkeypatch, fake_playwright):
+        """Only steps that change the URL are captured."""
+        runner, log, page = _run(tmp_path, monkeypatch, fake_playwright,
+                                 ["And click '#a'", "And click '#next'"], screenshot_mode="navigation")
+
+        assert [step['screenshot_bytes'] is not None for step in log] == [True, False, True]
+
+    def test_jpeg_options(self, tmp_path, monkeypatch, fake_playwright):
+        """Format, quality and full-page clip are passed to Playwright."""
+        runner, log, page = _run(tmp_path, monkeypatch, fake_playwright, [],
+                                 screenshot_format="jpeg", screenshot_quality=60, screenshot_clip="full_page")
+
+        assert page.screenshots == [{"type": "jpeg", "quality": 60, "full_page": True}]
+        assert log[0]['screenshot_type'] == "image/jpeg"
+
+    def test_element_clip(self, tmp_path, monkeypatch, fake_playwright):
+        """The element clip captures the step's target, the viewport otherwise."""
+        runner, log, page = _run(tmp_path, monkeypatch, fake_playwright, ["And click '#a'"],
+                                 screenshot_clip="element")
+
+        assert page.screenshots == [{"type": "png", "full_page": False}, {"type": "png", "element": "#a"}]
+
+    def test_max_dimension(self, tmp_path, monkeypatch, fake_playwright):
+        """Large captures are downscaled to the configured size."""
+        Image = pytest.importorskip("PIL.Image")
+        buffer = BytesIO()
+        Image.new("RGB", (400, 200), "red").save(buffer, format="PNG")
+        runner, log, page = _run(tmp_path, monkeypatch, fake_playwright, [], screenshot_max_dimension=100)
+        page.image = buffer.getvalue()
+
+        log = runner._execute_lines(["And click '#a'"])
+
+        assert Image.open(BytesIO(log[0]['screenshot_bytes'])).size == (100, 50)
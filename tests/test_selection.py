@@ -0,0 +1,111 @@
+"""
+Tests for data row selection (ranges, filters, sampling and shards).
+"""
+import math
+import os
+
+import pytest
+from pyrate.config import PyRateConfig
+from pyrate.core import PyRateRunner
+from pyrate.exceptions import DataFileError
+from pyrate.selection import parse_row_range, parse_shard, select_rows
+
+
+def _rows(count):
+    return ({"id": i + 1, "even": (i + 1) % 2 == 0} for i in range(count))
+
+
+def _ids(selected):
+    return [row["id"] for _, row in selected]
+
+
+class TestParsing:
+    """Test option parsing."""
+
+    @pytest.mark.parametrize("spec, expected", [
+        ("1000:2000", (1000, 2000)), ("500:", (500, None)), (":100", (1, 100)), ("42", (42, 42)),
+    ])
+    def test_row_ranges(self, spec, expected):
+        """Ranges are 1-based and inclusive; either end may be omitted."""
+        assert parse_row_range(spec) == expected
+
+    @pytest.mark.parametrize("spec", ["0:10", "10:5", "a:b"])
+    def test_invalid_row_ranges(self, spec):
+        """Empty or malformed ranges are rejected."""
+        with pytest.raises(ValueError, match="Rango de filas"):
+            parse_row_range(spec)
+
+    def test_shards(self):
+        """Shards are k/n with 1 <= k <= n."""
+        assert parse_shard("3/8") == (3, 8)
+        for spec in ("0/8", "9/8", "3"):
+            with pytest.raises(ValueError, match="Shard"):
+                parse_shard(spec)
+
+    def test_config_validates_options(self):
+        """Invalid selections fail when the configuration is built."""
+        with pytest.raises(ValueError):
+            PyRateConfig(data_filter="id ==")
+        with pytest.raises(ValueError):
+            PyRateConfig(data_shard="2/1")
+
+
+class TestSelectRows:
+    """Test row selection on streamed rows."""
+
+    def test_range_stops_reading(self):
+        """Rows after the range are never read."""
+        rows = _rows(1000)
+
+        assert _ids(select_rows(rows, rows_range="3:5")) == [3, 4, 5]
+        assert next(rows)["id"] == 6
+
+    def test_filter(self):
+        """Columns are variables of the expression; `row` is the whole row."""
+        rows = [{"id": 1, "first name": "Ana", "age": 30}, {"id": 2, "first name": "Bo", "age": math.nan}]
+
+        assert _ids(select_rows(rows, row_filter="age >= 18")) == [1]
+        assert _ids(select_rows(rows, row_filter="len(row['first name']) == 2")) == [2]
+
+    def test_filter_error_has_row_number(self):
+        """A failing expression reports the row it failed on."""
+        with pytest.raises(DataFileError, match="fila 1"):
+            list(select_rows([{"id": 1}], row_filter="missing > 1"))
+
+    def test_sample_is_reproducible(self):
+        """With a seed the same rows are picked, in file order."""
+        first = _ids(select_rows(_rows(1000), sample=10, seed=7))
+
+        assert first == _ids(select_rows(_rows(1000), sample=10, seed=7))
+        assert len(first) == 10 and first == sorted(first)
+        assert _ids(select_rows(_rows(5), sample=10, seed=7)) == [1, 2, 3, 4, 5]
+
+    def test_shards_partition_rows(self):
+        """The n shards of a selection are disjoint and cover it."""
+        shards = [_ids(select_rows(_rows(20), row_filter="even", shard=f"{k}/3")) for k in (1, 2, 3)]
+
+        assert shards[0] == [2, 8, 14, 20]
+        assert sorted(sum(shards, [])) == list(range(2, 21, 2))
+
+    def test_indexes_are_file_positions(self):
+        """Selected rows keep their zero-based position in the file."""
+        assert [index for index, _ in select_rows(_rows(10), rows_range="4:6")] == [3, 4, 5]
+
+
+class TestRunnerSelection:
+    """Test row selection in the runner."""
+
+    def test_iterations_keep_row_numbers(self, tmp_path, monkeypatch):
+        """Only selected rows run, numbered as in the data file."""
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "rows.csv").write_text("n\n" + "".join(f"{i}\n" for i in range(1, 11)), encoding="utf-8")
+        feature = tmp_path / "t.feature"
+        feature.write_text("Data source: rows.csv\nScenario: calc\n    * def a = #(n)\n", encoding="utf-8")
+        config = PyRateConfig(evidence_folder="evidence", data_rows="2:9", data_filter="n % 2 == 0",
+                              data_shard="2/2")
+        runner = PyRateRunner(config=config)
+
+        runner.execute_file(str(feature), report=False)
+
+        assert [step["iteration"] for step in runner.execution_log] == [4, 8]
+        assert sorted(os.listdir(tmp_path / "evidence")) == ["API_calc_Iter4.txt", "API_calc_Iter8.txt"]
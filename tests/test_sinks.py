@@ -0,0 +1,127 @@
+"""
+Tests for the JSON Lines and JUnit XML result sinks.
+"""
+import json
+from xml.etree import ElementTree as ET
+
+from pyrate.config import PyRateConfig
+from pyrate.core import PyRateRunner
+from pyrate.parallel import run_parallel
+from pyrate.sinks import ResultStream, group_scenarios, write_junit
+
+
+def _read_jsonl(path):
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+def _step(name, status="PASS", feature="a.feature", scenario="login", iteration=1, error=None):
+    return {"name": name, "status": status, "feature": feature, "scenario": scenario,
+            "iteration": iteration, "tags": [], "error": error, "duration": 0.5}
+
+
+class TestResultStream:
+    """Test the streamed JSON Lines results."""
+
+    def test_lines_flushed_as_written(self, tmp_path):
+        """Each record is on disk before the stream is closed."""
+        stream = ResultStream(str(tmp_path / "results.jsonl"))
+
+        stream.step({**_step("a"), "screenshot_bytes": b"png", "screenshot": "cG5n"})
+        stream.scenario([_step("a"), _step("b", "FAIL", error="boom")])
+
+        records = _read_jsonl(tmp_path / "results.jsonl")
+        assert records[0]["type"] == "step" and "screenshot_bytes" not in records[0]
+        assert records[1] == {
+            "type": "scenario", "feature": "a.feature", "scenario": "login", "iteration": 1,
+            "tags": [], "status": "FAIL", "steps": 2, "duration": 1.0, "error": "boom"
+        }
+
+    def test_reopens_in_append_mode(self, tmp_path):
+        """Writes after close() are appended, not truncated."""
+        stream = ResultStream(str(tmp_path / "results.jsonl"))
+        stream.step(_step("a"))
+        stream.close()
+
+        stream.step(_step("b"))
+
+        assert [r["name"] for r in _read_jsonl(tmp_path / "results.jsonl")] == ["a", "b"]
+
+    def test_runner_streams_steps_and_scenarios(self, tmp_path, monkeypatch):
+        """The runner writes each step, then the scenario summary."""
+        monkeypatch.chdir(tmp_path)
+        feature = tmp_path / "t.feature"
+        feature.write_text(
+            "Scenario: ok\n    * def a = 1\n    * print a\n"
+            "Scenario: ko\n    * def b = 2\n    * unknown step\n    * print b\n",
+            encoding="utf-8"
+        )
+        runner = PyRateRunner(config=PyRateConfig(results_jsonl=True, results_junit=True))
+
+        runner.execute_file(str(feature))
+
+        records = _read_jsonl(tmp_path / "reports" / "results.jsonl")
+        assert [r["type"] for r in records] == ["step", "step", "scenario", "step", "step", "scenario"]
+        assert records[0]["feature"] == str(feature) and records[0]["duration"] >= 0
+        assert records[2]["status"] == "PASS" and records[5]["status"] == "FAIL"
+        assert (tmp_path / "reports" / "junit.xml").exists()
+
+
+class TestJUnit:
+    """Test JUnit XML output."""
+
+    def test_suites_and_cases(self, tmp_path):
+        """Features become suites and scenario runs become test cases."""
+        log = [
+            _step("a1", iteration=1), _step("a2", "FAIL", iteration=2, error="bad \x1b value"),
+            _step("b1", feature="b.feature", scenario="cart"),
+        ]
+
+        root = ET.parse(write_junit(log, str(tmp_path / "junit.xml"))).getroot()
+
+        assert (root.get("tests"), root.get("failures")) == ("3", "1")
+        suite_a, suite_b = root.findall("testsuite")
+        assert [c.get("name") for c in suite_a] == ["login [iteración 1]", "login [iteración 2]"]
+        assert suite_a.find("testcase[2]/failure").get("message") == "bad  value"
+        assert suite_b.find("testcase").get("name") == "cart"
+        assert suite_b.find("testcase").get("time") == "0.500"
+
+    def test_group_scenarios(self):
+        """Consecutive steps of a scenario run form one group."""
+        log = [_step("a"), _step("b"), _step("c", iteration=2), _step("d", scenario="other", iteration=2)]
+
+        assert [[s["name"] for s in g] for g in group_scenarios(log)] == [["a", "b"], ["c"], ["d"]]
+
+    def test_repeated_scenario_runs_stay_separate(self, tmp_path, monkeypatch):
+        """Adjacent runs with the same name and iteration are told apart by their run id."""
+        log = [{**_step("a"), "scenario_run": "1-1"}, {**_step("b"), "scenario_run": "1-2"}]
+        assert [[s["name"] for s in g] for g in group_scenarios(log)] == [["a"], ["b"]]
+
+        monkeypatch.chdir(tmp_path)
+        feature = tmp_path / "t.feature"
+        feature.write_text("Scenario: dup\n    * def a = 1\nScenario: dup\n    * unknown step\n", encoding="utf-8")
+        runner = PyRateRunner(config=PyRateConfig(results_junit=True))
+
+        runner.execute_file(str(feature))
+
+        suite = ET.parse(tmp_path / "reports" / "junit.xml").getroot().find("testsuite")
+        assert [c.get("name") for c in suite] == ["dup", "dup"]
+        assert [c.find("failure") is not None for c in suite] == [False, True]
+
+    def test_parallel_run(self, tmp_path, monkeypatch):
+        """The parent process streams worker results and writes JUnit at the end."""
+        monkeypatch.chdir(tmp_path)
+        files = []
+        for i in range(3):
+            path = tmp_path / f"f{i}.feature"
+            path.write_text(f"Scenario: s{i}\n    * def value = {i}\n", encoding="utf-8")
+            files.append(str(path))
+        config = PyRateConfig(evidence_folder="evidence", reports_folder="reports",
+                              results_jsonl=True, results_junit=True)
+
+        run_parallel(files, workers=2, config=config)
+
+        scenarios = [r for r in _read_jsonl(tmp_path / "reports" / "results.jsonl") if r["type"] == "scenario"]
+        assert [r["scenario"] for r in scenarios] == ["s0", "s1", "s2"]
+        root = ET.parse(tmp_path / "reports" / "junit.xml").getroot()
+        assert [s.get("name") for s in root.findall("testsuite")] == files
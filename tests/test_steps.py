@@ -0,0 +1,185 @@
+"""
+Unit tests for the step registry.
+
+Tests verb extraction, registry dispatch, the runner's registered commands and
+the variable layers of scenario contexts.
+"""
+
+import pytest
+from unittest.mock import Mock
+from pyrate.core import PyRateRunner
+from pyrate.exceptions import StepExecutionError
+from pyrate.steps import StepRegistry, step_verb
+
+
+class TestStepVerb:
+    """Test verb extraction from step lines."""
+
+    def test_verb_after_keyword(self):
+        """Verb is the word following Given/And/When/Then."""
+        assert step_verb("Given url 'https://example.com'") == "url"
+        assert step_verb("And click '#login'") == "click"
+        assert step_verb("When method get") == "method"
+        assert step_verb("Then status 200") == "status"
+
+    def test_verb_without_keyword(self):
+        """Lines without keyword use their first word."""
+        assert step_verb("* def token = response.token") == "def"
+        assert step_verb("print 'hello'") == "print"
+        assert step_verb("configure ssl false") == "configure"
+
+    def test_verb_is_lowercase(self):
+        """Verb lookup is case-insensitive."""
+        assert step_verb("GIVEN URL 'x'") == "url"
+
+    def test_empty_line(self):
+        """Empty lines have no verb."""
+        assert step_verb("") is None
+
+
+class TestStepRegistry:
+    """Test registration and resolution."""
+
+    def test_resolve_registered_step(self):
+        """Registered pattern should resolve to its handler."""
+        registry = StepRegistry()
+
+        @registry.step('wait', r'(?:Given|And)\s+wait (\d+)')
+        def step_wait(runner, match, step_record):
+            pass
+
+        handler, match = registry.resolve("And wait 3")
+        assert handler is step_wait
+        assert match.group(1) == "3"
+
+    def test_resolve_unknown_step(self):
+        """Unknown commands resolve to (None, None)."""
+        registry = StepRegistry()
+        assert registry.resolve("And fly away") == (None, None)
+
+    def test_patterns_tried_in_order(self):
+        """Patterns sharing a verb are tried in registration order."""
+        registry = StepRegistry()
+        registry.register('check', r'And check radio (.*)', 'radio')
+        registry.register('check', r'And check (.*)', 'checkbox')
+
+        assert registry.resolve("And check radio '#r'")[0] == 'radio'
+        assert registry.resolve("And check '#c'")[0] == 'checkbox'
+
+    def test_copy_is_independent(self):
+        """Copies can be extended without touching the original."""
+        registry = StepRegistry()
+        clone = registry.copy()
+        clone.register('hover', r'And hover (.*)', 'hover')
+
+        assert 'hover' in clone
+        assert 'hover' not in registry
+
+
+class TestRunnerDispatch:
+    """Test the runner's registered commands."""
+
+    def setup_method(self):
+        self.runner = PyRateRunner()
+        self.runner.context = {
+            'page': None,
+            'response': None,
+            'response_json': {},
+            'vars': {},
+            'headers': {},
+            'base_url': '',
+            'auth': None,
+            'verify_ssl': True,
+            'cert': None,
+            'request_body': None,
+            'last_method': 'UNKNOWN'
+        }
+
+    def test_api_setup_steps(self):
+        """url, path and header steps update the context."""
+        record = {}
+        self.runner._process_step("Given url 'https://api.example.com/'", record)
+        self.runner._process_step("And path '/users/1'", record)
+        self.runner._process_step("And header X-Trace = 'abc'", record)
+
+        assert self.runner.context['base_url'] == "https://api.example.com/users/1"
+        assert self.runner.context['headers']['X-Trace'] == "abc"
+
+    def test_def_and_print(self):
+        """def stores variables that print can evaluate."""
+        record = {}
+        self.runner._process_step("* def name = PyRate", record)
+        self.runner._process_step("* print 'Hola ' + name", record)
+
+        assert self.runner.context['vars']['name'] == "PyRate"
+        assert record['response_data'] == "Hola PyRate"
+
+    def test_configure_ssl(self):
+        """configure ssl toggles SSL verification."""
+        self.runner._process_step("configure ssl false", {})
+        assert self.runner.context['verify_ssl'] is False
+
+    def test_unknown_command_raises(self):
+        """Unknown commands raise StepExecutionError."""
+        with pytest.raises(StepExecutionError, match="Comando desconocido"):
+            self.runner._process_step("And fly to the moon", {})
+
+    def test_check_radio_reaches_radio_handler(self):
+        """check radio steps are not swallowed by the checkbox command."""
+        page = Mock()
+        self.runner.context['page'] = page
+
+        self.runner._process_step("And check radio '#gender-male'", {})
+
+        page.locator.assert_called_once_with('#gender-male')
+        page.locator.return_value.check.assert_called_once()
+
+    def test_scroll_to_top_with_any_keyword(self):
+        """Scroll shortcuts keep accepting any keyword."""
+        page = Mock()
+        self.runner.context['page'] = page
+
+        self.runner._process_step("When scroll to top", {})
+
+        page.evaluate.assert_called_once_with("window.scrollTo(0, 0)")
+
+
+class TestScenarioContext:
+    """Test the layered variables of scenario contexts."""
+
+    def _prints(self, runner):
+        return [s['response_data'] for s in runner.execution_log if s['raw_command'].startswith('* print')]
+
+    def test_layers_and_isolation(self, tmp_path, monkeypatch):
+        """Locals shadow the row, globals and environment, and end with their scenario."""
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv("PYRATE_ENV_VAR", "env")
+        (tmp_path / "rows.csv").write_text("user\nana\nbob\n", encoding="utf-8")
+        feature = tmp_path / "t.feature"
+        feature.write_text(
+            "Data source: rows.csv\n"
+            "Scenario: one\n    * def local = x-#(user)\n    * print local + '/' + PYRATE_ENV_VAR + '/' + level\n"
+            "    And header X-Trace = 'abc'\n"
+            "Scenario: two\n    * print local\n    * def user = shadowed\n    * print user\n",
+            encoding="utf-8"
+        )
+        runner = PyRateRunner()
+        runner.global_vars['level'] = 'run'
+
+        runner.execute_file(str(feature), report=False)
+
+        assert self._prints(runner) == ["x-ana/env/run", "local", "shadowed", "x-bob/env/run", "local", "shadowed"]
+        assert runner.global_vars == {'level': 'run'}
+        assert 'X-Trace' not in runner.base_context['headers']
+
+    def test_scenario_context_shares_lower_layers(self):
+        """Creating a context stacks the row on the shared layers without copying them."""
+        runner = PyRateRunner()
+        row = {'user': 'ana'}
+
+        context = runner._new_scenario_context(row)
+        context['vars']['token'] = 'abc'
+
+        assert context['vars'].maps[1] is row and context['vars'].maps[2] is runner.global_vars
+        assert context['vars']['user'] == 'ana' and row == {'user': 'ana'}
+        assert 'token' not in runner.base_context['vars']
@@ -0,0 +1,65 @@
+"""
+Tests for #(name) variable interpolation.
+"""
+import pickle
+from pyrate.template import Template, compile_template
+from pyrate.plan import compile_steps
+
+
+class TestTemplateRender:
+    """Test placeholder substitution."""
+
+    def test_single_placeholder(self):
+        """Placeholders are replaced by their values."""
+        template = Template("Given url '#(BASE_URL)'")
+        assert template.render({"BASE_URL": "https://api.example.com"}) == "Given url 'https://api.example.com'"
+
+    def test_multiple_placeholders(self):
+        """Each placeholder is resolved, including repeated names."""
+        template = Template("And input '#(field)' '#(user)-#(user)'")
+        assert template.render({"field": "#name", "user": "ana"}) == "And input '#name' 'ana-ana'"
+
+    def test_missing_variable_kept(self):
+        """Unknown variables leave the placeholder untouched."""
+        assert Template("print '#(missing)'").render({}) == "print '#(missing)'"
+
+    def test_none_value_kept(self):
+        """None values leave the placeholder untouched."""
+        assert Template("print '#(token)'").render({"token": None}) == "print '#(token)'"
+
+    def test_non_string_values(self):
+        """Values are converted with str()."""
+        assert Template("path 'users/#(id)'").render({"id": 7}) == "path 'users/7'"
+
+    def test_line_without_placeholders(self):
+        """Lines without placeholders are returned as-is."""
+        template = Template("When method get")
+        assert template.names == ()
+        assert template.render({"a": 1}) == "When method get"
+
+    def test_css_id_selector_is_not_placeholder(self):
+        """'#id' selectors are plain text."""
+        assert Template("And click '#login'").render({"login": "x"}) == "And click '#login'"
+
+    def test_values_not_rescanned(self):
+        """Substituted values are not interpolated again."""
+        template = Template("print '#(a)'")
+        assert template.render({"a": "#(b)", "b": "x"}) == "print '#(b)'"
+
+
+class TestTemplateCaching:
+    """Test template reuse."""
+
+    def test_compile_template_is_cached(self):
+        """Identical lines share a Template."""
+        assert compile_template("Given url '#(X)'") is compile_template("Given url '#(X)'")
+
+    def test_plan_steps_carry_template(self):
+        """Compiled steps keep their tokenized template."""
+        step, = compile_steps(["And path '#(resource)'"])
+        assert step.template.names == ("resource",)
+
+    def test_template_pickles(self):
+        """Templates survive the on-disk plan cache."""
+        template = pickle.loads(pickle.dumps(Template("print '#(a)'")))
+        assert template.render({"a": 1}) == "print '1'"